@@ -10,12 +10,18 @@ from constants import settings
 from infrastructure.database.repositories.documents.documents_repository import DocumentsRepository
 from infrastructure.database.repositories.knowledge_base.knowledge_base_repository import KnowledgeBaseRepository
 from infrastructure.database.repositories.chat.chat_repository import ChatRepository
+from infrastructure.services.retrieval import lexical_index, vector_index
+from infrastructure.services.genai import semantic_answer_cache
+from infrastructure.services.ingestion import ingestion_events, ingestion_queue
 
 # Casos de uso de documentos
 from usecases.documents.get_documents_by_user import GetDocumentsByUserUseCase
 from usecases.documents.upload_document import UploadDocumentUseCase
 from usecases.documents.delete_document import DeleteDocumentUseCase
 from usecases.documents.update_document import UpdateDocumentUseCase
+from usecases.documents.process_document import ProcessDocumentUseCase
+from usecases.documents.get_ingestion_job import GetIngestionJobUseCase
+from usecases.documents.stream_ingestion_events import StreamIngestionEventsUseCase
 
 # Casos de uso de knowledge base
 from usecases.knowledge_base.get_documents_from_knowledge_base import GetDocumentsFromKnowledgeBaseUseCase
@@ -23,6 +29,7 @@ from usecases.knowledge_base.get_all_knowledge_base import GetAllKnowledgeBaseUs
 from usecases.knowledge_base.create_knowledge_base import CreateKnowledgeBaseUseCase
 from usecases.knowledge_base.delete_knowledge_base import DeleteKnowledgeBaseUseCase
 from usecases.knowledge_base.massive_knowledge_configuration import MassiveKnowledgeConfigurationUseCase
+from usecases.knowledge_base.get_configuration_job import GetConfigurationJobUseCase
 from usecases.knowledge_base.get_knowledge_base import GetKnowledgeBaseUseCase
 
 # Casos de uso de chat
@@ -122,7 +129,29 @@ def get_upload_document_usecase():
     Factory para el caso de uso de subir un documento
     """
     repository = get_documents_repository()
-    return UploadDocumentUseCase(repository)
+    return UploadDocumentUseCase(repository, ingestion_queue)
+
+
+def get_process_document_usecase():
+    """
+    Factory para el caso de uso de procesar un documento en segundo plano
+    """
+    repository = get_documents_repository()
+    return ProcessDocumentUseCase(repository)
+
+
+def get_ingestion_job_usecase():
+    """
+    Factory para el caso de uso de consultar un trabajo de ingesta
+    """
+    return GetIngestionJobUseCase()
+
+
+def get_stream_ingestion_events_usecase():
+    """
+    Factory para el caso de uso de seguir por SSE la ingesta de un documento
+    """
+    return StreamIngestionEventsUseCase(ingestion_events)
 
 
 def get_delete_document_usecase():
@@ -190,6 +219,13 @@ def get_massive_knowledge_configuration_usecase():
     return MassiveKnowledgeConfigurationUseCase(repository, update_document_usecase)
 
 
+def get_configuration_job_usecase():
+    """
+    Factory para el caso de uso de consultar una configuración masiva
+    """
+    return GetConfigurationJobUseCase()
+
+
 def get_knowledge_base_usecase():
     """
     Factory para el caso de uso de obtener una base de conocimiento
@@ -203,7 +239,7 @@ def get_chat_repository():
     """
     Factory para el repositorio de chat
     """
-    return ChatRepository()
+    return ChatRepository(vector_index, lexical_index)
 
 
 def get_relevant_documents_usecase():
@@ -251,7 +287,8 @@ def get_chat_response_usecase():
     Factory para el caso de uso de generar una respuesta de chat
     """
     relevant_docs_usecase = get_relevant_documents_usecase()
-    return GetChatResponseUseCase(relevant_docs_usecase)
+    answer_cache = semantic_answer_cache if settings.ANSWER_CACHE_ENABLED else None
+    return GetChatResponseUseCase(relevant_docs_usecase, answer_cache)
 
 
 def get_download_chat_usecase():
@@ -17,6 +17,8 @@ from pydantic import BaseModel
 
 from slowapi.util import get_remote_address
 
+from infrastructure.services.genai import query_embedding_cache
+
 from app.api.dependencies import (
     get_save_chat_session_usecase,
     get_user_chat_sessions_usecase,
@@ -70,7 +72,11 @@ async def get_chat_response(
         user_email, _ = user_data
 
         # Delegar la lógica al caso de uso
-        response_stream = chat_response_usecase.execute(chat_id=app_chat_history.chatId, messages=app_chat_history.messages)
+        response_stream = chat_response_usecase.execute(
+            chat_id=app_chat_history.chatId,
+            messages=app_chat_history.messages,
+            filters=app_chat_history.filters,
+        )
 
         return StreamingResponse(
             response_stream,
@@ -101,6 +107,15 @@ async def get_chat_requests(request: Request):
         raise HTTPException(status_code=500, detail="Error al obtener las solicitudes de chat")
 
 
+@chat_router.get("/embedding-cache")
+async def get_embedding_cache_stats(user_data: tuple = Depends(get_current_user_and_token)):
+    """
+    Contadores de la caché de embeddings de consultas de esta réplica (aciertos en memoria,
+    aciertos en Redis y fallos), para medir cuántas llamadas a la API de embeddings se ahorran.
+    """
+    return query_embedding_cache.stats()
+
+
 @chat_router.post("/save-chat")
 async def save_chat(
     request: Request,
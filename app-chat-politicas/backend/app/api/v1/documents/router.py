@@ -5,6 +5,7 @@ from typing import Tuple
 
 from constants import settings, openai_client
 from fastapi import APIRouter, HTTPException, Path, Depends
+from fastapi.responses import StreamingResponse
 from litellm import acompletion
 from domain.documents.entities.body import DocumentCreationForm, DocumentUpdate
 from domain.documents.entities.documents import (
@@ -13,7 +14,8 @@ from domain.documents.entities.documents import (
     DocumentStatusItem,
     KnowledgeBase,
 )
-from domain.documents.entities.responses import DeleteDocumentResponse, DocumentsByUserResponse
+from domain.documents.entities.responses import DeleteDocumentResponse, DocumentsByUserResponse, UploadDocumentResponse
+from domain.ingestion.entities.ingestion_job import IngestionJobView
 from openai import AsyncOpenAI
 from middlewares.auth import get_current_user_and_token
 from app.api.dependencies import (
@@ -22,11 +24,15 @@ from app.api.dependencies import (
     get_upload_document_usecase,
     get_delete_document_usecase,
     get_update_document_usecase,
+    get_ingestion_job_usecase,
+    get_stream_ingestion_events_usecase,
 )
 from usecases.documents.get_documents_by_user import GetDocumentsByUserUseCase
 from usecases.documents.upload_document import UploadDocumentUseCase
 from usecases.documents.delete_document import DeleteDocumentUseCase
 from usecases.documents.update_document import UpdateDocumentUseCase
+from usecases.documents.get_ingestion_job import GetIngestionJobUseCase
+from usecases.documents.stream_ingestion_events import StreamIngestionEventsUseCase
 
 documents_router = APIRouter(tags=["Documents"])
 
@@ -40,7 +46,7 @@ async def get_all_documents_by_user(
     return await documents_usecase.execute(employee_decode)
 
 
-@documents_router.post("/upload-document", response_model=DocumentKnowledge)
+@documents_router.post("/upload-document", response_model=UploadDocumentResponse, status_code=202)
 async def upload_document(
     document: DocumentCreationForm,
     user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
@@ -50,6 +56,41 @@ async def upload_document(
     return await upload_document_usecase.execute(document, current_user_email)
 
 
+@documents_router.get("/ingestion-jobs/{job_id}", response_model=IngestionJobView)
+async def get_ingestion_job(
+    job_id: str = Path(
+        ...,
+        description="ID del trabajo de ingesta retornado al subir el documento.",
+        min_length=2,
+        example="JOB-IA-XXXXXXXX",
+    ),
+    user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
+    ingestion_job_usecase: GetIngestionJobUseCase = Depends(get_ingestion_job_usecase),
+):
+    current_user_email = user_and_token[0]
+    return await ingestion_job_usecase.execute(job_id, current_user_email)
+
+
+@documents_router.get("/{document_id}/ingest-events")
+async def stream_ingestion_events(
+    document_id: str = Path(
+        ...,
+        description="ID único del documento.",
+        min_length=2,
+        example="DOC-IA-XXXXXXXX",
+    ),
+    user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
+    stream_ingestion_events_usecase: StreamIngestionEventsUseCase = Depends(get_stream_ingestion_events_usecase),
+):
+    current_user_email = user_and_token[0]
+    response_stream = await stream_ingestion_events_usecase.execute(document_id, current_user_email)
+    return StreamingResponse(
+        response_stream,
+        media_type="text/event-stream",
+        headers={'nosniff': 'no', "Connection": "keep-alive"},
+    )
+
+
 @documents_router.delete("/{document_id}", response_model=DeleteDocumentResponse)
 async def delete_document(
     document_id: str = Path(
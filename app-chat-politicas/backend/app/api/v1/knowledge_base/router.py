@@ -8,7 +8,7 @@ from domain.documents.entities.responses import (
     DocumentResponse,
     KnowledgeNotAccess,
     KnowledgeNotFound,
-    MassiveConfResponse,
+    MassiveConfigurationJobResponse,
 )
 from domain.documents.entities.body import (
     DocumentUpdate,
@@ -28,12 +28,15 @@ from app.api.dependencies import (
     get_create_knowledge_base_usecase,
     get_delete_knowledge_base_usecase,
     get_massive_knowledge_configuration_usecase,
+    get_configuration_job_usecase,
 )
 from usecases.knowledge_base.get_documents_from_knowledge_base import GetDocumentsFromKnowledgeBaseUseCase
 from usecases.knowledge_base.get_all_knowledge_base import GetAllKnowledgeBaseUseCase
 from usecases.knowledge_base.create_knowledge_base import CreateKnowledgeBaseUseCase
 from usecases.knowledge_base.delete_knowledge_base import DeleteKnowledgeBaseUseCase
 from usecases.knowledge_base.massive_knowledge_configuration import MassiveKnowledgeConfigurationUseCase
+from usecases.knowledge_base.get_configuration_job import GetConfigurationJobUseCase
+from domain.knowledge_base.entities.configuration_job import ConfigurationJobView
 
 knowledge_base_router = APIRouter(tags=["Knowledge Base"])
 
@@ -98,7 +101,7 @@ async def create_knowledge_base(
     return await knowledge_base_usecase.execute(knowledge_base, user_and_token[0])
 
 
-@knowledge_base_router.post("/massive-knowledge-configuration", response_model=MassiveConfResponse)
+@knowledge_base_router.post("/massive-knowledge-configuration", response_model=MassiveConfigurationJobResponse, status_code=202)
 async def massive_knowledge_configuration(
     knowledge_conf: KnowledgeMassiveConfiguration,
     user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
@@ -108,6 +111,21 @@ async def massive_knowledge_configuration(
     return await knowledge_base_usecase.execute(knowledge_conf, user_email)
 
 
+@knowledge_base_router.get("/massive-knowledge-configuration/{job_id}", response_model=ConfigurationJobView)
+async def get_configuration_job(
+    job_id: str = Path(
+        ...,
+        description="ID del trabajo retornado al iniciar la configuración masiva.",
+        min_length=2,
+        example="CONF-IA-XXXXXXXX",
+    ),
+    user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
+    configuration_job_usecase: GetConfigurationJobUseCase = Depends(get_configuration_job_usecase),
+):
+    user_email = user_and_token[0]
+    return await configuration_job_usecase.execute(job_id, user_email)
+
+
 @knowledge_base_router.delete("/{knowledge_id}", response_model=KnowledgeBase)
 async def delete_knowledge_base(
     knowledge_id: str = Path(
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException, Depends
+from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, Response
 from typing import Tuple
 
 from domain.utilities.entities.documents import ExtractTextFromDocumentResponse
@@ -14,6 +14,7 @@ utilities_repository = UtilitiesRepository()
 
 @utilities_router.post("/extract-text-from-document", response_model=ExtractTextFromDocumentResponse)
 async def extract_text_from_document(
+    response: Response,
     file: UploadFile = File(..., media_type="application/pdf"),
     user_and_token: Tuple[str, str] = Depends(get_current_user_and_token),
 ):
@@ -21,6 +22,7 @@ async def extract_text_from_document(
     Extrae texto de un documento PDF.
 
     Args:
+        response: Respuesta HTTP, donde se informa la duración de cada fase en la cabecera Server-Timing
         file: Archivo PDF del cual extraer el texto
         user_and_token: Tupla (email, token) del usuario autenticado
 
@@ -32,7 +34,11 @@ async def extract_text_from_document(
         extract_text_use_case = ExtractTextFromDocumentUseCase(utilities_repository)
 
         # Ejecutar el caso de uso
-        return await extract_text_use_case.execute(file)
+        result = await extract_text_use_case.execute(file)
+
+        # Duración de cada fase (lectura, subida, extracción y total) en milisegundos
+        response.headers["Server-Timing"] = ", ".join(f"{phase};dur={seconds * 1000:.1f}" for phase, seconds in result.timings.items())
+        return result
     except HTTPException as e:
         # Re-lanzar la excepción si proviene del caso de uso
         raise e
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,6 +8,12 @@ from slowapi.middleware import SlowAPIMiddleware
 
 # Usar la nueva inicialización de la base de datos
 from infrastructure.database.init_db import init_db
+from infrastructure.services.retrieval import lexical_index, vector_index
+from infrastructure.services.genai import semantic_answer_cache
+from infrastructure.services.ingestion import ingestion_workers
+from infrastructure.services.extraction import pdf_extraction_pool
+from infrastructure.services.storage import storage_backend
+from app.api.dependencies import get_massive_knowledge_configuration_usecase, get_process_document_usecase
 
 from middlewares.rate_limit import check_request_limit, limiter, rate_limit_handler
 from app.api.v1.chat.router import chat_router
@@ -14,13 +22,48 @@ from app.api.v1.knowledge_base.router import knowledge_base_router
 from app.api.v1.app_config.router import app_config_router
 from app.api.v1.utilities.router import utilities_router
 from constants import settings
+from utils.embeddings import get_encoding
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Se inicializa la conexión a Mongo cuando se levanta el API
     await init_db()
+    # El tokenizador descarga su vocabulario la primera vez: se carga en un hilo para no bloquear el event loop
+    await asyncio.to_thread(get_encoding)
+    # Pool de conexiones al almacenamiento de archivos, compartido por todas las solicitudes
+    await storage_backend.start()
+    # Se cargan en memoria los índices vectorial y léxico utilizados por el chat
+    await vector_index.load()
+    await lexical_index.load()
+    # Sincronización periódica de los índices con los cambios hechos por otras réplicas
+    index_maintenance = [
+        asyncio.create_task(vector_index.run_maintenance(settings.VECTOR_INDEX_SYNC_INTERVAL, settings.VECTOR_INDEX_FULL_SYNC_INTERVAL)),
+        asyncio.create_task(lexical_index.run_maintenance(settings.VECTOR_INDEX_SYNC_INTERVAL, settings.VECTOR_INDEX_FULL_SYNC_INTERVAL)),
+    ]
+    # Caché semántica de respuestas del chat
+    if settings.ANSWER_CACHE_ENABLED:
+        await semantic_answer_cache.load()
+        index_maintenance.append(asyncio.create_task(semantic_answer_cache.run_maintenance(settings.ANSWER_CACHE_SYNC_INTERVAL)))
+    # Trabajadores que procesan en segundo plano los documentos subidos
+    await ingestion_workers.start(get_process_document_usecase().execute)
+    # Configuraciones masivas interrumpidas por un reinicio
+    massive_configuration = get_massive_knowledge_configuration_usecase()
+    await massive_configuration.resume()
+    massive_configuration.start_recovery(settings.INGESTION_RECOVERY_INTERVAL)
+    # Procesos que extraen el texto de los PDF fuera del event loop
+    pdf_extraction_pool.start()
     yield
+    pdf_extraction_pool.close()
+    await massive_configuration.stop()
+    await ingestion_workers.stop()
+    for task in index_maintenance:
+        task.cancel()
+    # Se espera a que terminen para que ninguna sincronización siga usando los índices después de cerrarlos
+    await asyncio.gather(*index_maintenance, return_exceptions=True)
+    vector_index.close()
+    lexical_index.close()
+    await storage_backend.close()
 
 
 app = FastAPI(
@@ -37,6 +80,8 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    # Permite que el frontend lea la duración de cada fase informada por los endpoints
+    expose_headers=["Server-Timing"],
 )
 
 # Configurar rate limiting
@@ -0,0 +1,86 @@
+"""
+Compara la extracción de texto de un PDF grande con un solo proceso contra la extracción repartida por páginas
+entre varios procesos (PdfExtractionPool).
+
+Uso (desde la carpeta backend):
+    python -m benchmarks.pdf_extraction --pages 600 --workers 4 --repeat 3
+
+Genera un PDF sintético con páginas de texto denso. Los procesos se inician antes de medir, de modo que el
+tiempo reportado es solo el de la extracción. Reporta la latencia media, el throughput en páginas por segundo
+y verifica que el texto y los offsets de página coincidan con los de un solo proceso.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import fitz
+
+from infrastructure.services.extraction.pool import PdfExtractionPool
+
+WORDS = "política procedimiento colaborador beneficio vacaciones reembolso viático aprobación gerencia cliente auditoría".split()
+
+
+def build_pdf(path: str, pages: int, lines: int, seed: int):
+    rng = random.Random(seed)
+    pdf_document = fitz.open()
+    for page_number in range(pages):
+        page = pdf_document.new_page()
+        text = "\n".join(" ".join(rng.choices(WORDS, k=10)) for _ in range(lines))
+        free_space = page.insert_textbox(
+            fitz.Rect(36, 36, page.rect.width - 36, page.rect.height - 36), f"Página {page_number + 1}\n{text}", fontsize=8
+        )
+        # PyMuPDF no inserta nada si el texto no cabe en la página
+        if free_space < 0:
+            raise ValueError("El texto no cabe en la página: reduzca --lines")
+    pdf_document.save(path)
+    pdf_document.close()
+
+
+async def measure(path: str, workers: int, shard_pages: int, repeat: int):
+    pool = PdfExtractionPool(workers=workers, timeout=600, max_pages=100000, max_tasks_per_child=None, shard_pages=shard_pages)
+    try:
+        # La primera extracción inicia los procesos y no se mide
+        extracted = await pool.extract_text(path)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await pool.extract_text(path)
+        return extracted, (time.perf_counter() - start) / repeat
+    finally:
+        pool.close()
+
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "synthetic.pdf")
+        build_pdf(path, args.pages, args.lines, args.seed)
+        size = os.path.getsize(path)
+
+        # Con shard_pages mayor que el documento todo se extrae en un solo proceso
+        single, single_seconds = await measure(path, 1, args.pages + 1, args.repeat)
+        sharded, sharded_seconds = await measure(path, args.workers, args.shard_pages, args.repeat)
+
+    print(f"PDF: {args.pages} páginas, {size / 2**20:.1f} MiB, {len(single.text)} caracteres")
+    print(f"1 proceso: {single_seconds:.2f} s ({args.pages / single_seconds:.0f} páginas/s)")
+    print(
+        f"{args.workers} procesos: {sharded_seconds:.2f} s ({args.pages / sharded_seconds:.0f} páginas/s), aceleración {single_seconds / sharded_seconds:.2f}x"
+    )
+    print(f"Texto y offsets idénticos: {single == sharded}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extracción de PDF en un proceso contra extracción repartida por páginas")
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--shard-pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
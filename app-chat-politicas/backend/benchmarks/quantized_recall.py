@@ -0,0 +1,81 @@
+"""
+Compara la búsqueda del índice int8 (QuantizedVectorIndex) contra la búsqueda exacta float32 (InMemoryVectorIndex).
+
+Uso (desde la carpeta backend):
+    python -m benchmarks.quantized_recall --chunks 20000 --queries 200 --top-k 5 --rerank 300
+
+Genera un corpus sintético agrupado en temas (los embeddings reales se concentran en pocas direcciones, lo que
+hace más difícil separar vecinos que con vectores uniformes) y consultas cercanas a chunks del corpus.
+Reporta recall@k respecto de la búsqueda exacta, latencia media y memoria ocupada por cada índice.
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from bson import ObjectId
+
+from domain.documents.entities.document import LineOfService, ProfilesAllowed
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes
+from infrastructure.services.retrieval.quantized_index import QuantizedVectorIndex
+from infrastructure.services.retrieval.vector_index import InMemoryVectorIndex
+
+
+def build_corpus(chunks: int, dimension: int, topics: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.standard_normal((topics, dimension)).astype(np.float32)
+    assignment = rng.integers(0, topics, chunks)
+    return centers[assignment] + 0.6 * rng.standard_normal((chunks, dimension)).astype(np.float32)
+
+
+def timed_search(index, queries: np.ndarray, top_k: int) -> tuple[list[list[str]], float]:
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append([hit.chunkId for hit in index.search(query, top_k, threshold=-1.0)])
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recall@k del índice int8 contra la búsqueda exacta")
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--topics", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--rerank", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    corpus = build_corpus(args.chunks, args.dimension, args.topics, rng)
+    sources = rng.integers(0, args.chunks, args.queries)
+    queries = corpus[sources] + 0.8 * rng.standard_normal((args.queries, args.dimension)).astype(np.float32)
+
+    attributes = ChunkFilterAttributes(knowledgeBaseId=str(ObjectId()), los=[LineOfService.xLoS], profiles=[ProfilesAllowed.Socio])
+    rows = [(str(position), f"document-{position // 20}", vector, attributes) for position, vector in enumerate(corpus)]
+
+    exact = InMemoryVectorIndex()
+    exact.add_many(rows)
+
+    with tempfile.TemporaryDirectory() as path:
+        quantized = QuantizedVectorIndex(path=path, rerank_candidates=args.rerank)
+        quantized.add_many(rows)
+
+        expected, exact_ms = timed_search(exact, queries, args.top_k)
+        found, quantized_ms = timed_search(quantized, queries, args.top_k)
+        memory = quantized.memory_usage()
+
+    recall = np.mean([len(set(a) & set(b)) / len(a) for a, b in zip(expected, found)])
+    exact_bytes = exact._matrix[: len(exact)].nbytes
+
+    print(f"Corpus: {args.chunks} chunks de dimensión {args.dimension}, {args.queries} consultas, top-k {args.top_k}, re-puntuación {args.rerank}")
+    print(f"Recall@{args.top_k}: {recall:.4f}")
+    print(f"Latencia media: exacto {exact_ms:.2f} ms, int8 {quantized_ms:.2f} ms")
+    print(
+        f"Memoria residente: exacto {exact_bytes / 2**20:.1f} MiB, int8 {memory['quantizedBytes'] / 2**20:.1f} MiB (float32 en memmap: {memory['memoryMapped']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -54,3 +54,98 @@ class Settings(BaseSettings):
     MODEL_CHAT_COMPLETION: str = os.getenv("MODEL_CHAT_COMPLETION")
 
     DEFAULT_MODEL_ARGS: dict = {"temperature": 0.2, "top_p": 0.9, "n": 1}
+    # Modelo que genera el resumen y los metadatos de los documentos, y tamaño de la caché en memoria de sus respuestas
+    SUMMARY_MODEL: str = os.getenv("SUMMARY_MODEL", "azure.gpt-4o-mini")
+    SUMMARY_CACHE_SIZE: int = int(os.getenv("SUMMARY_CACHE_SIZE", 1024))
+
+    # Retrieval (RAG)
+    RETRIEVAL_TOP_K: int = int(os.getenv("RETRIEVAL_TOP_K", 5))
+    RETRIEVAL_SIMILARITY_THRESHOLD: float = float(os.getenv("RETRIEVAL_SIMILARITY_THRESHOLD", 0.3))
+
+    # Motor del índice vectorial: "memory" (búsqueda exacta), "int8" (primera pasada cuantizada y re-puntuación
+    # exacta de los mejores candidatos) o "hnsw" (aproximada, persistida en disco)
+    VECTOR_INDEX_ENGINE: str = os.getenv("VECTOR_INDEX_ENGINE", "memory")
+    VECTOR_INDEX_PATH: str = os.getenv("VECTOR_INDEX_PATH", "./data/vector_index")
+    VECTOR_INDEX_SYNC_INTERVAL: int = int(os.getenv("VECTOR_INDEX_SYNC_INTERVAL", 60))
+    # Segundos entre sincronizaciones completas de los índices (las periódicas solo leen los cambios); 0 las desactiva
+    VECTOR_INDEX_FULL_SYNC_INTERVAL: int = int(os.getenv("VECTOR_INDEX_FULL_SYNC_INTERVAL", 86400))
+    HNSW_M: int = int(os.getenv("HNSW_M", 16))
+    HNSW_EF_CONSTRUCTION: int = int(os.getenv("HNSW_EF_CONSTRUCTION", 200))
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", 64))
+    QUANTIZED_RERANK_CANDIDATES: int = int(os.getenv("QUANTIZED_RERANK_CANDIDATES", 300))
+
+    # Formato en que se guardan los embeddings nuevos en Mongo: "list" (arreglo de doubles), "float32",
+    # "float16" o "int8" (binario empaquetado). Los existentes se convierten con
+    # `python -m infrastructure.database.mongodb.migrations.convert_embeddings`
+    EMBEDDING_STORAGE_FORMAT: str = os.getenv("EMBEDDING_STORAGE_FORMAT", "list")
+
+    # Generación de embeddings de documentos: los chunks se envían en lotes acotados por cantidad y por tokens,
+    # con un máximo de lotes en paralelo
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", 64))
+    EMBEDDING_BATCH_MAX_TOKENS: int = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", 100000))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", 4))
+    EMBEDDING_TOKENIZER_ENCODING: str = os.getenv("EMBEDDING_TOKENIZER_ENCODING", "cl100k_base")
+
+    # Tamaño de los chunks de documentos en tokens y tokens del chunk anterior que se repiten al inicio del siguiente
+    CHUNK_TARGET_TOKENS: int = int(os.getenv("CHUNK_TARGET_TOKENS", 800))
+    CHUNK_OVERLAP_TOKENS: int = int(os.getenv("CHUNK_OVERLAP_TOKENS", 100))
+
+    # Modo de búsqueda: "vector" (solo embeddings), "hybrid" (BM25 + embeddings fusionados con RRF)
+    # o "lexical_prefilter" (BM25 preselecciona los candidatos que luego se puntúan con embeddings)
+    RETRIEVAL_MODE: str = os.getenv("RETRIEVAL_MODE", "vector")
+    # Similitud mínima de los chunks que solo encuentra BM25 en el modo "hybrid"; puede ser menor que
+    # RETRIEVAL_SIMILARITY_THRESHOLD porque la coincidencia de palabras clave ya los respalda
+    RETRIEVAL_LEXICAL_SIMILARITY_FLOOR: float = float(os.getenv("RETRIEVAL_LEXICAL_SIMILARITY_FLOOR", 0.2))
+    RETRIEVAL_CANDIDATES: int = int(os.getenv("RETRIEVAL_CANDIDATES", 100))
+    RETRIEVAL_RRF_K: int = int(os.getenv("RETRIEVAL_RRF_K", 60))
+    BM25_K1: float = float(os.getenv("BM25_K1", 1.2))
+    BM25_B: float = float(os.getenv("BM25_B", 0.75))
+
+    # Caché de embeddings de consultas: L1 en memoria (LRU con TTL) y L2 en Redis
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", 2048))
+    EMBEDDING_CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL", 3600))
+    EMBEDDING_CACHE_REDIS_TTL: int = int(os.getenv("EMBEDDING_CACHE_REDIS_TTL", 604800))  # 7 días por defecto
+
+    # Ingesta de documentos en segundo plano: cola "redis" (compartida entre réplicas) o "memory" (en el proceso)
+    INGESTION_QUEUE_BACKEND: str = os.getenv("INGESTION_QUEUE_BACKEND", "redis")
+    INGESTION_QUEUE_KEY: str = os.getenv("INGESTION_QUEUE_KEY", "ingestion:jobs")
+    INGESTION_WORKERS: int = int(os.getenv("INGESTION_WORKERS", 2))
+    INGESTION_MAX_ATTEMPTS: int = int(os.getenv("INGESTION_MAX_ATTEMPTS", 3))
+    INGESTION_RETRY_BACKOFF: int = int(os.getenv("INGESTION_RETRY_BACKOFF", 10))
+    # Segundos sin avances tras los cuales un trabajo en curso se considera abandonado y se vuelve a encolar
+    INGESTION_STALE_AFTER: int = int(os.getenv("INGESTION_STALE_AFTER", 1800))
+    # Segundos entre revisiones de trabajos abandonados (ingesta y configuración masiva)
+    INGESTION_RECOVERY_INTERVAL: int = int(os.getenv("INGESTION_RECOVERY_INTERVAL", 60))
+    # Eventos de avance de la ingesta (SSE): prefijo de los canales pub/sub y segundos entre consultas de estado sin eventos
+    INGESTION_EVENTS_CHANNEL: str = os.getenv("INGESTION_EVENTS_CHANNEL", "ingestion:events")
+    INGESTION_EVENTS_HEARTBEAT: int = int(os.getenv("INGESTION_EVENTS_HEARTBEAT", 15))
+    # Documentos que la configuración masiva de una base de conocimiento actualiza en paralelo
+    MASSIVE_CONFIGURATION_CONCURRENCY: int = int(os.getenv("MASSIVE_CONFIGURATION_CONCURRENCY", 8))
+    # Bases de conocimiento con más documentos que este límite se eliminan en segundo plano
+    KNOWLEDGE_BASE_DELETE_BACKGROUND_THRESHOLD: int = int(os.getenv("KNOWLEDGE_BASE_DELETE_BACKGROUND_THRESHOLD", 50))
+    # Archivos que se eliminan en paralelo del almacenamiento
+    BLOB_DELETE_CONCURRENCY: int = int(os.getenv("BLOB_DELETE_CONCURRENCY", 16))
+    # Almacenamiento de archivos: "azure" (Blob Storage) o "local" (carpeta LOCAL_STORAGE_PATH, para desarrollo y pruebas)
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "azure")
+    LOCAL_STORAGE_PATH: str = os.getenv("LOCAL_STORAGE_PATH", "storage")
+    # Subida de archivos por bloques: tamaño de cada bloque en bytes y bloques en vuelo por archivo
+    BLOB_UPLOAD_BLOCK_SIZE: int = int(os.getenv("BLOB_UPLOAD_BLOCK_SIZE", 4 * 1024 * 1024))
+    BLOB_UPLOAD_CONCURRENCY: int = int(os.getenv("BLOB_UPLOAD_CONCURRENCY", 4))
+    # Conexiones simultáneas del pool compartido de Blob Storage y segundos de validez de las URL firmadas (SAS)
+    BLOB_MAX_CONNECTIONS: int = int(os.getenv("BLOB_MAX_CONNECTIONS", 64))
+    BLOB_SAS_EXPIRY: int = int(os.getenv("BLOB_SAS_EXPIRY", 24 * 60 * 60))
+
+    # Extracción de texto de PDF en procesos separados del event loop
+    PDF_EXTRACTION_WORKERS: int = int(os.getenv("PDF_EXTRACTION_WORKERS", 2))
+    PDF_EXTRACTION_TIMEOUT: int = int(os.getenv("PDF_EXTRACTION_TIMEOUT", 120))
+    PDF_EXTRACTION_MAX_TASKS_PER_CHILD: int = int(os.getenv("PDF_EXTRACTION_MAX_TASKS_PER_CHILD", 50))
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", 2000))
+    # Páginas mínimas por proceso al repartir la extracción de un PDF grande
+    PDF_EXTRACTION_SHARD_PAGES: int = int(os.getenv("PDF_EXTRACTION_SHARD_PAGES", 50))
+
+    # Caché semántica de respuestas para preguntas de un solo turno
+    ANSWER_CACHE_ENABLED: bool = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", 0.95))
+    ANSWER_CACHE_TTL: int = int(os.getenv("ANSWER_CACHE_TTL", 604800))  # 7 días por defecto
+    ANSWER_CACHE_MAX_ENTRIES: int = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", 5000))
+    ANSWER_CACHE_SYNC_INTERVAL: int = int(os.getenv("ANSWER_CACHE_SYNC_INTERVAL", 60))
@@ -1,8 +1,10 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from beanie import Document
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
 
+from domain.embeddings.entities.embeddings import RetrievalFilters
+
 
 class ChatHistory(Document):
     """Modelo para el historial de chat"""
@@ -51,6 +53,31 @@ class ChatSession(Document):
         return await super().save(*args, **kwargs)
 
 
+class CachedAnswer(Document):
+    """Modelo para una respuesta almacenada en la caché semántica del chat"""
+
+    question: str
+    embedding: List[float]
+    filtersKey: str = ""
+    documentIds: List[str] = []
+    references: List[Dict[str, Any]] = []
+    answer: str
+    createdAt: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "SemanticAnswerCache"
+
+
+class CachedAnswerIndexView(BaseModel):
+    """Proyección de una respuesta en caché con los datos necesarios para buscarla por similitud"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    embedding: List[float]
+    filtersKey: str
+    documentIds: List[str]
+    createdAt: datetime
+
+
 class UserChatsView(BaseModel):
     """
     Vista de chats de usuario categorizados por tiempo
@@ -102,6 +129,7 @@ class AppChatMessages(BaseModel):
 
     chatId: str
     messages: List[ChatMessage]
+    filters: Optional[RetrievalFilters] = None
 
 
 class SaveChatRequest(BaseModel):
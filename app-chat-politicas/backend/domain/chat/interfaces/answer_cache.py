@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+from domain.chat.entities.chat import CachedAnswer
+from domain.embeddings.entities.embeddings import RetrievalFilters
+
+
+class AnswerCacheInterface(ABC):
+    """Interfaz para la caché semántica de respuestas del chat"""
+
+    @abstractmethod
+    async def lookup(self, query_embedding: list[float], filters: Optional[RetrievalFilters] = None) -> Optional[CachedAnswer]:
+        """
+        Busca una respuesta en caché para una pregunta suficientemente similar, cuyos documentos citados
+        no hayan cambiado desde que se generó.
+
+        Args:
+            query_embedding: Embedding de la pregunta
+            filters: Filtros de búsqueda con que se hizo la pregunta
+
+        Returns:
+            La respuesta en caché o None si no hay una vigente
+        """
+        pass
+
+    @abstractmethod
+    async def store(
+        self, question: str, query_embedding: list[float], filters: Optional[RetrievalFilters], relevant_docs: List[dict], answer: str
+    ) -> CachedAnswer:
+        """
+        Guarda una respuesta generada junto a los documentos que cita.
+
+        Args:
+            question: Pregunta del usuario
+            query_embedding: Embedding de la pregunta
+            filters: Filtros de búsqueda con que se hizo la pregunta
+            relevant_docs: Documentos relevantes usados como contexto
+            answer: Respuesta completa entregada al usuario
+
+        Returns:
+            La entrada guardada
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate_documents(self, document_ids: Iterable[str]) -> int:
+        """
+        Elimina las respuestas que citan alguno de los documentos indicados.
+
+        Args:
+            document_ids: Ids (ObjectId) de los documentos modificados o eliminados
+
+        Returns:
+            Cantidad de respuestas eliminadas de esta réplica
+        """
+        pass
@@ -3,6 +3,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from domain.chat.entities.chat import ChatHistory, ChatSession, UserChatsView
+from domain.embeddings.entities.embeddings import RetrievalFilters
 
 
 class ChatRepositoryInterface(ABC):
@@ -22,12 +23,13 @@ class ChatRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_relevant_documents(self, query: str) -> list:
+    async def get_relevant_documents(self, query: str, filters: Optional[RetrievalFilters] = None) -> list:
         """
         Obtiene los documentos más relevantes basados en la consulta del usuario.
 
         Args:
             query: La consulta del usuario en texto plano
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
 
         Returns:
             Una lista de documentos relevantes con su contenido
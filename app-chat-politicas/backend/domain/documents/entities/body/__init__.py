@@ -33,6 +33,8 @@ class DocumentCreationForm(BaseModel):
     documentUrl: str = Body(..., min_length=2)
     documentUniqueName: str = Body(..., min_length=2)
     content: str = Body(..., min_length=2)
+    # Posición en `content` donde comienza cada página, tal como la informa la extracción del texto
+    pageOffsets: List[int] = Body(default=[])
     tagsByAuthor: List[TagsElements] = Body(...)
 
 
@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional
-from beanie import Document
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -42,6 +42,9 @@ class DocumentKnowledge(Document):
     documentUrl: Optional[str] = Field(min_length=2)
     documentUniqueName: Optional[str] = Field(min_length=2)
     content: str = Field(min_length=1)
+    # `pageOffsets[i]` es la posición en `content` donde comienza la página i + 1. Permite ubicar la página de
+    # cualquier fragmento del texto; los chunks todavía no guardan su rango de páginas
+    pageOffsets: List[int] = Field(default_factory=list)
 
     createdAt: datetime = Field(default_factory=datetime.now)
     lastUpdate: Optional[datetime] = Field(default_factory=datetime.now)
@@ -61,3 +64,92 @@ class DocumentKnowledge(Document):
     async def save(self, *args, **kwargs):
         self.lastUpdate = datetime.now()
         return await super().save(*args, **kwargs)
+
+
+class DocumentVersionView(BaseModel):
+    """Proyección de un documento con la fecha de su última modificación"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    lastUpdate: Optional[datetime] = None
+
+
+class DocumentReferenceView(BaseModel):
+    """Proyección de un documento con los datos necesarios para citarlo como fuente"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    uniqueProcessID: str
+    documentName: str
+    documentUrl: Optional[str] = None
+
+
+class DocumentListView(BaseModel):
+    """
+    Proyección de un documento para los listados: todos los campos que se muestran, sin el texto extraído
+    (`content`), que puede pesar varios megabytes por documento.
+    """
+
+    id: PydanticObjectId = Field(alias="_id", serialization_alias="id")
+    documentName: str
+    uniqueProcessID: str
+    los: List[LineOfService] = []
+    losOwner: Optional[str] = None
+    subLoS: Optional[str] = None
+    labels: List[TagsElements] = []
+    tagsByAuthor: List[TagsElements] = []
+    support: List[BasicPerson] = []
+    typeOfWorkday: List[TypeOfWorkday] = []
+    contractType: List[ContractType] = []
+    statuses: Optional[DocumentStatus] = None
+    isPublished: bool = False
+    profiles: List[ProfilesAllowed] = []
+    knowledgeBase: KnowledgeBase
+    sizeFormatted: Optional[str] = None
+    size: Optional[int] = None
+    metaData: Optional[List[Dict[str, str | list]]] = None
+    summary: Optional[str] = None
+    documentUrl: Optional[str] = None
+    documentUniqueName: Optional[str] = None
+    createdAt: Optional[datetime] = None
+    lastUpdate: Optional[datetime] = None
+
+
+class DocumentStorageView(BaseModel):
+    """Proyección de un documento con los datos necesarios para eliminarlo en cascada (chunks y archivo)"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    uniqueProcessID: str
+    documentUniqueName: Optional[str] = None
+
+
+class DocumentContextView(DocumentReferenceView):
+    """
+    Proyección de un documento con los metadatos que acompañan a sus chunks en el contexto de la respuesta.
+    Los metadatos se guardan una sola vez en el documento y no en cada chunk.
+    """
+
+    los: List[LineOfService] = []
+    profiles: List[ProfilesAllowed] = []
+    typeOfWorkday: List[TypeOfWorkday] = []
+    contractType: List[ContractType] = []
+    losOwner: Optional[str] = None
+    subLoS: Optional[str] = None
+    support: List[BasicPerson] = []
+    tagsByAuthor: List[TagsElements] = []
+
+    def metadata_header(self) -> str:
+        """
+        Arma el bloque de metadatos del documento para incluirlo una vez por fuente en el prompt.
+
+        Returns:
+            Texto con accesos, cargos, owner, soporte y etiquetas del documento
+        """
+        return (
+            f"Línea de servicios: {', '.join(self.los)}\n"
+            f"Cargos o categorías: {', '.join(self.profiles)}\n"
+            f"Tipo de jornada: {', '.join(item.value for item in self.typeOfWorkday)}\n"
+            f"Tipo de contrato: {', '.join(item.value for item in self.contractType)}\n"
+            f"Línea de servicio del owner (los): {self.losOwner}\n"
+            f"Sub línea de servicio del owner (sublos): {self.subLoS}\n"
+            f"Soporte: {', '.join(person.name for person in self.support)}\n"
+            f"Etiquetas: {', '.join(tag.label for tag in self.tagsByAuthor)}"
+        )
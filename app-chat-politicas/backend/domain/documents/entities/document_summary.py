@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Dict, List
+
+import pymongo
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+
+
+class CachedSummary(Document):
+    """
+    Resumen y metadatos generados por el modelo para un documento. Se reutilizan mientras no cambien
+    las entradas del prompt (contenido, etiquetas, instrucciones) ni el modelo.
+    """
+
+    key: str
+    model: str
+    summary: str
+    metaData: List[Dict[str, str | list]] = []
+    createdAt: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "SummaryCache"
+        indexes = [IndexModel([("key", pymongo.ASCENDING)], unique=True)]
@@ -2,8 +2,25 @@
 # Importa y exporta las clases de los archivos individuales
 
 from .document import *
-from .document_knowledge import DocumentKnowledge
+from .document_summary import CachedSummary
+from .document_knowledge import (
+    DocumentContextView,
+    DocumentKnowledge,
+    DocumentListView,
+    DocumentReferenceView,
+    DocumentStorageView,
+    DocumentVersionView,
+)
 from .knowledge_base import KnowledgeBase
 
 # Aseguramos que las clases requeridas por init_db.py estén disponibles
-__all__ = ['DocumentKnowledge', 'KnowledgeBase']
+__all__ = [
+    'CachedSummary',
+    'DocumentContextView',
+    'DocumentKnowledge',
+    'DocumentListView',
+    'DocumentReferenceView',
+    'DocumentStorageView',
+    'DocumentVersionView',
+    'KnowledgeBase',
+]
@@ -3,8 +3,10 @@ from typing import List
 
 from domain.documents.entities.documents import (
     DocumentKnowledge,
+    DocumentListView,
     KnowledgeBase,
 )
+from domain.ingestion.entities.ingestion_job import IngestionJobStatus
 
 
 class GenericDetail(BaseModel):
@@ -42,7 +44,19 @@ class KnowledgeNotAccess(GenericResponse):
 
 
 class DocumentsByUserResponse(BaseModel):
-    documents: List[DocumentKnowledge]
+    documents: List[DocumentListView]
     totalDocuments: int
     totalPublished: int
     totalPending: int
+
+
+class UploadDocumentResponse(BaseModel):
+    jobId: str
+    status: IngestionJobStatus
+    document: DocumentKnowledge
+
+
+class MassiveConfigurationJobResponse(GenericResponse):
+    jobId: str
+    status: IngestionJobStatus
+    totalDocuments: int
@@ -1,22 +1,48 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from domain.documents.entities.documents import DocumentKnowledge, KnowledgeBase
+from domain.documents.entities.documents import DocumentKnowledge, DocumentListView, KnowledgeBase
 
 
 class DocumentsRepositoryInterface(ABC):
     """Interfaz para el repositorio de documentos"""
 
     @abstractmethod
-    async def get_documents_by_user(self, user_email: str) -> List[DocumentKnowledge]:
+    async def get_knowledge_ids_by_user(self, user_email: str) -> List[str]:
         """
-        Obtiene todos los documentos de un usuario
+        Obtiene los ids de las bases de conocimiento de un usuario
 
         Args:
             user_email: Email del usuario
 
         Returns:
-            Lista de documentos del usuario
+            Lista con el knowledgeId de cada base de conocimiento del usuario
+        """
+        pass
+
+    @abstractmethod
+    async def get_documents_by_knowledge_ids(self, knowledge_ids: List[str]) -> List[DocumentListView]:
+        """
+        Obtiene los documentos de las bases de conocimiento indicadas, sin su contenido
+
+        Args:
+            knowledge_ids: Ids de las bases de conocimiento
+
+        Returns:
+            Lista de documentos de las bases de conocimiento
+        """
+        pass
+
+    @abstractmethod
+    async def count_documents_by_knowledge_ids(self, knowledge_ids: List[str]) -> Dict[str, int]:
+        """
+        Cuenta los documentos de las bases de conocimiento indicadas según su estado de publicación
+
+        Args:
+            knowledge_ids: Ids de las bases de conocimiento
+
+        Returns:
+            Diccionario con el total de documentos, los publicados y los pendientes
         """
         pass
 
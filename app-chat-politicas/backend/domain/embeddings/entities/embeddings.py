@@ -1,7 +1,10 @@
 from datetime import datetime
 from typing import List, Optional
+
+import pymongo
 from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel
 
 from domain.documents.entities.documents import LineOfService, ProfilesAllowed
 
@@ -13,8 +16,11 @@ class DocumentEmbeddingInput(BaseModel):
 class DocumentEmbedding(Document):
     documentName: str = Field(min_length=2)
     documentUniqueProcessID: str = Field(min_length=2)
-    embedding: list[float] = Field(min_length=1)
+    # Lista de floats o, si EMBEDDING_STORAGE_FORMAT lo indica, binario empaquetado (float32, float16 o int8)
+    embedding: list[float] | bytes = Field(min_length=1)
     contentChunk: str = Field(min_length=2)
+    # Hash del texto del chunk y del modelo de embeddings, para reutilizar el embedding al actualizar
+    contentHash: Optional[str] = None
     knowledgeBaseId: PydanticObjectId
     los: List[LineOfService] = Field(min_length=1)
     profiles: List[ProfilesAllowed] = Field(min_length=1)
@@ -26,7 +32,73 @@ class DocumentEmbedding(Document):
         collection = "DocumentEmbedding"
         validate_on_save = True
         cache = True
+        # La sincronización incremental de los índices en memoria busca los chunks modificados recientemente
+        indexes = [IndexModel([("lastUpdate", pymongo.ASCENDING)])]
 
     async def save(self, *args, **kwargs):
         self.lastUpdate = datetime.now()
         return await super().save(*args, **kwargs)
+
+
+class ChunkTombstone(Document):
+    """
+    Registro de chunks eliminados de DocumentEmbedding. La sincronización incremental de los índices en memoria
+    lo lee para quitar los chunks que eliminaron otras réplicas, sin recorrer toda la colección.
+    Los registros expiran a los 7 días; las réplicas hacen además una sincronización completa periódica.
+    """
+
+    # Documentos cuyos chunks se eliminaron todos
+    documentUniqueProcessIDs: List[str] = []
+    # Chunks eliminados individualmente
+    chunkIds: List[str] = []
+    deletedAt: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "ChunkTombstones"
+        indexes = [IndexModel([("deletedAt", pymongo.ASCENDING)], expireAfterSeconds=7 * 24 * 60 * 60)]
+
+
+class ChunkFilterAttributes(BaseModel):
+    """Atributos de un chunk por los que se puede filtrar la búsqueda vectorial"""
+
+    knowledgeBaseId: str
+    los: List[str]
+    profiles: List[str]
+
+
+class RetrievalFilters(BaseModel):
+    """
+    Filtros de la búsqueda de documentos relevantes. Dentro de un mismo campo basta que coincida
+    uno de los valores; entre campos distintos deben coincidir todos.
+    """
+
+    los: Optional[List[LineOfService]] = None
+    profiles: Optional[List[ProfilesAllowed]] = None
+    knowledgeBaseIds: Optional[List[str]] = None
+    publishedOnly: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.los or self.profiles or self.knowledgeBaseIds or self.publishedOnly)
+
+
+class DocumentEmbeddingChunkView(BaseModel):
+    """Proyección del contenido de un chunk para armar el contexto de la respuesta"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    contentChunk: str
+
+
+class VectorSearchHit(BaseModel):
+    """Resultado de una búsqueda en el índice vectorial"""
+
+    chunkId: str
+    documentUniqueProcessID: str
+    similarity: float
+
+
+class LexicalSearchHit(BaseModel):
+    """Resultado de una búsqueda en el índice léxico (BM25)"""
+
+    chunkId: str
+    documentUniqueProcessID: str
+    score: float
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Set
+
+from domain.embeddings.entities.embeddings import LexicalSearchHit
+
+
+class LexicalIndexInterface(ABC):
+    """Interfaz para los índices de búsqueda léxica (por palabras clave) utilizados por el chat"""
+
+    @abstractmethod
+    async def load(self):
+        """
+        Construye el índice al levantar la API a partir de la colección DocumentEmbedding.
+        """
+        pass
+
+    @abstractmethod
+    async def sync(self) -> tuple[int, int]:
+        """
+        Sincroniza el índice con la colección DocumentEmbedding.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, rows: Iterable[tuple[str, str, str]]):
+        """
+        Agrega chunks al índice. Los chunks ya indexados se ignoran.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, texto del chunk)
+        """
+        pass
+
+    @abstractmethod
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Quita chunks del índice.
+
+        Args:
+            chunk_ids: Ids de los chunks a eliminar
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        pass
+
+    @abstractmethod
+    def remove_document(self, document_unique_process_id: str) -> int:
+        """
+        Quita del índice todos los chunks de un documento.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        pass
+
+    @abstractmethod
+    def chunk_ids(self) -> Set[str]:
+        """
+        Obtiene los ids de los chunks indexados.
+
+        Returns:
+            Conjunto con los ids de los chunks
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, top_k: int) -> List[LexicalSearchHit]:
+        """
+        Busca los chunks que mejor coinciden con las palabras de la consulta.
+
+        Args:
+            query: Consulta del usuario en texto plano
+            top_k: Cantidad máxima de resultados
+
+        Returns:
+            Resultados ordenados por puntaje descendente
+        """
+        pass
@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Set
+
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, RetrievalFilters, VectorSearchHit
+
+
+class VectorIndexInterface(ABC):
+    """Interfaz para los motores de búsqueda vectorial utilizados por el chat"""
+
+    @abstractmethod
+    async def load(self):
+        """
+        Prepara el índice al levantar la API, restaurando el estado persistido (si existe)
+        y sincronizándolo con la colección DocumentEmbedding.
+        """
+        pass
+
+    @abstractmethod
+    async def sync(self) -> tuple[int, int]:
+        """
+        Sincroniza el índice con la colección DocumentEmbedding.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, rows: Iterable[tuple[str, str, list[float], ChunkFilterAttributes]]):
+        """
+        Agrega chunks al índice. Los chunks ya indexados se ignoran.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, embedding, atributos filtrables)
+        """
+        pass
+
+    @abstractmethod
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Quita chunks del índice.
+
+        Args:
+            chunk_ids: Ids de los chunks a eliminar
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        pass
+
+    @abstractmethod
+    def remove_document(self, document_unique_process_id: str) -> int:
+        """
+        Quita del índice todos los chunks de un documento.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        pass
+
+    @abstractmethod
+    def set_document_published(self, document_unique_process_id: str, published: bool):
+        """
+        Actualiza el estado de publicación de un documento, usado por el filtro `publishedOnly`.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+            published: Si el documento está publicado
+        """
+        pass
+
+    @abstractmethod
+    def chunk_ids(self) -> Set[str]:
+        """
+        Obtiene los ids de los chunks indexados.
+
+        Returns:
+            Conjunto con los ids de los chunks
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        threshold: float,
+        filters: Optional[RetrievalFilters] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[VectorSearchHit]:
+        """
+        Busca los chunks más similares a la consulta. Los filtros se aplican antes de calcular similitudes.
+
+        Args:
+            query_embedding: Embedding de la consulta
+            top_k: Cantidad máxima de resultados
+            threshold: Similitud coseno mínima
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
+            candidates: Ids de los únicos chunks a considerar (por ejemplo, los preseleccionados por la búsqueda léxica)
+
+        Returns:
+            Resultados ordenados por similitud descendente
+        """
+        pass
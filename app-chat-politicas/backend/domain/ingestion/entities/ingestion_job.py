@@ -0,0 +1,91 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from beanie import Document
+from pydantic import BaseModel, Field
+
+from shared.utils.id_generator import generate_unique_process_id
+
+
+class IngestionJobStatus(str, Enum):
+    """Estados de un trabajo de ingesta"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class IngestionJob(Document):
+    """
+    Trabajo de ingesta de un documento (resumen, metadatos y embeddings) procesado en segundo plano.
+    Se guarda en Mongo para que su estado se pueda consultar desde cualquier réplica.
+    """
+
+    jobId: str = Field(default_factory=lambda: generate_unique_process_id("JOB"))
+    documentUniqueProcessID: str
+    author: str
+    status: IngestionJobStatus = IngestionJobStatus.QUEUED
+    # Etapa en curso del procesamiento ("summary" o "embedding")
+    stage: Optional[str] = None
+    attempts: int = 0
+    chunksProcessed: int = 0
+    tokensUsed: int = 0
+    error: Optional[str] = None
+
+    createdAt: datetime = Field(default_factory=datetime.now)
+    startedAt: Optional[datetime] = None
+    # Último avance del trabajo en curso; si deja de avanzar por INGESTION_STALE_AFTER se vuelve a encolar
+    updatedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
+
+    class Settings:
+        name = "IngestionJobs"
+        indexes = ["jobId", "status"]
+
+
+class IngestionJobView(BaseModel):
+    """Estado de un trabajo de ingesta expuesto por la API"""
+
+    jobId: str
+    documentUniqueProcessID: str
+    status: IngestionJobStatus
+    stage: Optional[str] = None
+    attempts: int
+    chunksProcessed: int
+    tokensUsed: int = 0
+    error: Optional[str] = None
+    createdAt: datetime
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
+
+
+class IngestionEventType(str, Enum):
+    """Tipos de evento emitidos durante la ingesta de un documento"""
+
+    STATUS = "status"
+    STAGE = "stage"
+    PROGRESS = "progress"
+    RETRY = "retry"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class IngestionEvent(BaseModel):
+    """Evento de avance de un trabajo de ingesta, transmitido por SSE con el mismo formato que los eventos del chat"""
+
+    id: str = Field(default_factory=lambda: f"event_{uuid.uuid4()}")
+    timestamp: str = Field(default_factory=lambda: str(datetime.now()))
+    type: IngestionEventType
+    jobId: Optional[str] = None
+    status: Optional[IngestionJobStatus] = None
+    stage: Optional[str] = None
+    chunksProcessed: int = 0
+    tokensUsed: int = 0
+    elapsedSeconds: float = 0.0
+    message: Optional[str] = None
+
+    def is_final(self) -> bool:
+        return self.type in (IngestionEventType.DONE, IngestionEventType.FAILED)
@@ -0,0 +1 @@
+# Interfaces para el dominio
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.ingestion.entities.ingestion_job import IngestionEvent
+
+
+class IngestionSubscriptionInterface(ABC):
+    """Suscripción a los eventos de ingesta de un documento"""
+
+    @abstractmethod
+    async def get(self, timeout: float) -> Optional[IngestionEvent]:
+        """
+        Espera el siguiente evento.
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            El evento, o None si no llegó ninguno
+        """
+        pass
+
+    @abstractmethod
+    async def close(self):
+        """Termina la suscripción"""
+        pass
+
+
+class IngestionEventBusInterface(ABC):
+    """Interfaz para distribuir los eventos de ingesta entre quien procesa el documento y quienes lo observan"""
+
+    @abstractmethod
+    async def publish(self, document_unique_process_id: str, event: IngestionEvent):
+        """
+        Publica un evento de ingesta.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+            event: Evento a publicar
+        """
+        pass
+
+    @abstractmethod
+    async def subscribe(self, document_unique_process_id: str) -> IngestionSubscriptionInterface:
+        """
+        Se suscribe a los eventos de ingesta de un documento. Solo se reciben los eventos publicados después de suscribirse.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            La suscripción
+        """
+        pass
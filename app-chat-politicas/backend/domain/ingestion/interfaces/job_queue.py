@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class JobQueueInterface(ABC):
+    """Interfaz para la cola de trabajos de ingesta. La cola solo transporta ids: el estado vive en Mongo."""
+
+    @abstractmethod
+    async def enqueue(self, job_id: str):
+        """
+        Agrega un trabajo a la cola.
+
+        Args:
+            job_id: Id del trabajo
+        """
+        pass
+
+    @abstractmethod
+    async def dequeue(self, timeout: int) -> Optional[str]:
+        """
+        Espera el siguiente trabajo de la cola.
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            El id del trabajo, o None si no llegó ninguno
+        """
+        pass
@@ -0,0 +1,71 @@
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Optional
+
+from beanie import Document
+from pydantic import BaseModel, Field
+
+from domain.documents.entities.body import KnowledgeMassiveConfiguration
+from domain.ingestion.entities.ingestion_job import IngestionJobStatus
+from shared.utils.id_generator import generate_unique_process_id
+
+
+class DocumentConfigurationStatus(str, Enum):
+    """Estado de un documento dentro de una configuración masiva"""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class DocumentConfigurationResult(BaseModel):
+    """Resultado de aplicar la configuración masiva a un documento"""
+
+    uniqueProcessID: str
+    status: DocumentConfigurationStatus = DocumentConfigurationStatus.PENDING
+    error: Optional[str] = None
+    finishedAt: Optional[datetime] = None
+
+
+class ConfigurationJob(Document):
+    """
+    Trabajo de configuración masiva de los documentos de una base de conocimiento, procesado en segundo plano.
+    El resultado de cada documento se guarda apenas termina, de modo que si la réplica se reinicia el
+    trabajo se retoma solo con los documentos pendientes.
+    """
+
+    jobId: str = Field(default_factory=lambda: generate_unique_process_id("CONF"))
+    knowledgeId: str
+    author: str
+    configuration: KnowledgeMassiveConfiguration
+    status: IngestionJobStatus = IngestionJobStatus.QUEUED
+    # Resultados por uniqueProcessID, para actualizar cada documento con un $set
+    results: Dict[str, DocumentConfigurationResult] = {}
+    succeeded: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+    createdAt: datetime = Field(default_factory=datetime.now)
+    startedAt: Optional[datetime] = None
+    # Se actualiza con cada documento procesado; un trabajo en curso sin cambios recientes se considera abandonado
+    updatedAt: datetime = Field(default_factory=datetime.now)
+    finishedAt: Optional[datetime] = None
+
+    class Settings:
+        name = "ConfigurationJobs"
+        indexes = ["jobId", "status"]
+
+
+class ConfigurationJobView(BaseModel):
+    """Estado de un trabajo de configuración masiva expuesto por la API"""
+
+    jobId: str
+    knowledgeId: str
+    status: IngestionJobStatus
+    results: Dict[str, DocumentConfigurationResult]
+    succeeded: int
+    failed: int
+    error: Optional[str] = None
+    createdAt: datetime
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+
+class StorageBackendInterface(ABC):
+    """
+    Interfaz para el almacenamiento de los archivos de los documentos. Las conexiones se abren una vez
+    con `start` al levantar la API y se liberan con `close` al bajarla.
+    """
+
+    async def start(self):
+        """Abre las conexiones del almacenamiento. Los almacenamientos sin conexiones no hacen nada."""
+        pass
+
+    async def close(self):
+        """Cierra las conexiones del almacenamiento"""
+        pass
+
+    @abstractmethod
+    async def upload(self, unique_name: str, blocks: AsyncIterator[bytes]) -> int:
+        """
+        Sube un archivo a partir de sus bloques, sin reunir el archivo completo en memoria.
+
+        Args:
+            unique_name: Nombre único del archivo
+            blocks: Bloques del contenido, en orden
+
+        Returns:
+            Cantidad de bytes subidos
+        """
+        pass
+
+    @abstractmethod
+    async def download(self, unique_name: str) -> AsyncIterator[bytes]:
+        """
+        Descarga un archivo por bloques, sin reunir el archivo completo en memoria.
+
+        Args:
+            unique_name: Nombre único del archivo
+
+        Returns:
+            Iterador asíncrono sobre los bloques del contenido
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, unique_names: List[str]) -> int:
+        """
+        Elimina varios archivos. Los archivos que ya no existen se ignoran.
+
+        Args:
+            unique_names: Nombres únicos de los archivos
+
+        Returns:
+            Cantidad de archivos eliminados
+        """
+        pass
+
+    @abstractmethod
+    async def get_url(self, unique_name: str, expires_in: int) -> str:
+        """
+        Genera una URL firmada (SAS) de solo lectura para acceder a un archivo.
+
+        Args:
+            unique_name: Nombre único del archivo
+            expires_in: Segundos de validez de la URL
+
+        Returns:
+            URL del archivo
+        """
+        pass
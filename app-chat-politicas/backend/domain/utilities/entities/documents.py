@@ -1,5 +1,15 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+
+class ExtractedText(BaseModel):
+    """
+    Texto extraído de un PDF. `pageOffsets[i]` es la posición en `text` donde comienza la página i + 1,
+    lo que permite ubicar la página de cualquier fragmento del texto.
+    """
+
+    text: str
+    pageOffsets: List[int]
 
 
 class ExtractTextFromDocumentResponse(BaseModel):
@@ -13,3 +23,6 @@ class ExtractTextFromDocumentResponse(BaseModel):
     sizeFormatted: str
     size: int
     documentName: str
+    pageOffsets: List[int] = []
+    # Segundos de cada fase de la solicitud; se informan en la cabecera Server-Timing y no en el cuerpo
+    timings: Dict[str, float] = Field(default_factory=dict, exclude=True)
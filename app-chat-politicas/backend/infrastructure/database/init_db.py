@@ -4,9 +4,11 @@ from beanie import init_beanie
 from constants import settings
 
 # Nueva arquitectura (Clean Architecture)
-from domain.chat.entities.chat import ChatHistory, ChatSession
-from domain.documents.entities.documents import DocumentKnowledge, KnowledgeBase
-from domain.embeddings.entities.embeddings import DocumentEmbedding
+from domain.chat.entities.chat import CachedAnswer, ChatHistory, ChatSession
+from domain.documents.entities.documents import CachedSummary, DocumentKnowledge, KnowledgeBase
+from domain.embeddings.entities.embeddings import ChunkTombstone, DocumentEmbedding
+from domain.ingestion.entities.ingestion_job import IngestionJob
+from domain.knowledge_base.entities.configuration_job import ConfigurationJob
 from domain.app_config.entities.app_log import AppLog
 
 
@@ -30,7 +32,12 @@ async def init_db():
             KnowledgeBase,
             ChatHistory,
             DocumentEmbedding,
+            ChunkTombstone,
             ChatSession,
+            CachedAnswer,
+            CachedSummary,
+            IngestionJob,
+            ConfigurationJob,
             AppLog,
         ],
     )
@@ -0,0 +1,85 @@
+import struct
+from typing import Sequence
+
+import numpy as np
+from bson.binary import Binary
+
+# Formatos de almacenamiento: "list" es el arreglo BSON de doubles original
+LIST_FORMAT = "list"
+FLOAT32_FORMAT = "float32"
+FLOAT16_FORMAT = "float16"
+INT8_FORMAT = "int8"
+
+# Cabecera de 4 bytes (el primero identifica el formato y el resto es relleno, para que el vector quede
+# alineado a 4 bytes); int8 agrega a continuación la escala como float32
+_HEADER_SIZE = 4
+_FORMAT_CODES = {FLOAT32_FORMAT: 1, FLOAT16_FORMAT: 2, INT8_FORMAT: 3}
+_DTYPES = {1: np.dtype("<f4"), 2: np.dtype("<f2"), 3: np.dtype("i1")}
+_SCALE = struct.Struct("<f")
+
+STORAGE_FORMATS = (LIST_FORMAT, *_FORMAT_CODES)
+
+
+def encode_embedding(embedding: Sequence[float] | np.ndarray, storage_format: str) -> list[float] | Binary:
+    """
+    Codifica un embedding en el formato de almacenamiento indicado.
+
+    Args:
+        embedding: Vector a guardar
+        storage_format: "list", "float32", "float16" o "int8"
+
+    Returns:
+        La lista original (formato "list") o un BSON Binary con el vector empaquetado
+    """
+    if storage_format == LIST_FORMAT:
+        return embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
+
+    code = _FORMAT_CODES.get(storage_format)
+    if code is None:
+        raise ValueError(f"Formato de almacenamiento de embeddings no soportado: {storage_format}")
+
+    vector = np.asarray(embedding, dtype=np.float32)
+    if storage_format == INT8_FORMAT:
+        # Cuantización simétrica por vector: el valor absoluto máximo se mapea a 127
+        scale = float(np.abs(vector).max()) / 127.0 or 1.0
+        payload = _SCALE.pack(scale) + np.clip(np.round(vector / scale), -127, 127).astype(np.int8).tobytes()
+    else:
+        payload = vector.astype(_DTYPES[code]).tobytes()
+
+    return Binary(bytes([code]).ljust(_HEADER_SIZE, b"\x00") + payload)
+
+
+def decode_embedding(value: Sequence[float] | bytes) -> np.ndarray:
+    """
+    Decodifica un embedding almacenado en cualquiera de los formatos soportados.
+    Para float32 el arreglo es una vista sobre los bytes del documento (sin copia).
+
+    Args:
+        value: Lista de floats o binario empaquetado tal como viene de Mongo
+
+    Returns:
+        El vector como arreglo float32 de solo lectura
+    """
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return np.asarray(value, dtype=np.float32)
+
+    buffer = memoryview(value)
+    code = buffer[0]
+    dtype = _DTYPES.get(code)
+    if dtype is None:
+        raise ValueError(f"Formato de embedding binario desconocido: {code}")
+
+    if code == _FORMAT_CODES[INT8_FORMAT]:
+        (scale,) = _SCALE.unpack_from(buffer, _HEADER_SIZE)
+        return np.frombuffer(buffer, dtype=dtype, offset=_HEADER_SIZE + _SCALE.size).astype(np.float32) * np.float32(scale)
+
+    vector = np.frombuffer(buffer, dtype=dtype, offset=_HEADER_SIZE)
+    return vector if code == _FORMAT_CODES[FLOAT32_FORMAT] else vector.astype(np.float32)
+
+
+def storage_format_of(value: Sequence[float] | bytes) -> str:
+    """Identifica el formato en que está almacenado un embedding"""
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return LIST_FORMAT
+    code = memoryview(value)[0]
+    return next((name for name, format_code in _FORMAT_CODES.items() if format_code == code), "unknown")
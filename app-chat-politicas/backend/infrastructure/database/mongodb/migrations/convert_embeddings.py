@@ -0,0 +1,76 @@
+"""
+Convierte los embeddings guardados en la colección DocumentEmbedding al formato de almacenamiento indicado.
+
+Uso (desde la carpeta backend):
+    python -m infrastructure.database.mongodb.migrations.convert_embeddings --format float32 --batch-size 500
+
+Recorre la colección con un cursor (sin cargarla completa en memoria) y escribe cada lote con un único
+bulk_write. Los documentos que ya están en el formato destino se omiten, por lo que la migración se puede
+interrumpir y volver a ejecutar. Con `--format list` se revierte a arreglos de doubles.
+"""
+
+import argparse
+import asyncio
+import time
+
+from pymongo import UpdateOne
+
+from domain.embeddings.entities.embeddings import DocumentEmbedding
+from infrastructure.database.init_db import init_db
+from infrastructure.database.mongodb.embedding_codec import STORAGE_FORMATS, decode_embedding, encode_embedding, storage_format_of
+
+
+async def convert_embeddings(storage_format: str, batch_size: int) -> tuple[int, int]:
+    """
+    Convierte todos los embeddings de la colección al formato indicado.
+
+    Args:
+        storage_format: Formato destino ("list", "float32", "float16" o "int8")
+        batch_size: Cantidad de documentos por lote de escritura
+
+    Returns:
+        Tupla (documentos convertidos, documentos omitidos por estar ya en el formato destino)
+    """
+    collection = DocumentEmbedding.get_motor_collection()
+    converted = 0
+    skipped = 0
+    operations = []
+
+    async for document in collection.find({}, {"embedding": 1}, batch_size=batch_size):
+        if storage_format_of(document["embedding"]) == storage_format:
+            skipped += 1
+            continue
+
+        embedding = encode_embedding(decode_embedding(document["embedding"]), storage_format)
+        operations.append(UpdateOne({"_id": document["_id"]}, {"$set": {"embedding": embedding}}))
+
+        if len(operations) >= batch_size:
+            await collection.bulk_write(operations, ordered=False)
+            converted += len(operations)
+            operations = []
+            print(f"Convertidos {converted} embeddings...")
+
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+        converted += len(operations)
+
+    return converted, skipped
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Convierte los embeddings de DocumentEmbedding a otro formato de almacenamiento")
+    parser.add_argument("--format", dest="storage_format", choices=STORAGE_FORMATS, required=True)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    await init_db()
+
+    start = time.perf_counter()
+    converted, skipped = await convert_embeddings(args.storage_format, args.batch_size)
+    print(
+        f"Migración terminada en {time.perf_counter() - start:.1f}s: {converted} convertidos, {skipped} ya estaban en formato {args.storage_format}."
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Vuelve a generar los embeddings de los documentos con chunks sin contentHash o con un hash desactualizado.
+
+Uso (desde la carpeta backend):
+    python -m infrastructure.database.mongodb.migrations.reembed_stale_chunks --dry-run
+    python -m infrastructure.database.mongodb.migrations.reembed_stale_chunks
+
+Los chunks guardados antes de embeber solo el texto del chunk incluyen en contentChunk el encabezado con los
+metadatos del documento y no tienen contentHash. Como al actualizar un documento ya no se regeneran sus
+embeddings, esta migración los reemplaza: cada documento afectado pasa por update_embeddings_with_metadata,
+que reutiliza los chunks cuyo hash coincide, embebe los demás y elimina los antiguos. También cubre los chunks
+generados con otro modelo de embeddings. Los documentos ya migrados se omiten, por lo que se puede interrumpir
+y volver a ejecutar; las réplicas en ejecución toman los cambios en su próxima sincronización.
+"""
+
+import argparse
+import asyncio
+import time
+
+from domain.documents.entities.documents import DocumentKnowledge
+from domain.embeddings.entities.embeddings import DocumentEmbedding
+from infrastructure.database.init_db import init_db
+from service.genai_shared.embeddings import chunk_content_hash, update_embeddings_with_metadata
+
+
+async def find_stale_documents() -> set[str]:
+    """
+    Recorre los chunks con un cursor y devuelve los documentos que tienen al menos uno desactualizado.
+
+    Returns:
+        uniqueProcessID de los documentos a migrar
+    """
+    stale = set()
+    projection = {"documentUniqueProcessID": 1, "contentChunk": 1, "contentHash": 1}
+    async for chunk in DocumentEmbedding.get_motor_collection().find({}, projection):
+        if chunk["documentUniqueProcessID"] in stale:
+            continue
+        if chunk.get("contentHash") != chunk_content_hash(chunk["contentChunk"]):
+            stale.add(chunk["documentUniqueProcessID"])
+    return stale
+
+
+async def reembed_stale_chunks(dry_run: bool) -> tuple[int, int]:
+    """
+    Regenera los embeddings de los documentos con chunks desactualizados.
+
+    Args:
+        dry_run: Si es True solo informa los documentos afectados, sin modificarlos
+
+    Returns:
+        Tupla (documentos migrados, tokens consumidos)
+    """
+    migrated = 0
+    tokens = 0
+
+    for unique_process_id in sorted(await find_stale_documents()):
+        document = await DocumentKnowledge.find_one(DocumentKnowledge.uniqueProcessID == unique_process_id)
+        if document is None:
+            print(f"Chunks huérfanos del documento {unique_process_id}: no se migran")
+            continue
+        if dry_run:
+            print(f"Pendiente: {document.documentName} ({unique_process_id})")
+            continue
+
+        try:
+            # Los índices en memoria de este proceso no se cargan: escribir en ellos sobrescribiría el índice persistido de la API
+            timings = await update_embeddings_with_metadata(document, document.content, update_indexes=False)
+        except Exception as e:
+            print(f"Error al migrar los embeddings de {document.documentName}: {str(e)}")
+            continue
+        migrated += 1
+        tokens += int(timings.get("tokens", 0))
+
+    return migrated, tokens
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Regenera los embeddings de los chunks sin contentHash o con un hash desactualizado")
+    parser.add_argument("--dry-run", action="store_true", help="Solo lista los documentos afectados")
+    args = parser.parse_args()
+
+    await init_db()
+
+    start = time.perf_counter()
+    migrated, tokens = await reembed_stale_chunks(args.dry_run)
+    print(f"Migración terminada en {time.perf_counter() - start:.1f}s: {migrated} documentos migrados, {tokens} tokens consumidos.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
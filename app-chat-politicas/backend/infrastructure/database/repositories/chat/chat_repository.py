@@ -1,20 +1,26 @@
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
-import numpy as np
-import pymongo
+from beanie import PydanticObjectId
+from beanie.operators import In
 from constants import openai_client, settings
 from domain.chat.entities.chat import ChatHistory, ChatSession, UserChatsView
 from domain.chat.interfaces.chat_repository import ChatRepositoryInterface
-from domain.documents.entities.documents import DocumentKnowledge
-from domain.embeddings.entities.embeddings import DocumentEmbedding
-from sklearn.metrics.pairwise import cosine_similarity
-from infrastructure.services.genai.embeddings import generate_embedding_from_text
+from domain.documents.entities.documents import DocumentContextView, DocumentKnowledge
+from domain.embeddings.entities.embeddings import DocumentEmbedding, DocumentEmbeddingChunkView, RetrievalFilters, VectorSearchHit
+from domain.embeddings.interfaces.lexical_index import LexicalIndexInterface
+from domain.embeddings.interfaces.vector_index import VectorIndexInterface
+from infrastructure.services.genai.embeddings import generate_query_embedding
+from infrastructure.services.retrieval import lexical_index, reciprocal_rank_fusion, vector_index
 
 
 class ChatRepository(ChatRepositoryInterface):
     """Implementación del repositorio de chat"""
 
+    def __init__(self, index: VectorIndexInterface = vector_index, lexical: LexicalIndexInterface = lexical_index):
+        self.index = index
+        self.lexical = lexical
+
     async def retrieve_chat_history(self, session_id: str) -> ChatHistory | None:
         """
         Recupera el historial de chat para una sesión específica.
@@ -32,67 +38,61 @@ class ChatRepository(ChatRepositoryInterface):
             results = await ChatHistory(sessionId=session_id).save()
             return results.chatHistory
 
-    async def get_relevant_documents(self, query: str) -> list:
+    async def get_relevant_documents(self, query: str, filters: Optional[RetrievalFilters] = None) -> list:
         """
         Obtiene los documentos más relevantes basados en la consulta del usuario.
 
         Args:
             query: La consulta del usuario en texto plano
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
 
         Returns:
             Una lista de documentos relevantes con su contenido
         """
         try:
-            # Generar el embedding para la consulta
-            query_embedding = await generate_embedding_from_text(query)
+            # Generar el embedding para la consulta (o reutilizarlo desde la caché)
+            query_embedding = await generate_query_embedding(query)
 
-            documents = (
-                await DocumentEmbedding.find()
-                .sort(
-                    [
-                        (DocumentEmbedding.lastUpdate, pymongo.DESCENDING),
-                    ]
-                )
-                .to_list()
-            )
+            # Buscar los chunks más relevantes en los índices, considerando solo los que cumplen los filtros
+            hits = self._search_chunks(query, query_embedding, filters)
 
-            if not documents:
+            if not hits:
                 return []
 
-            embeddings_list = np.array([doc.embedding for doc in documents])
-
-            similarities = cosine_similarity([query_embedding], embeddings_list)
-
-            # Establecer el umbral de similaridad
-            similarity_threshold = 0.3
-
-            # Encontrar todas las similaridades que cumplen con el umbral
-            valid_indices = np.where(similarities[0] >= similarity_threshold)[0]
-
-            if valid_indices.size == 0:
-                return []
+            # Solo se consultan a Mongo los chunks y documentos seleccionados
+            chunks = (
+                await DocumentEmbedding.find(
+                    In(DocumentEmbedding.id, [PydanticObjectId(hit.chunkId) for hit in hits]),
+                )
+                .project(DocumentEmbeddingChunkView)
+                .to_list()
+            )
 
-            # Ordenar los índices por la similitud en orden descendente
-            sorted_indices = valid_indices[np.argsort(similarities[0][valid_indices])[::-1]]
+            documents = (
+                await DocumentKnowledge.find(
+                    In(DocumentKnowledge.uniqueProcessID, list({hit.documentUniqueProcessID for hit in hits})),
+                )
+                .project(DocumentContextView)
+                .to_list()
+            )
 
-            # Tomar un máximo de 5 documentos
-            top_indices = sorted_indices[:5]
+            content_by_chunk = {str(chunk.id): chunk.contentChunk for chunk in chunks}
+            document_by_id = {document.uniqueProcessID: document for document in documents}
 
             # Preparar los documentos relevantes
             relevant_documents = []
 
-            for i, idx in enumerate(top_indices):
-                document_embedding: DocumentEmbedding = documents[idx]
-                document: DocumentKnowledge = await DocumentKnowledge.find_one(
-                    DocumentKnowledge.uniqueProcessID == document_embedding.documentUniqueProcessID
-                )
+            for hit in hits:
+                document = document_by_id.get(hit.documentUniqueProcessID)
+                content = content_by_chunk.get(hit.chunkId)
 
-                if document:
+                if document and content:
                     relevant_documents.append(
                         {
                             "title": document.documentName,
-                            "content": document_embedding.contentChunk,
-                            "similarity": float(similarities[0][idx]),
+                            "content": content,
+                            "metadata": document.metadata_header(),
+                            "similarity": hit.similarity,
                             "document_id": str(document.id),
                             "document_url": document.documentUrl,
                         }
@@ -104,6 +104,48 @@ class ChatRepository(ChatRepositoryInterface):
             print(f"Error al obtener documentos relevantes: {str(e)}")
             return []
 
+    def _search_chunks(self, query: str, query_embedding: list[float], filters: Optional[RetrievalFilters]) -> List[VectorSearchHit]:
+        """
+        Busca los chunks más relevantes según el modo configurado en RETRIEVAL_MODE.
+
+        Args:
+            query: La consulta del usuario en texto plano
+            query_embedding: Embedding de la consulta
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
+
+        Returns:
+            Los chunks seleccionados, con su similitud coseno contra la consulta
+        """
+        top_k = settings.RETRIEVAL_TOP_K
+        threshold = settings.RETRIEVAL_SIMILARITY_THRESHOLD
+
+        if settings.RETRIEVAL_MODE == "vector":
+            return self.index.search(query_embedding, top_k=top_k, threshold=threshold, filters=filters)
+
+        lexical_ids = [hit.chunkId for hit in self.lexical.search(query, settings.RETRIEVAL_CANDIDATES)]
+
+        # Prefiltro léxico: solo se puntúan con embeddings los candidatos de BM25
+        if settings.RETRIEVAL_MODE == "lexical_prefilter" and lexical_ids:
+            return self.index.search(query_embedding, top_k=top_k, threshold=threshold, filters=filters, candidates=lexical_ids)
+
+        dense_hits = self.index.search(query_embedding, top_k=settings.RETRIEVAL_CANDIDATES, threshold=threshold, filters=filters)
+        if not lexical_ids:
+            return dense_hits[:top_k]
+
+        # Similitud de los candidatos léxicos, que además descarta los que no cumplen los filtros.
+        # Un chunk con coincidencia de palabras clave se conserva con una similitud menor que el umbral,
+        # pero no por debajo de RETRIEVAL_LEXICAL_SIMILARITY_FLOOR.
+        lexical_floor = settings.RETRIEVAL_LEXICAL_SIMILARITY_FLOOR
+        lexical_hits = {
+            hit.chunkId: hit for hit in self.index.search(query_embedding, len(lexical_ids), lexical_floor, filters, candidates=lexical_ids)
+        }
+        lexical_ranking = [chunk_id for chunk_id in lexical_ids if chunk_id in lexical_hits]
+
+        hits_by_chunk = {**lexical_hits, **{hit.chunkId: hit for hit in dense_hits}}
+        fused = reciprocal_rank_fusion([[hit.chunkId for hit in dense_hits], lexical_ranking], k=settings.RETRIEVAL_RRF_K)
+
+        return [hits_by_chunk[chunk_id] for chunk_id, _ in fused[:top_k]]
+
     async def save_chat_session(self, chat_session: ChatSession) -> ChatSession:
         """
         Guarda una sesión de chat en la base de datos.
@@ -1,32 +1,69 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from beanie.operators import In
 from domain.documents.interfaces.documents_repository import DocumentsRepositoryInterface
-from domain.documents.entities.documents import DocumentKnowledge, KnowledgeBase
+from domain.documents.entities.documents import DocumentKnowledge, DocumentListView, KnowledgeBase
 
 
 class DocumentsRepository(DocumentsRepositoryInterface):
     """Implementación del repositorio de documentos"""
 
-    async def get_documents_by_user(self, user_email: str) -> List[DocumentKnowledge]:
+    async def get_knowledge_ids_by_user(self, user_email: str) -> List[str]:
         """
-        Obtiene todos los documentos de un usuario
+        Obtiene los ids de las bases de conocimiento de un usuario
 
         Args:
             user_email: Email del usuario
 
         Returns:
-            Lista de documentos del usuario
+            Lista con el knowledgeId de cada base de conocimiento del usuario
         """
-        # Primero obtenemos todas las bases de conocimiento del usuario
-        knowledge_bases = await KnowledgeBase.find(KnowledgeBase.author == user_email).to_list()
+        knowledge_bases = KnowledgeBase.get_motor_collection().find({"author": user_email}, {"knowledgeId": 1})
+        return [knowledge_base["knowledgeId"] async for knowledge_base in knowledge_bases]
 
-        all_documents = []
+    async def get_documents_by_knowledge_ids(self, knowledge_ids: List[str]) -> List[DocumentListView]:
+        """
+        Obtiene los documentos de las bases de conocimiento indicadas, sin su contenido
+
+        Args:
+            knowledge_ids: Ids de las bases de conocimiento
+
+        Returns:
+            Lista de documentos de las bases de conocimiento
+        """
+        if not knowledge_ids:
+            return []
 
-        # Luego obtenemos todos los documentos asociados a esas bases de conocimiento
-        for knowledge_base in knowledge_bases:
-            documents = await DocumentKnowledge.find(DocumentKnowledge.knowledgeBase.knowledgeId == knowledge_base.knowledgeId).to_list()
-            all_documents.extend(documents)
+        # Una sola consulta para todas las bases de conocimiento, proyectando solo los campos del listado
+        return await DocumentKnowledge.find(In(DocumentKnowledge.knowledgeBase.knowledgeId, knowledge_ids)).project(DocumentListView).to_list()
 
-        return all_documents
+    async def count_documents_by_knowledge_ids(self, knowledge_ids: List[str]) -> Dict[str, int]:
+        """
+        Cuenta los documentos de las bases de conocimiento indicadas según su estado de publicación, agrupando en Mongo
+
+        Args:
+            knowledge_ids: Ids de las bases de conocimiento
+
+        Returns:
+            Diccionario con el total de documentos, los publicados y los pendientes
+        """
+        totals = {"totalDocuments": 0, "totalPublished": 0, "totalPending": 0}
+        if not knowledge_ids:
+            return totals
+
+        groups = DocumentKnowledge.get_motor_collection().aggregate(
+            [
+                {"$match": {"knowledgeBase.knowledgeId": {"$in": knowledge_ids}}},
+                {"$group": {"_id": "$isPublished", "count": {"$sum": 1}}},
+            ]
+        )
+        async for group in groups:
+            totals["totalDocuments"] += group["count"]
+            if group["_id"] is True:
+                totals["totalPublished"] += group["count"]
+            elif group["_id"] is False:
+                totals["totalPending"] += group["count"]
+
+        return totals
 
     async def get_document_by_id(self, document_id: str) -> Optional[DocumentKnowledge]:
         """
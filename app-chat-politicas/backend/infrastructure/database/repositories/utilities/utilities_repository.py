@@ -1,9 +1,17 @@
-import fitz
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict
+
 from fastapi import UploadFile, HTTPException
 
+from constants import settings
+
 from domain.utilities.interfaces.utilities_repository import UtilitiesRepositoryInterface
-from domain.utilities.entities.documents import ExtractTextFromDocumentResponse
-from infrastructure.services.storage.azure import upload_to_azure
+from domain.utilities.entities.documents import ExtractedText, ExtractTextFromDocumentResponse
+from infrastructure.services.extraction import ExtractionTimeout, PageLimitExceeded, pdf_extraction_pool
+from infrastructure.services.storage import FileTooLarge, iter_file_blocks, spool_upload, storage_backend, unique_file_name
 from utils import convert_size
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB in bytes
@@ -25,43 +33,91 @@ class UtilitiesRepository(UtilitiesRepositoryInterface):
             Respuesta con el texto extraído y metadatos del documento
 
         Raises:
-            HTTPException: Si el archivo no es un PDF o excede el tamaño máximo permitido
+            HTTPException: Si el archivo no es un PDF, excede el tamaño o las páginas permitidas, o la extracción tarda demasiado
         """
         # Verificar el tipo de archivo
         if file.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
 
-        # Leer el contenido del archivo
-        content = await file.read()
-
-        # Verificar el tamaño del archivo
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(status_code=400, detail="File size exceeds the maximum limit of 50 MB.")
-
-        # Subir el archivo a Azure Blob Storage
-        result_blob_storage = await upload_to_azure(content, file.filename)
-
-        # Abrir el PDF y extraer el texto
-        pdf_document = fitz.open(stream=content, filetype="pdf")
-
-        # Variable para almacenar todo el texto extraído
-        full_text = ""
-
-        # Iterar sobre cada página del PDF
-        for page_num in range(len(pdf_document)):
-            page = pdf_document.load_page(page_num)
-            text = page.get_text()
-            full_text += text
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        descriptor, path = tempfile.mkstemp(suffix=".pdf")
+        os.close(descriptor)
+        try:
+            # Copiar el archivo a disco por bloques, verificando el tamaño a medida que se lee
+            try:
+                size = await spool_upload(file, path, settings.BLOB_UPLOAD_BLOCK_SIZE, MAX_FILE_SIZE)
+            except FileTooLarge:
+                raise HTTPException(status_code=400, detail="File size exceeds the maximum limit of 50 MB.")
+            timings["read"] = time.perf_counter() - start
+
+            unique_name = unique_file_name(file.filename)
+
+            async def upload():
+                phase_start = time.perf_counter()
+                await storage_backend.upload(unique_name, iter_file_blocks(path, settings.BLOB_UPLOAD_BLOCK_SIZE))
+                timings["upload"] = time.perf_counter() - phase_start
+
+            async def extract():
+                phase_start = time.perf_counter()
+                result = await self._extract_pdf_text(path)
+                timings["extract"] = time.perf_counter() - phase_start
+                return result
+
+            # Subir el archivo y extraer el texto (en un proceso aparte) al mismo tiempo, ambos leyendo la copia en disco.
+            # Si una de las dos falla, la otra se cancela
+            upload_task = None
+            try:
+                async with asyncio.TaskGroup() as group:
+                    upload_task = group.create_task(upload())
+                    extract_task = group.create_task(extract())
+            except ExceptionGroup as errors:
+                # El archivo ya subido no queda referenciado por ningún documento
+                if upload_task is not None and upload_task.done() and not upload_task.cancelled() and upload_task.exception() is None:
+                    await storage_backend.delete([unique_name])
+                raise errors.exceptions[0]
+        finally:
+            await asyncio.to_thread(os.remove, path)
+
+        extracted = extract_task.result()
 
         # Formatear el tamaño del archivo
-        size_readable = await convert_size(file.size)
+        size_readable = await convert_size(size)
 
         # Construir y retornar la respuesta
         return ExtractTextFromDocumentResponse(
-            documentContent=full_text,
-            documentUrl=result_blob_storage["pdf_url"],
-            documentUniqueName=result_blob_storage["unique_name"],
+            documentContent=extracted.text,
+            documentUrl=await storage_backend.get_url(unique_name, settings.BLOB_SAS_EXPIRY),
+            documentUniqueName=unique_name,
             sizeFormatted=size_readable,
-            size=file.size,
+            size=size,
             documentName=file.filename,
+            pageOffsets=extracted.pageOffsets,
+            timings={**timings, "total": time.perf_counter() - start},
         )
+
+    @staticmethod
+    async def _extract_pdf_text(path: str) -> ExtractedText:
+        """
+        Extrae el texto de un PDF con el grupo de procesos de extracción. El proceso recibe solo la ruta
+        del archivo, sin copiar los bytes por la cola del grupo.
+
+        Args:
+            path: Ruta del PDF
+
+        Returns:
+            Texto del documento y posición donde comienza cada página
+
+        Raises:
+            HTTPException: Si el PDF excede las páginas permitidas, no se puede leer o la extracción tarda demasiado
+        """
+        try:
+            return await pdf_extraction_pool.extract_text(path)
+        except PageLimitExceeded as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ExtractionTimeout as e:
+            raise HTTPException(status_code=504, detail=str(e))
+        except Exception as e:
+            print(f"Error al extraer el texto del PDF: {str(e)}")
+            raise HTTPException(status_code=400, detail="The PDF file could not be read.")
@@ -0,0 +1,19 @@
+from constants import settings
+from infrastructure.services.extraction.pdf import PageLimitExceeded
+from infrastructure.services.extraction.pool import ExtractionTimeout, PdfExtractionPool
+
+# Instancia única del grupo de procesos de extracción, compartida por todo el proceso
+pdf_extraction_pool = PdfExtractionPool(
+    workers=settings.PDF_EXTRACTION_WORKERS,
+    timeout=settings.PDF_EXTRACTION_TIMEOUT,
+    max_pages=settings.PDF_MAX_PAGES,
+    max_tasks_per_child=settings.PDF_EXTRACTION_MAX_TASKS_PER_CHILD,
+    shard_pages=settings.PDF_EXTRACTION_SHARD_PAGES,
+)
+
+__all__ = [
+    'ExtractionTimeout',
+    'PageLimitExceeded',
+    'PdfExtractionPool',
+    'pdf_extraction_pool',
+]
@@ -0,0 +1,81 @@
+"""
+Funciones que se ejecutan en los procesos de extracción. Este módulo solo importa PyMuPDF para que
+los procesos (iniciados con "spawn") arranquen rápido y no carguen el resto de la API.
+"""
+
+from multiprocessing.connection import Connection
+from typing import List
+
+import fitz
+
+
+class PageLimitExceeded(ValueError):
+    """El PDF tiene más páginas que las permitidas"""
+
+
+def count_pdf_pages(path: str, max_pages: int) -> int:
+    """
+    Cuenta las páginas de un PDF guardado en disco.
+
+    Args:
+        path: Ruta del archivo PDF
+        max_pages: Cantidad máxima de páginas permitidas
+
+    Returns:
+        Cantidad de páginas del documento
+
+    Raises:
+        PageLimitExceeded: Si el PDF supera `max_pages` páginas
+    """
+    with fitz.open(path, filetype="pdf") as pdf_document:
+        if pdf_document.page_count > max_pages:
+            raise PageLimitExceeded(f"El documento tiene {pdf_document.page_count} páginas y el máximo permitido es {max_pages}.")
+
+        return pdf_document.page_count
+
+
+def extract_pdf_pages(path: str, start: int, end: int) -> List[str]:
+    """
+    Extrae el texto de las páginas [start, end) de un PDF guardado en disco.
+
+    Args:
+        path: Ruta del archivo PDF
+        start: Primera página (desde 0)
+        end: Página siguiente a la última
+
+    Returns:
+        Texto de cada página, en orden
+    """
+    with fitz.open(path, filetype="pdf") as pdf_document:
+        return [pdf_document.load_page(page_number).get_text() for page_number in range(start, end)]
+
+
+def serve(connection: Connection):
+    """
+    Ciclo de un proceso de extracción: avisa que está listo y luego recibe tareas (función, argumentos)
+    por `connection` y devuelve (True, resultado) o (False, excepción). Termina al recibir None o al
+    cerrarse la conexión.
+
+    Args:
+        connection: Extremo del proceso en el pipe con la API
+    """
+    connection.send(True)
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        function, args = task
+        try:
+            result = (True, function(*args))
+        except Exception as e:
+            result = (False, e)
+
+        try:
+            connection.send(result)
+        except Exception as e:
+            # La excepción original no se puede serializar: se envía solo su mensaje
+            connection.send((False, RuntimeError(str(e) if result[0] else str(result[1]))))
@@ -0,0 +1,214 @@
+import asyncio
+import math
+import multiprocessing
+from itertools import accumulate
+from typing import Any, Callable, List, Optional, Set
+
+from domain.utilities.entities.documents import ExtractedText
+from infrastructure.services.extraction.pdf import count_pdf_pages, extract_pdf_pages, serve
+
+
+class ExtractionTimeout(Exception):
+    """La extracción superó el tiempo máximo permitido"""
+
+
+class _ExtractionProcess:
+    """Proceso de extracción y el extremo de la API del pipe por el que recibe tareas"""
+
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=serve, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.tasks = 0
+
+    async def ready(self):
+        """Espera a que el proceso termine de iniciar y pueda recibir tareas"""
+        await self._receive()
+
+    async def run(self, function: Callable, args: tuple) -> Any:
+        """Ejecuta una tarea en el proceso y espera el resultado sin bloquear el event loop"""
+        self.tasks += 1
+        self.connection.send((function, args))
+
+        succeeded, value = await self._receive()
+        if not succeeded:
+            raise value
+        return value
+
+    async def _receive(self) -> Any:
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        loop.add_reader(self.connection.fileno(), lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(self.connection.fileno())
+
+        # Si el proceso terminó de forma inesperada, recv lanza EOFError
+        return self.connection.recv()
+
+    def stop(self):
+        """Pide al proceso que termine cuando quede libre"""
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.connection.close()
+
+    def kill(self):
+        """Termina el proceso de inmediato, aunque esté ejecutando una tarea"""
+        self.process.kill()
+        self.connection.close()
+
+
+class PdfExtractionPool:
+    """
+    Grupo acotado de procesos para extraer el texto de los PDF fuera del event loop: un PDF grande
+    ocupa la CPU de un proceso de extracción sin detener los streams del chat de la réplica.
+
+    Los procesos se inician con "spawn" (un fork copiaría el estado del event loop y las conexiones
+    abiertas) y se reemplazan cada `max_tasks_per_child` extracciones para acotar la memoria que retiene
+    PyMuPDF. El archivo se pasa por ruta, sin serializar sus bytes hacia el proceso.
+
+    Los documentos con más de `shard_pages` páginas se dividen en rangos de páginas que se extraen
+    en paralelo en varios procesos; cada rango tiene al menos `shard_pages` páginas.
+
+    El tiempo máximo se cuenta para cada tarea desde que un proceso la toma, no mientras espera en la cola.
+    Si una tarea lo supera, o su extracción se cancela mientras se ejecuta, se termina solo el proceso que
+    la ejecutaba y se reemplaza por uno nuevo; las extracciones de otras solicitudes no se ven afectadas.
+    """
+
+    def __init__(self, workers: int, timeout: int, max_pages: int, max_tasks_per_child: Optional[int], shard_pages: int):
+        self._workers = workers
+        self._shard_pages = shard_pages
+        self._timeout = timeout
+        self._max_pages = max_pages
+        self._max_tasks_per_child = max_tasks_per_child
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: Optional[asyncio.Queue] = None
+        self._spawning: Set[asyncio.Task] = set()
+
+    def start(self):
+        """Crea los procesos de extracción si aún no existen. Debe llamarse con el event loop en ejecución."""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self._workers):
+                self._spawn(self._idle)
+
+    def close(self):
+        """Detiene los procesos libres; los que están ocupados se terminan al liberarse"""
+        idle, self._idle = self._idle, None
+        for task in self._spawning:
+            task.cancel()
+        while idle is not None and not idle.empty():
+            idle.get_nowait().stop()
+
+    async def extract_text(self, path: str) -> ExtractedText:
+        """
+        Extrae el texto de un PDF con los procesos del grupo, repartiendo las páginas entre ellos.
+
+        Args:
+            path: Ruta del archivo PDF
+
+        Returns:
+            Texto del documento y posición donde comienza cada página
+
+        Raises:
+            PageLimitExceeded: Si el PDF supera la cantidad máxima de páginas
+            ExtractionTimeout: Si la extracción de alguna parte supera el tiempo máximo
+        """
+        page_count = await self._run(count_pdf_pages, path, self._max_pages)
+
+        # Si una parte falla se cancelan las demás del mismo documento: las pendientes no llegan a ejecutarse
+        try:
+            async with asyncio.TaskGroup() as group:
+                shards = [group.create_task(self._run(extract_pdf_pages, path, start, end)) for start, end in self.shards(page_count)]
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        pages = [page for shard in shards for page in shard.result()]
+
+        # Las páginas se unen una sola vez; cada offset es el largo acumulado de las páginas anteriores
+        offsets = list(accumulate((len(page) for page in pages[:-1]), initial=0)) if pages else []
+        return ExtractedText(text="".join(pages), pageOffsets=offsets)
+
+    def shards(self, page_count: int) -> List[tuple[int, int]]:
+        """
+        Divide las páginas de un documento en rangos [inicio, fin) de tamaño similar.
+
+        Args:
+            page_count: Cantidad de páginas del documento
+
+        Returns:
+            Rangos de páginas, en orden
+        """
+        if page_count <= 0:
+            return []
+
+        shard_count = max(1, min(self._workers, page_count // self._shard_pages))
+        size = math.ceil(page_count / shard_count)
+        return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+    async def _run(self, function: Callable, *args) -> Any:
+        """Ejecuta una tarea en el primer proceso libre, con el tiempo máximo contado desde que empieza a ejecutarse"""
+        self.start()
+        idle = self._idle
+        worker = await idle.get()
+
+        reusable = False
+        try:
+            result = await asyncio.wait_for(worker.run(function, args), self._timeout)
+            reusable = True
+            return result
+        except asyncio.TimeoutError:
+            raise ExtractionTimeout(f"La extracción del documento superó el máximo de {self._timeout} segundos.")
+        except Exception as e:
+            # Una excepción de la tarea deja el proceso en condiciones de seguir; una caída del proceso, no
+            reusable = worker.process.is_alive() and not isinstance(e, (EOFError, OSError))
+            raise
+        finally:
+            self._release(worker, idle, reusable)
+
+    def _release(self, worker: _ExtractionProcess, idle: asyncio.Queue, reusable: bool):
+        if idle is not self._idle:
+            # El grupo se cerró mientras el proceso estaba ocupado
+            worker.kill()
+            return
+
+        if not reusable:
+            # Tiempo agotado, cancelación o caída: no se puede saber en qué estado quedó el proceso
+            worker.kill()
+            self._spawn(idle)
+        elif self._max_tasks_per_child and worker.tasks >= self._max_tasks_per_child:
+            worker.stop()
+            self._spawn(idle)
+        else:
+            idle.put_nowait(worker)
+
+    def _spawn(self, idle: asyncio.Queue):
+        """Inicia un proceso nuevo y lo agrega a los libres cuando está listo, para no descontar su arranque del tiempo de una tarea"""
+
+        async def spawn():
+            while True:
+                worker = _ExtractionProcess(self._context)
+                try:
+                    await worker.ready()
+                    break
+                except Exception as e:
+                    # Sin reintentar, el grupo quedaría con un proceso menos de forma permanente
+                    print(f"Error al iniciar un proceso de extracción de PDF: {str(e)}")
+                    worker.kill()
+                    await asyncio.sleep(1)
+                except BaseException:
+                    worker.kill()
+                    raise
+
+            if idle is self._idle:
+                idle.put_nowait(worker)
+            else:
+                worker.stop()
+
+        task = asyncio.get_running_loop().create_task(spawn())
+        self._spawning.add(task)
+        task.add_done_callback(self._spawning.discard)
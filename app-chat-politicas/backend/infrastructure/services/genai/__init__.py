@@ -1,3 +1,17 @@
-from infrastructure.services.genai.embeddings import generate_embedding_from_text
+from infrastructure.services.genai.answer_cache import SemanticAnswerCache, semantic_answer_cache
+from infrastructure.services.genai.embedding_cache import EmbeddingCache, query_embedding_cache
+from infrastructure.services.genai.embeddings import generate_embedding_from_text, generate_query_embedding
+from infrastructure.services.genai.summaries import generate_summary_and_metadata
+from infrastructure.services.genai.summary_cache import SummaryCache, summary_cache
 
-__all__ = ['generate_embedding_from_text']
+__all__ = [
+    'EmbeddingCache',
+    'SemanticAnswerCache',
+    'SummaryCache',
+    'generate_embedding_from_text',
+    'generate_query_embedding',
+    'generate_summary_and_metadata',
+    'query_embedding_cache',
+    'semantic_answer_cache',
+    'summary_cache',
+]
@@ -0,0 +1,227 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from beanie import PydanticObjectId
+from beanie.operators import In
+
+from constants import settings
+from domain.chat.entities.chat import CachedAnswer, CachedAnswerIndexView
+from domain.chat.interfaces.answer_cache import AnswerCacheInterface
+from domain.documents.entities.documents import DocumentKnowledge, DocumentVersionView
+from domain.embeddings.entities.embeddings import RetrievalFilters
+
+
+def filters_key(filters: Optional[RetrievalFilters]) -> str:
+    """Representación canónica de los filtros: una respuesta solo se reutiliza con los mismos filtros"""
+    if filters is None or filters.is_empty():
+        return ""
+
+    values = filters.model_dump(mode="json")
+    return "|".join(f"{field}={sorted(value) if isinstance(value, list) else value}" for field, value in sorted(values.items()) if value)
+
+
+class SemanticAnswerCache(AnswerCacheInterface):
+    """
+    Caché semántica de respuestas para preguntas de un solo turno.
+
+    Las entradas se guardan en Mongo (compartidas entre réplicas) y cada réplica mantiene en memoria la matriz
+    normalizada de los embeddings de las preguntas para buscar por similitud coseno. El texto de la respuesta
+    solo se lee desde Mongo cuando hay un acierto, y antes de devolverla se verifica que ningún documento
+    citado haya sido modificado o eliminado desde que se generó.
+    """
+
+    def __init__(self, threshold: float, ttl: int, max_entries: int):
+        self._threshold = threshold
+        self._ttl = timedelta(seconds=ttl)
+        self._max_entries = max_entries
+        self._entries: Dict[str, CachedAnswerIndexView] = {}
+        self._ids: List[str] = []
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self):
+        """Carga desde Mongo las entradas vigentes y elimina las expiradas"""
+        cutoff = datetime.now() - self._ttl
+        await CachedAnswer.find(CachedAnswer.createdAt < cutoff).delete()
+
+        entries = (
+            await CachedAnswer.find(CachedAnswer.createdAt >= cutoff)
+            .sort(-CachedAnswer.createdAt)
+            .limit(self._max_entries)
+            .project(CachedAnswerIndexView)
+            .to_list()
+        )
+        self._entries = {str(entry.id): entry for entry in entries}
+        self._dirty = True
+
+    async def run_maintenance(self, interval: int):
+        """
+        Tarea de fondo que recarga las entradas cada `interval` segundos, para recoger las respuestas
+        guardadas e invalidadas por otras réplicas.
+
+        Args:
+            interval: Segundos entre recargas
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.load()
+            except Exception as e:
+                print(f"Error al recargar la caché semántica de respuestas: {str(e)}")
+
+    async def lookup(self, query_embedding: list[float], filters: Optional[RetrievalFilters] = None) -> Optional[CachedAnswer]:
+        """
+        Busca una respuesta en caché para una pregunta suficientemente similar, cuyos documentos citados
+        no hayan cambiado desde que se generó.
+
+        Args:
+            query_embedding: Embedding de la pregunta
+            filters: Filtros de búsqueda con que se hizo la pregunta
+
+        Returns:
+            La respuesta en caché o None si no hay una vigente
+        """
+        entry_id = self._nearest(query_embedding, filters_key(filters))
+        if entry_id is None:
+            return None
+
+        entry = self._entries[entry_id]
+        if entry.createdAt < datetime.now() - self._ttl or not await self._documents_unchanged(entry):
+            await self._delete([entry_id])
+            return None
+
+        cached = await CachedAnswer.get(PydanticObjectId(entry_id))
+        if cached is None:
+            # Otra réplica la invalidó
+            self._forget([entry_id])
+        return cached
+
+    async def store(
+        self, question: str, query_embedding: list[float], filters: Optional[RetrievalFilters], relevant_docs: List[dict], answer: str
+    ) -> CachedAnswer:
+        """
+        Guarda una respuesta generada junto a los documentos que cita.
+
+        Args:
+            question: Pregunta del usuario
+            query_embedding: Embedding de la pregunta
+            filters: Filtros de búsqueda con que se hizo la pregunta
+            relevant_docs: Documentos relevantes usados como contexto
+            answer: Respuesta completa entregada al usuario
+
+        Returns:
+            La entrada guardada
+        """
+        cached = CachedAnswer(
+            question=question,
+            embedding=query_embedding,
+            filtersKey=filters_key(filters),
+            documentIds=list(dict.fromkeys(doc["document_id"] for doc in relevant_docs)),
+            references=[{"document_url": doc["document_url"], "document_name": doc["title"]} for doc in relevant_docs],
+            answer=answer,
+        )
+        await cached.insert()
+
+        self._entries[str(cached.id)] = CachedAnswerIndexView(
+            _id=cached.id,
+            embedding=cached.embedding,
+            filtersKey=cached.filtersKey,
+            documentIds=cached.documentIds,
+            createdAt=cached.createdAt,
+        )
+        self._dirty = True
+
+        if len(self._entries) > self._max_entries:
+            oldest = min(self._entries.values(), key=lambda item: item.createdAt)
+            await self._delete([str(oldest.id)])
+
+        return cached
+
+    async def invalidate_documents(self, document_ids: Iterable[str]) -> int:
+        """
+        Elimina las respuestas que citan alguno de los documentos indicados.
+
+        Args:
+            document_ids: Ids (ObjectId) de los documentos modificados o eliminados
+
+        Returns:
+            Cantidad de respuestas eliminadas de esta réplica
+        """
+        document_ids = set(document_ids)
+        if not document_ids:
+            return 0
+
+        # Se eliminan también las entradas que esta réplica aún no conoce
+        await CachedAnswer.find(In(CachedAnswer.documentIds, list(document_ids))).delete()
+
+        stale = [entry_id for entry_id, entry in self._entries.items() if document_ids.intersection(entry.documentIds)]
+        self._forget(stale)
+        return len(stale)
+
+    def _nearest(self, query_embedding: list[float], key: str) -> Optional[str]:
+        """Retorna el id de la entrada más similar con los mismos filtros, si supera el umbral"""
+        if not self._entries:
+            return None
+
+        if self._dirty:
+            self._rebuild()
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape[0] != self._matrix.shape[1]:
+            return None
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+
+        scores = self._matrix @ (query / norm)
+        candidates = [index for index, entry_id in enumerate(self._ids) if self._entries[entry_id].filtersKey == key]
+        if not candidates:
+            return None
+
+        best = max(candidates, key=lambda index: scores[index])
+        return self._ids[best] if scores[best] >= self._threshold else None
+
+    async def _documents_unchanged(self, entry: CachedAnswerIndexView) -> bool:
+        """Verifica que todos los documentos citados sigan existiendo y no se hayan modificado después de la respuesta"""
+        documents = (
+            await DocumentKnowledge.find(In(DocumentKnowledge.id, [PydanticObjectId(document_id) for document_id in entry.documentIds]))
+            .project(DocumentVersionView)
+            .to_list()
+        )
+        if len(documents) != len(entry.documentIds):
+            return False
+        return all(document.lastUpdate is None or document.lastUpdate <= entry.createdAt for document in documents)
+
+    async def _delete(self, entry_ids: List[str]):
+        await CachedAnswer.find(In(CachedAnswer.id, [PydanticObjectId(entry_id) for entry_id in entry_ids])).delete()
+        self._forget(entry_ids)
+
+    def _forget(self, entry_ids: Iterable[str]):
+        for entry_id in entry_ids:
+            self._entries.pop(entry_id, None)
+        self._dirty = True
+
+    def _rebuild(self):
+        """Reconstruye la matriz normalizada de embeddings a partir de las entradas en memoria"""
+        self._ids = list(self._entries)
+        if not self._ids:
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+        else:
+            matrix = np.asarray([self._entries[entry_id].embedding for entry_id in self._ids], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+        self._dirty = False
+
+
+# Instancia única de la caché, compartida por todo el proceso
+semantic_answer_cache = SemanticAnswerCache(
+    threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+    ttl=settings.ANSWER_CACHE_TTL,
+    max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+)
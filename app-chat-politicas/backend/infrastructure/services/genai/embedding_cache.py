@@ -0,0 +1,130 @@
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+
+import numpy as np
+from cachetools import TTLCache
+
+from constants import settings
+from infrastructure.services.redis import RedisService
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class EmbeddingCache:
+    """
+    Caché de dos niveles para los embeddings de las consultas.
+
+    - L1: LRU acotado con TTL en memoria del proceso.
+    - L2: Redis, compartido entre réplicas, que guarda el vector como bytes float32 empaquetados.
+
+    La llave es el hash del texto normalizado junto al nombre del modelo, de modo que cambiar de modelo
+    nunca reutiliza vectores de otro espacio.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, redis_ttl: int, prefix: str = "embedding"):
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis_ttl = redis_ttl
+        self._prefix = prefix
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normaliza el texto para que variaciones triviales (mayúsculas, espacios) compartan llave"""
+        return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text)).strip().lower()
+
+    def key(self, text: str, model: str) -> str:
+        """
+        Construye la llave del embedding.
+
+        Args:
+            text: Texto de la consulta
+            model: Nombre del modelo de embeddings
+
+        Returns:
+            Llave con el modelo y el hash SHA-256 del texto normalizado
+        """
+        digest = hashlib.sha256(self.normalize(text).encode("utf-8")).hexdigest()
+        return f"{self._prefix}:{model}:{digest}"
+
+    async def get(self, text: str, model: str) -> Optional[list[float]]:
+        """
+        Busca el embedding en L1 y luego en Redis. Un acierto en Redis se copia a L1.
+
+        Args:
+            text: Texto de la consulta
+            model: Nombre del modelo de embeddings
+
+        Returns:
+            El embedding o None si no está en la caché
+        """
+        key = self.key(text, model)
+
+        embedding = self._local.get(key)
+        if embedding is not None:
+            self.local_hits += 1
+            return embedding
+
+        try:
+            packed = await RedisService.get_async_connection().get(key)
+        except Exception as e:
+            self.redis_errors += 1
+            print(f"Error al obtener embedding de Redis: {str(e)}")
+            packed = None
+
+        if packed is None:
+            self.misses += 1
+            return None
+
+        self.redis_hits += 1
+        embedding = np.frombuffer(packed, dtype=np.float32).tolist()
+        self._local[key] = embedding
+        return embedding
+
+    async def set(self, text: str, model: str, embedding: list[float]):
+        """
+        Guarda el embedding en ambos niveles.
+
+        Args:
+            text: Texto de la consulta
+            model: Nombre del modelo de embeddings
+            embedding: Vector a guardar
+        """
+        key = self.key(text, model)
+        self._local[key] = embedding
+
+        try:
+            await RedisService.get_async_connection().set(key, np.asarray(embedding, dtype=np.float32).tobytes(), ex=self._redis_ttl)
+        except Exception as e:
+            self.redis_errors += 1
+            print(f"Error al guardar embedding en Redis: {str(e)}")
+
+    def stats(self) -> dict:
+        """
+        Contadores de aciertos y fallos desde que se levantó el proceso.
+
+        Returns:
+            Diccionario con los contadores, la tasa de aciertos y el tamaño actual de L1
+        """
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "localHits": self.local_hits,
+            "redisHits": self.redis_hits,
+            "misses": self.misses,
+            "redisErrors": self.redis_errors,
+            "hitRate": (self.local_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "localSize": len(self._local),
+            "localMaxSize": self._local.maxsize,
+        }
+
+
+# Instancia única de la caché, compartida por todo el proceso
+query_embedding_cache = EmbeddingCache(
+    maxsize=settings.EMBEDDING_CACHE_SIZE,
+    ttl=settings.EMBEDDING_CACHE_TTL,
+    redis_ttl=settings.EMBEDDING_CACHE_REDIS_TTL,
+)
@@ -1,4 +1,5 @@
 from constants import openai_client, settings
+from infrastructure.services.genai.embedding_cache import query_embedding_cache
 
 
 async def generate_embedding_from_text(content: str) -> list[float]:
@@ -20,3 +21,24 @@ async def generate_embedding_from_text(content: str) -> list[float]:
     response = await openai_client.embeddings.create(input=[content], model=settings.AZURE_TEXT_EMBEDDING_MODEL_NAME)
 
     return response.data[0].embedding
+
+
+async def generate_query_embedding(query: str) -> list[float]:
+    """
+    Obtiene el embedding de una consulta del chat, reutilizando la caché de dos niveles (memoria y Redis)
+    para no llamar a la API de embeddings por preguntas que ya se han hecho.
+
+    Args:
+        query: Consulta del usuario en texto plano
+
+    Returns:
+        El embedding de la consulta
+    """
+    model = settings.AZURE_TEXT_EMBEDDING_MODEL_NAME
+
+    embedding = await query_embedding_cache.get(query, model)
+    if embedding is None:
+        embedding = await generate_embedding_from_text(query)
+        await query_embedding_cache.set(query, model, embedding)
+
+    return embedding
@@ -0,0 +1,59 @@
+import json
+
+from constants import openai_client, settings
+from domain.documents.entities.documents import DocumentKnowledge
+from infrastructure.services.genai.summary_cache import summary_cache
+
+SUMMARY_INSTRUCTIONS = """
+                    ### Instrucciones
+                    Eres un asistente IA, tu único objetivo es siempre resumir el contenido en español de manera profesional, de manera breve en menos de 200 palabras. Además deberás por cada atributo en el listado de 'labels' buscar dentro del contenido lo solicitado en modo de búsqueda, por ejemplo: Si existe un tag con el valor 'Persona', deberás buscar todas las personas mencionadas en el documento. 
+                    
+                    ### Formato de respuesta
+                    1. Devolver un JSON con dos atributos
+                        1.1 atributo 'summary' todo en español con un máximo de 200 palabras
+                        1.2 atributo 'meta_data' que sera un Array de objetos que tengan la siguiente estructura:
+                            1.2.1 la key del diccionario debe ser el nombre del label según corresponda, por ejemplo si el label se llama "personas" el key se debe llamar igual.
+                            1.2.2 el value debe ser todas las coincidencias encontradas según la instrucción, en el caso de NO encontrar coincidencias dejar el valor 'Sin Información'
+                            1.2.3 la key del diccionario debe estar en lowercase y los espacios en blanco se reemplazan por _
+                        1.3 Devulve el string JSON válido para puedo realizar un parse, por lo cual no añadas triple comillas.
+                    """
+
+
+async def generate_summary_and_metadata(document: DocumentKnowledge) -> tuple[str, list]:
+    """
+    Genera un resumen y metadatos para el documento. Si ya se generaron con las mismas entradas
+    (inicio del contenido, etiquetas y modelo) se reutilizan desde la caché sin llamar al modelo.
+
+    Args:
+        document: Documento para el cual generar el resumen y metadatos
+
+    Returns:
+        Tupla con el resumen y los metadatos
+    """
+    messages = [
+        {"role": "system", "content": SUMMARY_INSTRUCTIONS},
+        {
+            "role": "user",
+            "content": f"""
+                    ### Contenido a resumir: 
+                    {document.content[0:600]}
+
+                    ### Labels
+                    {", ".join(map(lambda label: label.label, document.labels))}
+                    """,
+        },
+    ]
+    model = settings.SUMMARY_MODEL
+    key = summary_cache.key(model, settings.DEFAULT_MODEL_ARGS, messages)
+
+    cached = await summary_cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = await openai_client.chat.completions.create(model=model, messages=messages, **settings.DEFAULT_MODEL_ARGS)
+    response_parsed = json.loads(response.choices[0].message.content)
+    summary = response_parsed["summary"]
+    meta_data = response_parsed["meta_data"]
+
+    await summary_cache.set(key, model, summary, meta_data)
+    return summary, meta_data
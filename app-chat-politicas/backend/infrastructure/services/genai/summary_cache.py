@@ -0,0 +1,114 @@
+import hashlib
+import json
+from typing import Optional
+
+from cachetools import LRUCache
+
+from constants import settings
+from domain.documents.entities.documents import CachedSummary
+
+
+class SummaryCache:
+    """
+    Caché de dos niveles para los resúmenes y metadatos que genera el modelo al procesar un documento.
+
+    - L1: LRU acotado en memoria del proceso.
+    - L2: colección SummaryCache de Mongo, persistente y compartida entre réplicas.
+
+    La llave es el hash de todo lo que recibe el modelo (nombre, parámetros y mensajes), por lo que
+    cambiar el contenido, las etiquetas, las instrucciones o el modelo nunca reutiliza un resumen anterior.
+    """
+
+    def __init__(self, maxsize: int):
+        self._local: LRUCache = LRUCache(maxsize=maxsize)
+        self.local_hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+        self.mongo_errors = 0
+
+    @staticmethod
+    def key(model: str, model_args: dict, messages: list[dict]) -> str:
+        """
+        Construye la llave del resumen.
+
+        Args:
+            model: Nombre del modelo
+            model_args: Parámetros de la llamada (temperatura, etc.)
+            messages: Mensajes enviados al modelo
+
+        Returns:
+            Hash SHA-256 de las entradas de la llamada
+        """
+        payload = json.dumps({"model": model, "args": model_args, "messages": messages}, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[tuple[str, list]]:
+        """
+        Busca el resumen en L1 y luego en Mongo. Un acierto en Mongo se copia a L1.
+
+        Args:
+            key: Llave construida con `key`
+
+        Returns:
+            Tupla con el resumen y los metadatos, o None si no está en la caché
+        """
+        cached = self._local.get(key)
+        if cached is not None:
+            self.local_hits += 1
+            return cached
+
+        try:
+            document = await CachedSummary.get_motor_collection().find_one({"key": key}, {"summary": 1, "metaData": 1})
+        except Exception as e:
+            self.mongo_errors += 1
+            print(f"Error al obtener resumen de la caché: {str(e)}")
+            document = None
+
+        if document is None:
+            self.misses += 1
+            return None
+
+        self.mongo_hits += 1
+        cached = self._local[key] = (document["summary"], document["metaData"])
+        return cached
+
+    async def set(self, key: str, model: str, summary: str, meta_data: list):
+        """
+        Guarda el resumen en ambos niveles. Si otra réplica ya lo guardó se conserva el existente.
+
+        Args:
+            key: Llave construida con `key`
+            model: Nombre del modelo que generó el resumen
+            summary: Resumen del documento
+            meta_data: Metadatos extraídos según las etiquetas
+        """
+        self._local[key] = (summary, meta_data)
+
+        entry = CachedSummary(key=key, model=model, summary=summary, metaData=meta_data)
+        try:
+            await CachedSummary.get_motor_collection().update_one({"key": key}, {"$setOnInsert": entry.model_dump(exclude={"id"})}, upsert=True)
+        except Exception as e:
+            self.mongo_errors += 1
+            print(f"Error al guardar resumen en la caché: {str(e)}")
+
+    def stats(self) -> dict:
+        """
+        Contadores de aciertos y fallos desde que se levantó el proceso.
+
+        Returns:
+            Diccionario con los contadores, la tasa de aciertos y el tamaño actual de L1
+        """
+        lookups = self.local_hits + self.mongo_hits + self.misses
+        return {
+            "localHits": self.local_hits,
+            "mongoHits": self.mongo_hits,
+            "misses": self.misses,
+            "mongoErrors": self.mongo_errors,
+            "hitRate": (self.local_hits + self.mongo_hits) / lookups if lookups else 0.0,
+            "localSize": len(self._local),
+            "localMaxSize": self._local.maxsize,
+        }
+
+
+# Instancia única de la caché, compartida por todo el proceso
+summary_cache = SummaryCache(maxsize=settings.SUMMARY_CACHE_SIZE)
@@ -0,0 +1,53 @@
+from constants import settings
+from domain.ingestion.interfaces.event_bus import IngestionEventBusInterface
+from domain.ingestion.interfaces.job_queue import JobQueueInterface
+from infrastructure.services.ingestion.events import InProcessEventBus, RedisEventBus
+from infrastructure.services.ingestion.queue import InProcessJobQueue, RedisJobQueue
+from infrastructure.services.ingestion.worker import IngestionWorkerPool
+
+
+def create_job_queue() -> JobQueueInterface:
+    """
+    Crea la cola de trabajos de ingesta configurada en INGESTION_QUEUE_BACKEND.
+    """
+    if settings.INGESTION_QUEUE_BACKEND == "memory":
+        return InProcessJobQueue()
+
+    return RedisJobQueue(settings.INGESTION_QUEUE_KEY)
+
+
+def create_event_bus() -> IngestionEventBusInterface:
+    """
+    Crea el canal de eventos de ingesta, con el mismo backend que la cola de trabajos.
+    """
+    if settings.INGESTION_QUEUE_BACKEND == "memory":
+        return InProcessEventBus()
+
+    return RedisEventBus(settings.INGESTION_EVENTS_CHANNEL)
+
+
+# Instancias únicas de la cola, los eventos y los trabajadores, compartidas por todo el proceso
+ingestion_queue = create_job_queue()
+ingestion_events = create_event_bus()
+ingestion_workers = IngestionWorkerPool(
+    ingestion_queue,
+    ingestion_events,
+    workers=settings.INGESTION_WORKERS,
+    max_attempts=settings.INGESTION_MAX_ATTEMPTS,
+    retry_backoff=settings.INGESTION_RETRY_BACKOFF,
+    stale_after=settings.INGESTION_STALE_AFTER,
+    recovery_interval=settings.INGESTION_RECOVERY_INTERVAL,
+)
+
+__all__ = [
+    'InProcessEventBus',
+    'InProcessJobQueue',
+    'IngestionWorkerPool',
+    'RedisEventBus',
+    'RedisJobQueue',
+    'create_event_bus',
+    'create_job_queue',
+    'ingestion_events',
+    'ingestion_queue',
+    'ingestion_workers',
+]
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+from domain.ingestion.entities.ingestion_job import IngestionEvent
+from domain.ingestion.interfaces.event_bus import IngestionEventBusInterface, IngestionSubscriptionInterface
+from infrastructure.services.redis import RedisService
+
+
+class InProcessSubscription(IngestionSubscriptionInterface):
+    def __init__(self, bus: "InProcessEventBus", document_unique_process_id: str):
+        self._bus = bus
+        self._document_unique_process_id = document_unique_process_id
+        self.queue: asyncio.Queue[IngestionEvent] = asyncio.Queue()
+
+    async def get(self, timeout: float) -> Optional[IngestionEvent]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self._bus.unsubscribe(self._document_unique_process_id, self)
+
+
+class InProcessEventBus(IngestionEventBusInterface):
+    """Eventos en memoria del proceso. Solo llegan si el documento se procesa en la misma réplica que atiende la suscripción."""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[InProcessSubscription]] = {}
+
+    async def publish(self, document_unique_process_id: str, event: IngestionEvent):
+        for subscription in self._subscriptions.get(document_unique_process_id, ()):
+            subscription.queue.put_nowait(event)
+
+    async def subscribe(self, document_unique_process_id: str) -> IngestionSubscriptionInterface:
+        subscription = InProcessSubscription(self, document_unique_process_id)
+        self._subscriptions.setdefault(document_unique_process_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, document_unique_process_id: str, subscription: InProcessSubscription):
+        subscriptions = self._subscriptions.get(document_unique_process_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            self._subscriptions.pop(document_unique_process_id, None)
+
+
+class RedisSubscription(IngestionSubscriptionInterface):
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    async def get(self, timeout: float) -> Optional[IngestionEvent]:
+        message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return IngestionEvent.model_validate_json(message["data"])
+
+    async def close(self):
+        await self._pubsub.unsubscribe()
+        await self._pubsub.aclose()
+
+
+class RedisEventBus(IngestionEventBusInterface):
+    """
+    Eventos compartidos entre réplicas con pub/sub de Redis: la réplica que procesa el documento
+    puede ser distinta de la que mantiene abierta la conexión SSE. Los eventos no se guardan; quien
+    se suscribe tarde parte del estado del trabajo en Mongo.
+    """
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+
+    async def publish(self, document_unique_process_id: str, event: IngestionEvent):
+        await RedisService.get_async_connection().publish(self._channel(document_unique_process_id), event.model_dump_json())
+
+    async def subscribe(self, document_unique_process_id: str) -> IngestionSubscriptionInterface:
+        pubsub = RedisService.get_async_connection().pubsub()
+        await pubsub.subscribe(self._channel(document_unique_process_id))
+        return RedisSubscription(pubsub)
+
+    def _channel(self, document_unique_process_id: str) -> str:
+        return f"{self._prefix}:{document_unique_process_id}"
@@ -0,0 +1,37 @@
+import asyncio
+from typing import Optional
+
+from domain.ingestion.interfaces.job_queue import JobQueueInterface
+from infrastructure.services.redis import RedisService
+
+
+class InProcessJobQueue(JobQueueInterface):
+    """Cola en memoria del proceso. Útil para desarrollo y pruebas: los trabajos no se comparten entre réplicas."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def enqueue(self, job_id: str):
+        await self._queue.put(job_id)
+
+    async def dequeue(self, timeout: int) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class RedisJobQueue(JobQueueInterface):
+    """Cola compartida entre réplicas sobre una lista de Redis (LPUSH / BRPOP)"""
+
+    def __init__(self, key: str):
+        self._key = key
+
+    async def enqueue(self, job_id: str):
+        await RedisService.get_async_connection().lpush(self._key, job_id)
+
+    async def dequeue(self, timeout: int) -> Optional[str]:
+        item = await RedisService.get_async_connection().brpop([self._key], timeout=timeout)
+        if item is None:
+            return None
+        return item[1].decode("utf-8")
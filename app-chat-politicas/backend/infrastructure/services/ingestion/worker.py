@@ -0,0 +1,243 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Set
+
+from beanie import UpdateResponse
+from beanie.operators import Inc, Set as SetFields
+
+from domain.ingestion.entities.ingestion_job import IngestionEvent, IngestionEventType, IngestionJob, IngestionJobStatus
+from domain.ingestion.interfaces.event_bus import IngestionEventBusInterface
+from domain.ingestion.interfaces.job_queue import JobQueueInterface
+
+# Segundos que un trabajador espera un trabajo antes de volver a consultar la cola
+DEQUEUE_TIMEOUT = 5
+
+EventCallback = Callable[[IngestionEvent], Awaitable[None]]
+JobHandler = Callable[[str, EventCallback], Awaitable[None]]
+
+
+class IngestionWorkerPool:
+    """
+    Grupo de trabajadores asíncronos que procesan los trabajos de ingesta de la cola.
+
+    La cola solo transporta ids; el estado de cada trabajo vive en Mongo. Un trabajador toma un trabajo
+    cambiando su estado de `queued` a `running` de forma atómica, por lo que un id repetido en la cola
+    (por ejemplo, tras una recuperación) se procesa una sola vez. Si el procesamiento falla se reintenta
+    con espera creciente hasta `max_attempts` intentos. Un trabajo interrumpido al detener los trabajadores
+    vuelve a la cola, y cada `recovery_interval` segundos se vuelven a encolar los que dejaron de avanzar.
+
+    Los eventos de avance que reporta el procesamiento (etapas y chunks procesados) y el resultado de cada
+    intento se guardan en el trabajo y se publican en `events`, para transmitirlos por SSE.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueueInterface,
+        events: IngestionEventBusInterface,
+        workers: int,
+        max_attempts: int,
+        retry_backoff: int,
+        stale_after: int,
+        recovery_interval: int,
+    ):
+        self._queue = queue
+        self._events = events
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._stale_after = timedelta(seconds=stale_after)
+        self._recovery_interval = recovery_interval
+        self._handler: Optional[JobHandler] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+
+    async def start(self, handler: JobHandler):
+        """
+        Recupera los trabajos pendientes y levanta los trabajadores.
+
+        Args:
+            handler: Función que procesa un documento: recibe su uniqueProcessID y una función para reportar eventos de avance
+        """
+        self._handler = handler
+        await self.recover()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self._workers)]
+        self._tasks.append(asyncio.create_task(self._run_recovery()))
+
+    async def stop(self):
+        """Detiene los trabajadores. Los trabajos en curso y los reintentos pendientes vuelven a la cola."""
+        tasks = self._tasks + list(self._retries)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._retries.clear()
+
+    async def recover(self):
+        """
+        Vuelve a encolar los trabajos pendientes y los que quedaron en curso sin avances por más de `stale_after`
+        (por ejemplo, porque la réplica que los procesaba se cayó).
+        """
+        await self.recover_stale()
+        async for item in IngestionJob.get_motor_collection().find({"status": IngestionJobStatus.QUEUED.value}, {"jobId": 1}):
+            await self._queue.enqueue(item["jobId"])
+
+    async def recover_stale(self) -> int:
+        """
+        Vuelve a encolar los trabajos en curso sin avances por más de `stale_after`.
+
+        Returns:
+            Cantidad de trabajos reencolados
+        """
+        stale = datetime.now() - self._stale_after
+        # Los trabajos creados antes de registrar `updatedAt` se evalúan por su inicio
+        query = {
+            "status": IngestionJobStatus.RUNNING.value,
+            "$or": [{"updatedAt": {"$lt": stale}}, {"updatedAt": None, "startedAt": {"$lt": stale}}],
+        }
+        collection = IngestionJob.get_motor_collection()
+        job_ids = [item["jobId"] async for item in collection.find(query, {"jobId": 1})]
+        if not job_ids:
+            return 0
+
+        # La condición se repite por si alguno avanzó entre ambas consultas; encolarlo igual no lo procesa dos veces
+        result = await collection.update_many({**query, "jobId": {"$in": job_ids}}, {"$set": {"status": IngestionJobStatus.QUEUED.value}})
+        for job_id in job_ids:
+            await self._queue.enqueue(job_id)
+        print(f"Trabajos de ingesta abandonados reencolados: {result.modified_count}")
+        return result.modified_count
+
+    async def _run_recovery(self):
+        """Revisa periódicamente los trabajos abandonados por réplicas que se cayeron"""
+        while True:
+            await asyncio.sleep(self._recovery_interval)
+            try:
+                await self.recover_stale()
+            except Exception as e:
+                print(f"Error al recuperar los trabajos de ingesta abandonados: {str(e)}")
+
+    async def _run(self):
+        while True:
+            try:
+                job_id = await self._queue.dequeue(DEQUEUE_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error al leer la cola de ingesta: {str(e)}")
+                await asyncio.sleep(DEQUEUE_TIMEOUT)
+                continue
+
+            if job_id is None:
+                continue
+
+            try:
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Un error fuera del procesamiento (por ejemplo, de Mongo al tomar o cerrar el trabajo) no debe
+                # detener al trabajador; si el trabajo quedó en curso, `recover_stale` lo vuelve a encolar
+                print(f"Error al procesar el trabajo de ingesta {job_id}: {str(e)}")
+
+    async def _process(self, job_id: str):
+        """Toma el trabajo, lo procesa y registra el resultado"""
+        now = datetime.now()
+        job = await IngestionJob.find_one(IngestionJob.jobId == job_id, IngestionJob.status == IngestionJobStatus.QUEUED).update(
+            SetFields(
+                {
+                    IngestionJob.status: IngestionJobStatus.RUNNING,
+                    IngestionJob.startedAt: now,
+                    IngestionJob.updatedAt: now,
+                    IngestionJob.error: None,
+                    IngestionJob.stage: None,
+                    IngestionJob.chunksProcessed: 0,
+                    IngestionJob.tokensUsed: 0,
+                }
+            ),
+            Inc({IngestionJob.attempts: 1}),
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+        if job is None:
+            # Ya lo tomó otro trabajador o ya terminó
+            return
+
+        async def report(event: IngestionEvent):
+            fields = {IngestionJob.updatedAt: datetime.now()}
+            if event.stage is not None:
+                job.stage = fields[IngestionJob.stage] = event.stage
+            if event.type == IngestionEventType.PROGRESS:
+                job.chunksProcessed = fields[IngestionJob.chunksProcessed] = event.chunksProcessed
+                job.tokensUsed = fields[IngestionJob.tokensUsed] = event.tokensUsed
+            await IngestionJob.find_one(IngestionJob.jobId == job_id).update(SetFields(fields))
+            await self._publish(job, event)
+
+        try:
+            await self._publish(job, IngestionEvent(type=IngestionEventType.STATUS))
+            await self._handler(job.documentUniqueProcessID, report)
+        except asyncio.CancelledError:
+            # Los trabajadores se están deteniendo: el trabajo vuelve a la cola aunque la cancelación se repita
+            await asyncio.shield(self._requeue(job))
+            raise
+        except Exception as e:
+            print(f"Error al procesar el trabajo de ingesta {job_id} (intento {job.attempts}): {str(e)}")
+            await self._fail(job, str(e))
+            return
+
+        job.status = IngestionJobStatus.DONE
+        await IngestionJob.find_one(IngestionJob.jobId == job_id).update(
+            SetFields({IngestionJob.status: IngestionJobStatus.DONE, IngestionJob.finishedAt: datetime.now()})
+        )
+        await self._publish(job, IngestionEvent(type=IngestionEventType.DONE))
+
+    async def _fail(self, job: IngestionJob, error: str):
+        """Reencola el trabajo con espera creciente, o lo marca como fallido si agotó los intentos"""
+        if job.attempts >= self._max_attempts:
+            job.status = IngestionJobStatus.FAILED
+            await IngestionJob.find_one(IngestionJob.jobId == job.jobId).update(
+                SetFields({IngestionJob.status: IngestionJobStatus.FAILED, IngestionJob.error: error, IngestionJob.finishedAt: datetime.now()})
+            )
+            await self._publish(job, IngestionEvent(type=IngestionEventType.FAILED, message=error))
+            return
+
+        job.status = IngestionJobStatus.QUEUED
+        await IngestionJob.find_one(IngestionJob.jobId == job.jobId).update(
+            SetFields({IngestionJob.status: IngestionJobStatus.QUEUED, IngestionJob.error: error})
+        )
+        await self._publish(job, IngestionEvent(type=IngestionEventType.RETRY, message=error))
+        retry = asyncio.create_task(self._enqueue_later(job.jobId, self._retry_backoff * job.attempts))
+        self._retries.add(retry)
+        retry.add_done_callback(self._retries.discard)
+
+    async def _requeue(self, job: IngestionJob):
+        """Devuelve a la cola un trabajo interrumpido, sin contar el intento"""
+        try:
+            job.status = IngestionJobStatus.QUEUED
+            await IngestionJob.find_one(IngestionJob.jobId == job.jobId, IngestionJob.status == IngestionJobStatus.RUNNING).update(
+                SetFields({IngestionJob.status: IngestionJobStatus.QUEUED}), Inc({IngestionJob.attempts: -1})
+            )
+            await self._queue.enqueue(job.jobId)
+            await self._publish(job, IngestionEvent(type=IngestionEventType.STATUS))
+        except Exception as e:
+            print(f"Error al reencolar el trabajo de ingesta interrumpido {job.jobId}: {str(e)}")
+
+    async def _publish(self, job: IngestionJob, event: IngestionEvent):
+        """Completa el evento con el estado del trabajo y lo publica. Un error al publicar no interrumpe el procesamiento."""
+        event.jobId = job.jobId
+        event.status = job.status
+        event.stage = event.stage or job.stage
+        event.chunksProcessed = event.chunksProcessed or job.chunksProcessed
+        event.tokensUsed = event.tokensUsed or job.tokensUsed
+        event.elapsedSeconds = round((datetime.now() - job.startedAt).total_seconds(), 2)
+
+        try:
+            await self._events.publish(job.documentUniqueProcessID, event)
+        except Exception as e:
+            print(f"Error al publicar el evento de ingesta del trabajo {job.jobId}: {str(e)}")
+
+    async def _enqueue_later(self, job_id: str, delay: int):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Al detener los trabajadores, el reintento se encola de inmediato para que lo tome otra réplica
+            await asyncio.shield(self._queue.enqueue(job_id))
+            raise
+        await self._queue.enqueue(job_id)
@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 import json
 from typing import Any, Optional
 
@@ -8,6 +9,7 @@ from constants import settings
 class RedisService:
     _instance = None
     _redis_client = None
+    _async_redis_client = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -29,6 +31,18 @@ class RedisService:
             cls()
         return cls._redis_client
 
+    @classmethod
+    def get_async_connection(cls) -> redis.asyncio.Redis:
+        """Retorna la conexión asíncrona a Redis, para usar desde el event loop sin bloquearlo"""
+        if cls._async_redis_client is None:
+            cls._async_redis_client = redis.asyncio.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                password=settings.REDIS_PASSWORD,
+                ssl=True,
+            )
+        return cls._async_redis_client
+
     @classmethod
     async def save_token(cls, email: str, token: str, expiration_time: int = 86400):
         """
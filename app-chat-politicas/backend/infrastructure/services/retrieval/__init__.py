@@ -0,0 +1,48 @@
+import os
+
+from constants import settings
+from infrastructure.services.retrieval.base import BaseVectorIndex
+from infrastructure.services.retrieval.fusion import reciprocal_rank_fusion
+from infrastructure.services.retrieval.lexical_index import Bm25Index
+from infrastructure.services.retrieval.quantized_index import QuantizedVectorIndex
+from infrastructure.services.retrieval.vector_index import InMemoryVectorIndex
+
+
+def create_vector_index() -> BaseVectorIndex:
+    """
+    Crea el motor del índice vectorial configurado en VECTOR_INDEX_ENGINE.
+    """
+    if settings.VECTOR_INDEX_ENGINE == "hnsw":
+        # Importación diferida: chroma-hnswlib solo es necesario para este motor
+        from infrastructure.services.retrieval.hnsw_index import HnswVectorIndex
+
+        return HnswVectorIndex(
+            settings.VECTOR_INDEX_PATH,
+            m=settings.HNSW_M,
+            ef_construction=settings.HNSW_EF_CONSTRUCTION,
+            ef_search=settings.HNSW_EF_SEARCH,
+        )
+
+    if settings.VECTOR_INDEX_ENGINE == "int8":
+        return QuantizedVectorIndex(
+            path=os.path.join(settings.VECTOR_INDEX_PATH, "int8"),
+            rerank_candidates=settings.QUANTIZED_RERANK_CANDIDATES,
+        )
+
+    return InMemoryVectorIndex()
+
+
+# Instancias únicas de los índices, compartidas por todo el proceso
+vector_index = create_vector_index()
+lexical_index = Bm25Index(k1=settings.BM25_K1, b=settings.BM25_B)
+
+__all__ = [
+    'BaseVectorIndex',
+    'Bm25Index',
+    'InMemoryVectorIndex',
+    'QuantizedVectorIndex',
+    'create_vector_index',
+    'lexical_index',
+    'reciprocal_rank_fusion',
+    'vector_index',
+]
@@ -0,0 +1,340 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from bson import ObjectId
+
+from domain.documents.entities.documents import DocumentKnowledge
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, ChunkTombstone, DocumentEmbedding, RetrievalFilters
+from domain.embeddings.interfaces.vector_index import VectorIndexInterface
+from infrastructure.database.mongodb.embedding_codec import decode_embedding
+from infrastructure.services.retrieval.filters import MetadataPostings
+
+# Cantidad de chunks que se leen desde Mongo por consulta durante la sincronización
+SYNC_BATCH_SIZE = 1000
+# Segundos antes de la sincronización anterior que se vuelven a revisar en la incremental: cubren relojes levemente
+# desfasados entre réplicas y escrituras que tardan en confirmarse
+SYNC_LOOKBACK = 120
+
+
+class SyncedChunkIndex:
+    """
+    Lógica común a los índices de búsqueda construidos sobre la colección DocumentEmbedding: carga inicial,
+    sincronización con Mongo y mantenimiento periódico. Cada índice define los campos que lee desde Mongo,
+    cómo los convierte en filas (`_raw_row`, `_row`) y cómo las almacena (`add_many`, `remove_chunks`, `remove_document`, `chunk_ids`).
+
+    La sincronización periódica es incremental: lee los chunks insertados desde la sincronización anterior
+    (por `_id`) y los registros ChunkTombstone de los eliminados. La completa, que compara todos los ids de la
+    colección, se hace al cargar y cada `full_interval` segundos como resguardo.
+
+    La lectura se hace con el cursor de motor sin pasar por Beanie: los documentos llegan como diccionarios y
+    se evita validar con Pydantic cada elemento de los embeddings.
+    """
+
+    is_loaded: bool = False
+    # Nombre del índice utilizado en los mensajes de log
+    name: str = "Índice"
+    # Campos de DocumentEmbedding que necesita el índice
+    raw_projection: Dict[str, int]
+    # Inicio de la última sincronización (incremental o completa) y de la última completa
+    _synced_at: Optional[datetime] = None
+    _reconciled_at: Optional[datetime] = None
+
+    async def load(self):
+        """
+        Restaura el estado persistido del índice (si lo soporta) y lo sincroniza por completo con Mongo,
+        de modo que solo se leen los chunks que faltan en el índice.
+        """
+        restored = self._restore()
+        added, removed = await self.reconcile()
+        self.is_loaded = True
+
+        print(f"{self.name} cargado con {len(self)} chunks (restaurado: {restored}, agregados: {added}, eliminados: {removed}).")
+
+    async def reconcile(self) -> tuple[int, int]:
+        """
+        Sincronización completa: compara los ids de todos los chunks de la colección DocumentEmbedding con los del índice.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        started = datetime.now()
+        # La foto del índice se toma antes de leer Mongo: lo que se agregue durante la
+        # sincronización ya existe en Mongo y no debe considerarse eliminado
+        indexed = self.chunk_ids()
+
+        collection = DocumentEmbedding.get_motor_collection()
+
+        if not indexed:
+            added = 0
+            async for batch in self._iter_batches(collection.find({}, self.raw_projection, batch_size=SYNC_BATCH_SIZE)):
+                self._remember_versions(batch)
+                self.add_many(self._raw_row(item) for item in batch)
+                added += len(batch)
+            self.flush()
+            self._synced_at = self._reconciled_at = started
+            return added, 0
+
+        stored = {}
+        async for item in collection.find({}, {"_id": 1}, batch_size=SYNC_BATCH_SIZE * 10):
+            stored[str(item["_id"])] = item["_id"]
+
+        removed = self.remove_chunks(indexed - stored.keys())
+
+        missing = [stored[chunk_id] for chunk_id in stored.keys() - self.chunk_ids()]
+        added = 0
+        for start in range(0, len(missing), SYNC_BATCH_SIZE):
+            rows = await collection.find({"_id": {"$in": missing[start : start + SYNC_BATCH_SIZE]}}, self.raw_projection).to_list(None)
+            self._remember_versions(rows)
+            self.add_many(self._raw_row(item) for item in rows)
+            added += len(rows)
+
+        self.flush()
+        self._synced_at = self._reconciled_at = started
+        return added, removed
+
+    async def sync(self) -> tuple[int, int]:
+        """
+        Sincronización incremental con la colección DocumentEmbedding: aplica los cambios hechos desde la
+        sincronización anterior, incluidos los de las demás réplicas de la API.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        if self._synced_at is None:
+            return await self.reconcile()
+
+        started = datetime.now()
+        since = self._synced_at - timedelta(seconds=SYNC_LOOKBACK)
+
+        # Primero las eliminaciones: un chunk eliminado después de esta lectura tampoco aparece entre los insertados
+        removed = 0
+        async for tombstone in ChunkTombstone.get_motor_collection().find({"deletedAt": {"$gte": since}}):
+            for document_id in tombstone.get("documentUniqueProcessIDs", []):
+                removed += self.remove_document(document_id)
+            removed += self.remove_chunks(tombstone.get("chunkIds", []))
+
+        added = await self._apply_updates(since)
+
+        # El _id lleva la hora de inserción (UTC); add_many ignora los chunks que ya están en el índice
+        first_id = ObjectId.from_datetime(since.astimezone(timezone.utc))
+        inserted = DocumentEmbedding.get_motor_collection().find({"_id": {"$gte": first_id}}, self.raw_projection, batch_size=SYNC_BATCH_SIZE)
+        async for batch in self._iter_batches(inserted):
+            size = len(self)
+            self.add_many(self._raw_row(item) for item in batch)
+            added += len(self) - size
+
+        self.flush()
+        self._synced_at = started
+        return added, removed
+
+    async def run_maintenance(self, interval: int, full_interval: int):
+        """
+        Tarea de fondo que sincroniza el índice cada `interval` segundos, y por completo cada `full_interval`.
+
+        Args:
+            interval: Segundos entre sincronizaciones incrementales
+            full_interval: Segundos entre sincronizaciones completas (0 las desactiva)
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if full_interval and datetime.now() - self._reconciled_at >= timedelta(seconds=full_interval):
+                    await self.reconcile()
+                else:
+                    await self.sync()
+            except Exception as e:
+                print(f"Error al sincronizar {self.name.lower()}: {str(e)}")
+
+    async def reload_chunks(self, chunk_ids: List[str]):
+        """
+        Vuelve a leer desde Mongo chunks ya indexados, por ejemplo cuando cambian sus atributos filtrables.
+        Se leen todos antes de modificar el índice para que las búsquedas concurrentes no dejen de verlos.
+
+        Args:
+            chunk_ids: Ids de los chunks a recargar
+        """
+        collection = DocumentEmbedding.get_motor_collection()
+        rows = []
+        for start in range(0, len(chunk_ids), SYNC_BATCH_SIZE):
+            ids = [ObjectId(chunk_id) for chunk_id in chunk_ids[start : start + SYNC_BATCH_SIZE]]
+            items = await collection.find({"_id": {"$in": ids}}, self.raw_projection).to_list(None)
+            self._remember_versions(items)
+            rows.extend(self._raw_row(item) for item in items)
+
+        self.remove_chunks(chunk_ids)
+        self.add_many(rows)
+        self.flush()
+
+    def add_embeddings(self, embeddings: Iterable[DocumentEmbedding]):
+        """Agrega al índice documentos DocumentEmbedding recién insertados"""
+        self.add_many(self._row(item) for item in embeddings)
+        self.flush()
+
+    def flush(self):
+        """Persiste los cambios pendientes. Los índices sin persistencia no hacen nada."""
+        pass
+
+    def close(self):
+        """Libera los recursos del índice al bajar la API"""
+        self.flush()
+
+    async def _apply_updates(self, since: datetime) -> int:
+        """
+        Aplica los chunks modificados en Mongo desde `since`. Los índices que solo guardan datos que no cambian
+        en una actualización (el texto de un chunk no se modifica: si cambia, se reemplaza por otro) no hacen nada.
+
+        Returns:
+            Cantidad de chunks agregados
+        """
+        return 0
+
+    def _remember_versions(self, items: List[Dict[str, Any]]):
+        """Registra la versión (lastUpdate) de chunks leídos desde Mongo. Solo la usan los índices que aplican actualizaciones."""
+        pass
+
+    def _row(self, item: DocumentEmbedding) -> tuple:
+        """Convierte un DocumentEmbedding en la fila que recibe `add_many`"""
+        raise NotImplementedError
+
+    def _raw_row(self, document: Dict[str, Any]) -> tuple:
+        """Convierte un documento leído directamente desde Mongo en la fila que recibe `add_many`"""
+        raise NotImplementedError
+
+    def _restore(self) -> bool:
+        """Restaura el estado persistido del índice. Retorna True si había estado que restaurar."""
+        return False
+
+    @staticmethod
+    async def _iter_batches(query, batch_size: int = SYNC_BATCH_SIZE):
+        batch: List = []
+        async for row in query:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class BaseVectorIndex(SyncedChunkIndex, VectorIndexInterface):
+    """
+    Lógica común a los motores de búsqueda vectorial: además de la sincronización de los chunks,
+    mantiene el estado de publicación de los documentos para el filtro `publishedOnly`.
+    Cada motor implementa el almacenamiento y la búsqueda.
+    """
+
+    name = "Índice vectorial"
+    raw_projection = {"documentUniqueProcessID": 1, "embedding": 1, "knowledgeBaseId": 1, "los": 1, "profiles": 1, "lastUpdate": 1}
+    _postings: MetadataPostings
+
+    @property
+    def _versions(self) -> Dict[str, datetime]:
+        """lastUpdate de los chunks agregados o recargados recientemente, para no recargarlos de nuevo sin cambios"""
+        # Los motores no comparten un constructor: el diccionario se crea con el primer uso
+        return self.__dict__.setdefault("_chunk_versions", {})
+
+    async def reconcile(self) -> tuple[int, int]:
+        """
+        Sincronización completa del índice y del estado de publicación de los documentos.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        await self._sync_published()
+        return await super().reconcile()
+
+    async def sync(self) -> tuple[int, int]:
+        """
+        Sincronización incremental del índice y del estado de publicación de los documentos.
+
+        Returns:
+            Tupla (chunks agregados, chunks eliminados)
+        """
+        await self._sync_published()
+        return await super().sync()
+
+    def add_embeddings(self, embeddings: Iterable[DocumentEmbedding]):
+        """Agrega al índice documentos DocumentEmbedding recién insertados"""
+        embeddings = list(embeddings)
+        super().add_embeddings(embeddings)
+        self._remember_versions([{"_id": item.id, "lastUpdate": item.lastUpdate} for item in embeddings])
+
+    async def _apply_updates(self, since: datetime) -> int:
+        """
+        Recarga los chunks cuyo lastUpdate es posterior a `since`: los atributos filtrables (líneas de servicio y
+        perfiles) se actualizan en Mongo sin cambiar el id del chunk, y son filtros de acceso que cada réplica
+        debe reflejar. Los chunks que aún no están en el índice se agregan.
+
+        Returns:
+            Cantidad de chunks agregados
+        """
+        versions = self._versions
+        for chunk_id in [chunk_id for chunk_id, version in versions.items() if version < since]:
+            del versions[chunk_id]
+
+        updated = DocumentEmbedding.get_motor_collection().find({"lastUpdate": {"$gte": since}}, self.raw_projection, batch_size=SYNC_BATCH_SIZE)
+        added = 0
+        async for batch in self._iter_batches(updated):
+            changed = [item for item in batch if versions.get(str(item["_id"])) != item["lastUpdate"]]
+            if not changed:
+                continue
+
+            self._remember_versions(changed)
+            size = len(self)
+            # Se quitan y se vuelven a agregar para reemplazar los atributos guardados
+            reloaded = self.remove_chunks(str(item["_id"]) for item in changed)
+            self.add_many(self._raw_row(item) for item in changed)
+            added += len(self) - size + reloaded
+
+        return added
+
+    def _remember_versions(self, items: List[Dict[str, Any]]):
+        # Solo interesan los chunks que la próxima sincronización incremental volverá a leer
+        recent = datetime.now() - timedelta(seconds=2 * SYNC_LOOKBACK)
+        versions = self._versions
+        for item in items:
+            version = item.get("lastUpdate")
+            if version is not None and version >= recent:
+                # Mongo guarda las fechas con precisión de milisegundos
+                versions[str(item["_id"])] = version.replace(microsecond=version.microsecond - version.microsecond % 1000)
+
+    async def _sync_published(self):
+        # El estado de publicación vive en el documento, no en sus chunks
+        published = DocumentKnowledge.get_motor_collection().find({"isPublished": True}, {"uniqueProcessID": 1})
+        self._postings.set_published_documents([item["uniqueProcessID"] async for item in published])
+
+    def set_document_published(self, document_unique_process_id: str, published: bool):
+        """
+        Actualiza el estado de publicación de un documento, usado por el filtro `publishedOnly`.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+            published: Si el documento está publicado
+        """
+        self._postings.set_document_published(document_unique_process_id, published)
+
+    def _allowed_positions(
+        self, filters: Optional[RetrievalFilters], candidates: Optional[Iterable[str]], position_by_chunk: Dict[str, int]
+    ) -> Optional[Set[int]]:
+        """
+        Combina los filtros y los chunks candidatos en el conjunto de posiciones que se pueden puntuar.
+
+        Returns:
+            Conjunto de posiciones permitidas, o None si se puede buscar en todo el índice
+        """
+        allowed = self._postings.resolve(filters)
+        if candidates is None:
+            return allowed
+
+        candidate_positions = {position_by_chunk[chunk_id] for chunk_id in candidates if chunk_id in position_by_chunk}
+        return candidate_positions if allowed is None else allowed & candidate_positions
+
+    def _row(self, item: DocumentEmbedding) -> tuple[str, str, np.ndarray, ChunkFilterAttributes]:
+        attributes = ChunkFilterAttributes(knowledgeBaseId=str(item.knowledgeBaseId), los=item.los, profiles=item.profiles)
+        return str(item.id), item.documentUniqueProcessID, decode_embedding(item.embedding), attributes
+
+    def _raw_row(self, document: Dict[str, Any]) -> tuple[str, str, np.ndarray, ChunkFilterAttributes]:
+        attributes = ChunkFilterAttributes(knowledgeBaseId=str(document["knowledgeBaseId"]), los=document["los"], profiles=document["profiles"])
+        return str(document["_id"]), document["documentUniqueProcessID"], decode_embedding(document["embedding"]), attributes
@@ -0,0 +1,140 @@
+from enum import Enum
+from typing import Dict, Iterable, Optional, Set
+
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, RetrievalFilters
+
+# Campos del chunk con listas de posiciones precalculadas
+LOS_FIELD = "los"
+PROFILES_FIELD = "profiles"
+KNOWLEDGE_BASE_FIELD = "knowledgeBaseId"
+
+
+def _value(value) -> str:
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+class MetadataPostings:
+    """
+    Listas de posiciones (posting lists) por cada valor de los atributos filtrables de los chunks.
+
+    Las posiciones son las filas (o etiquetas) que cada motor usa para sus vectores, de modo que un filtro
+    se resuelve como unión/intersección de conjuntos antes de calcular similitudes, y solo se puntúa
+    la porción del corpus que corresponde al usuario.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, Set[int]]] = {LOS_FIELD: {}, PROFILES_FIELD: {}, KNOWLEDGE_BASE_FIELD: {}}
+        self._attributes: Dict[int, ChunkFilterAttributes] = {}
+        self._document_by_position: Dict[int, str] = {}
+        self._positions_by_document: Dict[str, Set[int]] = {}
+        self._published_documents: Set[str] = set()
+        self._published_positions: Set[int] = set()
+
+    def clear(self):
+        """Elimina todas las posiciones, manteniendo los documentos publicados"""
+        for values in self._postings.values():
+            values.clear()
+        self._attributes.clear()
+        self._document_by_position.clear()
+        self._positions_by_document.clear()
+        self._published_positions.clear()
+
+    def attributes(self, position: int) -> ChunkFilterAttributes:
+        """Obtiene los atributos registrados para una posición"""
+        return self._attributes[position]
+
+    def add(self, position: int, document_id: str, attributes: ChunkFilterAttributes):
+        """
+        Registra los atributos de una posición del índice.
+
+        Args:
+            position: Fila o etiqueta del chunk en el motor
+            document_id: uniqueProcessID del documento
+            attributes: Atributos filtrables del chunk
+        """
+        self._attributes[position] = attributes
+        self._document_by_position[position] = document_id
+        self._positions_by_document.setdefault(document_id, set()).add(position)
+
+        for field, value in self._field_values(attributes):
+            self._postings[field].setdefault(value, set()).add(position)
+
+        if document_id in self._published_documents:
+            self._published_positions.add(position)
+
+    def remove(self, position: int):
+        """Quita una posición de todas las listas"""
+        attributes = self._attributes.pop(position, None)
+        if attributes is None:
+            return
+
+        for field, value in self._field_values(attributes):
+            positions = self._postings[field].get(value)
+            if positions is not None:
+                positions.discard(position)
+                if not positions:
+                    self._postings[field].pop(value, None)
+
+        document_id = self._document_by_position.pop(position)
+        document_positions = self._positions_by_document.get(document_id)
+        if document_positions is not None:
+            document_positions.discard(position)
+            if not document_positions:
+                self._positions_by_document.pop(document_id, None)
+
+        self._published_positions.discard(position)
+
+    def set_published_documents(self, document_ids: Iterable[str]):
+        """Reemplaza el conjunto de documentos publicados"""
+        self._published_documents = set(document_ids)
+        self._published_positions = {
+            position for document_id in self._published_documents for position in self._positions_by_document.get(document_id, ())
+        }
+
+    def set_document_published(self, document_id: str, published: bool):
+        """Actualiza el estado de publicación de un documento"""
+        positions = self._positions_by_document.get(document_id, set())
+        if published:
+            self._published_documents.add(document_id)
+            self._published_positions |= positions
+        else:
+            self._published_documents.discard(document_id)
+            self._published_positions -= positions
+
+    def resolve(self, filters: Optional[RetrievalFilters]) -> Optional[Set[int]]:
+        """
+        Resuelve los filtros a las posiciones permitidas.
+
+        Args:
+            filters: Filtros de la búsqueda
+
+        Returns:
+            Conjunto de posiciones permitidas, o None si no hay filtros que aplicar
+        """
+        if filters is None or filters.is_empty():
+            return None
+
+        selections = []
+        if filters.publishedOnly:
+            selections.append(self._published_positions)
+        for field, values in ((LOS_FIELD, filters.los), (PROFILES_FIELD, filters.profiles), (KNOWLEDGE_BASE_FIELD, filters.knowledgeBaseIds)):
+            if values:
+                postings = self._postings[field]
+                selections.append(set().union(*(postings.get(_value(value), ()) for value in values)))
+
+        # Se intersecta partiendo por la selección más pequeña
+        selections.sort(key=len)
+        allowed = set(selections[0])
+        for selection in selections[1:]:
+            if not allowed:
+                break
+            allowed &= selection
+        return allowed
+
+    @staticmethod
+    def _field_values(attributes: ChunkFilterAttributes):
+        yield KNOWLEDGE_BASE_FIELD, _value(attributes.knowledgeBaseId)
+        for value in attributes.los:
+            yield LOS_FIELD, _value(value)
+        for value in attributes.profiles:
+            yield PROFILES_FIELD, _value(value)
@@ -0,0 +1,22 @@
+from typing import Dict, List
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[tuple[str, float]]:
+    """
+    Combina varios rankings con Reciprocal Rank Fusion: cada elemento suma 1 / (k + posición) por cada
+    ranking en que aparece. Solo usa posiciones, por lo que no hace falta normalizar puntajes de
+    escalas distintas (similitud coseno y BM25).
+
+    Args:
+        rankings: Listas de ids ordenadas de mejor a peor
+        k: Constante de suavizado; valores mayores reducen el peso de las primeras posiciones
+
+    Returns:
+        Tuplas (id, puntaje) ordenadas por puntaje descendente
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for position, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + position)
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
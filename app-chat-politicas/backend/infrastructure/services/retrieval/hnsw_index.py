@@ -0,0 +1,330 @@
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional, Set
+
+import hnswlib
+import numpy as np
+
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, RetrievalFilters, VectorSearchHit
+from infrastructure.services.retrieval.base import BaseVectorIndex
+from infrastructure.services.retrieval.filters import MetadataPostings
+
+# Capacidad mínima del grafo al crecer, para no redimensionarlo en cada inserción
+MIN_CAPACITY = 1024
+
+# Con filtros que dejan pocos chunks es más barato calcular la similitud exacta que recorrer el grafo
+EXACT_SEARCH_LIMIT = 2000
+
+
+class HnswVectorIndex(BaseVectorIndex):
+    """
+    Índice vectorial aproximado (HNSW) con persistencia incremental en disco.
+
+    El grafo se guarda con el modo persistente de chroma-hnswlib (`persist_dirty` solo escribe los
+    elementos modificados) y la relación etiqueta -> chunk se guarda en un log de solo escritura al final,
+    que se compacta al restaurar. Al levantar la API se restaura el índice desde disco y solo se leen
+    desde Mongo los chunks que falten.
+
+    Los filtros se resuelven con las listas de etiquetas por valor de atributo: si dejan pocos chunks se
+    calcula la similitud exacta sobre ellos, y si no se recorre el grafo descartando las etiquetas no permitidas.
+    """
+
+    def __init__(self, path: str, m: int = 16, ef_construction: int = 200, ef_search: int = 64):
+        self._path = path
+        self._graph_path = os.path.join(path, "graph")
+        self._log_path = os.path.join(path, "labels.log")
+        self._m = m
+        self._ef_construction = ef_construction
+        self._ef_search = ef_search
+
+        self._index: Optional[hnswlib.Index] = None
+        # Solo después de intentar restaurar desde disco se puede crear un grafo nuevo en su lugar
+        self._restore_attempted = False
+        self._next_label = 0
+        self._chunk_by_label: Dict[int, str] = {}
+        self._document_by_label: Dict[int, str] = {}
+        self._label_by_chunk: Dict[str, int] = {}
+        self._labels_by_document: Dict[str, Set[int]] = {}
+        self._pending_log: List[str] = []
+        self._postings = MetadataPostings()
+
+    def __len__(self) -> int:
+        return len(self._label_by_chunk)
+
+    def chunk_ids(self) -> Set[str]:
+        """Obtiene los ids de los chunks indexados"""
+        return set(self._label_by_chunk)
+
+    def add_many(self, rows: Iterable[tuple[str, str, np.ndarray, ChunkFilterAttributes]]):
+        """
+        Agrega chunks al índice.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, embedding, atributos filtrables)
+        """
+        rows = [row for row in rows if row[0] not in self._label_by_chunk]
+        if not rows:
+            return
+
+        vectors = np.asarray([embedding for _, _, embedding, _ in rows], dtype=np.float32)
+        self._ensure_capacity(len(rows), vectors.shape[1])
+
+        labels = np.arange(self._next_label, self._next_label + len(rows), dtype=np.int64)
+        self._next_label += len(rows)
+
+        # replace_deleted reutiliza los espacios de los elementos eliminados
+        self._index.add_items(vectors, labels, replace_deleted=True)
+
+        for label, (chunk_id, document_id, _, attributes) in zip(labels.tolist(), rows):
+            self._register(label, chunk_id, document_id, attributes)
+            self._pending_log.append(self._log_entry(label))
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Quita chunks del índice.
+
+        Args:
+            chunk_ids: Ids de los chunks a eliminar
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        labels = [self._label_by_chunk[chunk_id] for chunk_id in chunk_ids if chunk_id in self._label_by_chunk]
+        for label in labels:
+            self._delete_label(label)
+
+        self.flush()
+        return len(labels)
+
+    def remove_document(self, document_unique_process_id: str) -> int:
+        """
+        Quita del índice todos los chunks de un documento.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        labels = list(self._labels_by_document.get(document_unique_process_id, ()))
+        for label in labels:
+            self._delete_label(label)
+
+        self.flush()
+        return len(labels)
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        threshold: float,
+        filters: Optional[RetrievalFilters] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[VectorSearchHit]:
+        """
+        Busca los chunks más similares a la consulta.
+
+        Args:
+            query_embedding: Embedding de la consulta
+            top_k: Cantidad máxima de resultados
+            threshold: Similitud coseno mínima
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
+            candidates: Ids de los únicos chunks a considerar (por ejemplo, los preseleccionados por la búsqueda léxica)
+
+        Returns:
+            Resultados ordenados por similitud descendente
+        """
+        allowed = self._allowed_positions(filters, candidates, self._label_by_chunk)
+        k = min(top_k, len(self) if allowed is None else len(allowed))
+        if k <= 0:
+            return []
+
+        query = np.asarray([query_embedding], dtype=np.float32)
+        if allowed is not None and len(allowed) <= EXACT_SEARCH_LIMIT:
+            labels, similarities = self._exact_search(query[0], sorted(allowed), k)
+        else:
+            self._index.set_ef(max(self._ef_search, k))
+            if allowed is None:
+                labels, distances = self._index.knn_query(query, k=k)
+            else:
+                # El filtro se evalúa en Python por cada nodo visitado, por eso se usa un solo hilo
+                labels, distances = self._index.knn_query(query, k=k, num_threads=1, filter=allowed.__contains__)
+            # En el espacio "cosine" la distancia es 1 - similitud
+            labels, similarities = labels[0].tolist(), (1.0 - distances[0]).tolist()
+
+        hits = []
+        for label, similarity in zip(labels, similarities):
+            if similarity >= threshold and label in self._chunk_by_label:
+                hits.append(
+                    VectorSearchHit(
+                        chunkId=self._chunk_by_label[label],
+                        documentUniqueProcessID=self._document_by_label[label],
+                        similarity=similarity,
+                    )
+                )
+        return hits
+
+    def flush(self):
+        """Persiste en disco los elementos modificados del grafo y las etiquetas pendientes"""
+        if self._index is None:
+            return
+
+        self._index.persist_dirty()
+
+        if self._pending_log:
+            with open(self._log_path, "a", encoding="utf-8") as log:
+                log.writelines(self._pending_log)
+            self._pending_log = []
+
+    def close(self):
+        """Persiste los cambios pendientes y cierra los archivos del grafo"""
+        self.flush()
+        if self._index is not None:
+            self._index.close_file_handles()
+
+    def _restore(self) -> bool:
+        """Restaura el grafo y las etiquetas desde disco, descartando lo que quedó a medio escribir"""
+        self._restore_attempted = True
+        if not os.path.exists(os.path.join(self._graph_path, "header.bin")) or not os.path.exists(self._log_path):
+            return False
+
+        with open(self._log_path, encoding="utf-8") as log:
+            entries: Dict[int, tuple[str, str, ChunkFilterAttributes]] = {}
+            for line in log:
+                parts = line.rstrip("\n").split("\t")
+                if parts[0] == "+" and len(parts) == 7:
+                    attributes = ChunkFilterAttributes(
+                        knowledgeBaseId=parts[4],
+                        los=parts[5].split(",") if parts[5] else [],
+                        profiles=parts[6].split(",") if parts[6] else [],
+                    )
+                    entries[int(parts[1])] = (parts[2], parts[3], attributes)
+                elif parts[0] == "-" and len(parts) == 2:
+                    entries.pop(int(parts[1]), None)
+
+        dimension = self._read_dimension()
+        if dimension is None:
+            return False
+
+        index = hnswlib.Index(space="cosine", dim=dimension)
+        try:
+            index.load_index(self._graph_path, allow_replace_deleted=True, is_persistent_index=True)
+        except Exception as e:
+            # El grafo se reconstruye desde Mongo al agregar el primer chunk
+            print(f"Error al restaurar el índice HNSW desde {self._graph_path}, se reconstruirá: {str(e)}")
+            return False
+        self._index = index
+
+        graph_labels = set(self._index.get_ids_list())
+        for label, (chunk_id, document_id, attributes) in entries.items():
+            if label in graph_labels:
+                self._register(label, chunk_id, document_id, attributes)
+
+        # Etiquetas del grafo sin registro en el log (escritura interrumpida o log de una versión
+        # anterior sin atributos): se eliminan y la sincronización vuelve a agregar sus chunks
+        for label in graph_labels - set(self._chunk_by_label):
+            try:
+                self._index.mark_deleted(label)
+            except RuntimeError:
+                pass
+
+        self._next_label = max(graph_labels, default=-1) + 1
+        self._rewrite_log()
+        return True
+
+    def _exact_search(self, query: np.ndarray, labels: List[int], k: int) -> tuple[List[int], List[float]]:
+        """Calcula la similitud coseno exacta contra las etiquetas indicadas y retorna las k mejores"""
+        vectors = np.asarray(self._index.get_items(labels), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1)
+        norms[norms == 0] = 1.0
+        query_norm = np.linalg.norm(query) or 1.0
+
+        scores = (vectors @ query) / (norms * query_norm)
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [labels[idx] for idx in best], scores[best].tolist()
+
+    def _read_dimension(self) -> Optional[int]:
+        meta_path = os.path.join(self._path, "dimension")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as meta:
+            return int(meta.read().strip())
+
+    def _rewrite_log(self):
+        """Compacta el log de etiquetas dejando solo los chunks vigentes"""
+        tmp_path = f"{self._log_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as log:
+            log.writelines(self._log_entry(label) for label in self._chunk_by_label)
+        os.replace(tmp_path, self._log_path)
+
+    def _ensure_capacity(self, extra: int, dimension: int):
+        if self._index is None:
+            if not self._restore_attempted:
+                # Sin intentar restaurar, los archivos en disco pueden ser de un índice válido (por ejemplo, el de la API
+                # si esto corre en otro proceso) y crear uno nuevo los borraría
+                raise RuntimeError("El índice HNSW se debe cargar con load() antes de agregar chunks")
+
+            # Se descartan los archivos de un índice anterior que no se pudo restaurar
+            shutil.rmtree(self._graph_path, ignore_errors=True)
+            os.makedirs(self._graph_path, exist_ok=True)
+            with open(os.path.join(self._path, "dimension"), "w", encoding="utf-8") as meta:
+                meta.write(str(dimension))
+            # Se descarta cualquier log de un índice anterior
+            open(self._log_path, "w").close()
+
+            self._index = hnswlib.Index(space="cosine", dim=dimension)
+            self._index.init_index(
+                max_elements=max(extra, MIN_CAPACITY),
+                M=self._m,
+                ef_construction=self._ef_construction,
+                allow_replace_deleted=True,
+                is_persistent_index=True,
+                persistence_location=self._graph_path,
+            )
+
+        if self._index.dim != dimension:
+            raise ValueError(f"Dimensión del embedding ({dimension}) distinta a la del índice ({self._index.dim})")
+
+        required = self._index.get_current_count() + extra
+        capacity = self._index.get_max_elements()
+        if required > capacity:
+            self._index.resize_index(max(required, capacity * 2))
+
+    def _log_entry(self, label: int) -> str:
+        attributes = self._postings.attributes(label)
+        fields = [
+            str(label),
+            self._chunk_by_label[label],
+            self._document_by_label[label],
+            attributes.knowledgeBaseId,
+            ",".join(attributes.los),
+            ",".join(attributes.profiles),
+        ]
+        return "+\t" + "\t".join(fields) + "\n"
+
+    def _register(self, label: int, chunk_id: str, document_id: str, attributes: ChunkFilterAttributes):
+        self._chunk_by_label[label] = chunk_id
+        self._document_by_label[label] = document_id
+        self._label_by_chunk[chunk_id] = label
+        self._labels_by_document.setdefault(document_id, set()).add(label)
+        self._postings.add(label, document_id, attributes)
+
+    def _delete_label(self, label: int):
+        chunk_id = self._chunk_by_label.pop(label)
+        document_id = self._document_by_label.pop(label)
+        self._label_by_chunk.pop(chunk_id, None)
+        self._postings.remove(label)
+
+        document_labels = self._labels_by_document.get(document_id)
+        if document_labels is not None:
+            document_labels.discard(label)
+            if not document_labels:
+                self._labels_by_document.pop(document_id, None)
+
+        try:
+            self._index.mark_deleted(label)
+        except RuntimeError:
+            # El elemento ya estaba marcado como eliminado en el grafo persistido
+            pass
+        self._pending_log.append(f"-\t{label}\n")
@@ -0,0 +1,225 @@
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Set
+
+import numpy as np
+
+from domain.embeddings.entities.embeddings import DocumentEmbedding, LexicalSearchHit
+from domain.embeddings.interfaces.lexical_index import LexicalIndexInterface
+from infrastructure.services.retrieval.base import SyncedChunkIndex
+from infrastructure.services.retrieval.tokenizer import tokenize
+
+# Frecuencia máxima de un término dentro de un chunk (las frecuencias se guardan en 16 bits)
+MAX_TERM_FREQUENCY = 65535
+
+
+class Bm25Index(SyncedChunkIndex, LexicalIndexInterface):
+    """
+    Índice invertido en memoria con puntaje BM25 sobre el texto de los chunks.
+
+    Cada término guarda su lista de posiciones como dos arreglos compactos (`array`): las filas de los chunks
+    (enteros de 32 bits) y la frecuencia del término en cada una (16 bits). Las filas se agregan en orden,
+    por lo que insertar es solo extender los arreglos; al eliminar se marca la fila como inactiva y el
+    índice se compacta cuando las filas inactivas superan a las activas.
+    """
+
+    name = "Índice léxico"
+    raw_projection = {"documentUniqueProcessID": 1, "contentChunk": 1}
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self._k1 = k1
+        self._b = b
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._row_by_chunk)
+
+    def clear(self):
+        """Elimina todas las filas del índice"""
+        self._postings: Dict[str, tuple[array, array]] = {}
+        self._lengths = array("i")
+        self._alive = bytearray()
+        self._chunk_ids: List[str] = []
+        self._document_ids: List[str] = []
+        self._row_by_chunk: Dict[str, int] = {}
+        self._rows_by_document: Dict[str, List[int]] = {}
+        self._total_length = 0
+
+    def chunk_ids(self) -> Set[str]:
+        """Obtiene los ids de los chunks indexados"""
+        return set(self._row_by_chunk)
+
+    def add_many(self, rows: Iterable[tuple[str, str, str]]):
+        """
+        Agrega chunks al índice.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, texto del chunk)
+        """
+        for chunk_id, document_id, text in rows:
+            if chunk_id in self._row_by_chunk:
+                continue
+
+            terms = tokenize(text)
+            row = len(self._chunk_ids)
+
+            for term, frequency in Counter(terms).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("i"), array("H"))
+                postings[0].append(row)
+                postings[1].append(min(frequency, MAX_TERM_FREQUENCY))
+
+            self._lengths.append(len(terms))
+            self._alive.append(1)
+            self._chunk_ids.append(chunk_id)
+            self._document_ids.append(document_id)
+            self._row_by_chunk[chunk_id] = row
+            self._rows_by_document.setdefault(document_id, []).append(row)
+            self._total_length += len(terms)
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Quita chunks del índice.
+
+        Args:
+            chunk_ids: Ids de los chunks a eliminar
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        removed = 0
+        for chunk_id in chunk_ids:
+            row = self._row_by_chunk.pop(chunk_id, None)
+            if row is None:
+                continue
+
+            self._deactivate(row)
+            document_rows = self._rows_by_document.get(self._document_ids[row], [])
+            document_rows.remove(row)
+            if not document_rows:
+                self._rows_by_document.pop(self._document_ids[row], None)
+            removed += 1
+
+        self._compact_if_needed()
+        return removed
+
+    def remove_document(self, document_unique_process_id: str) -> int:
+        """
+        Quita del índice todos los chunks de un documento.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        rows = self._rows_by_document.pop(document_unique_process_id, [])
+        for row in rows:
+            self._row_by_chunk.pop(self._chunk_ids[row], None)
+            self._deactivate(row)
+
+        self._compact_if_needed()
+        return len(rows)
+
+    def search(self, query: str, top_k: int) -> List[LexicalSearchHit]:
+        """
+        Busca los chunks que mejor coinciden con las palabras de la consulta.
+
+        Args:
+            query: Consulta del usuario en texto plano
+            top_k: Cantidad máxima de resultados
+
+        Returns:
+            Resultados ordenados por puntaje descendente
+        """
+        live = len(self._row_by_chunk)
+        if not live:
+            return []
+
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        lengths = np.frombuffer(self._lengths, dtype=np.int32)
+        average_length = self._total_length / live or 1.0
+        # Normalización por largo del chunk, común a todos los términos
+        length_norm = self._k1 * (1.0 - self._b + self._b * lengths / average_length)
+
+        scores = np.zeros(len(self._chunk_ids), dtype=np.float32)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+
+            rows = np.frombuffer(postings[0], dtype=np.int32)
+            frequencies = np.frombuffer(postings[1], dtype=np.uint16).astype(np.float32)
+            keep = alive[rows]
+            rows, frequencies = rows[keep], frequencies[keep]
+
+            document_frequency = rows.shape[0]
+            if not document_frequency:
+                continue
+
+            idf = math.log(1.0 + (live - document_frequency + 0.5) / (document_frequency + 0.5))
+            # Cada fila aparece una sola vez en la lista de un término, así que la suma indexada es segura
+            scores[rows] += idf * frequencies * (self._k1 + 1.0) / (frequencies + length_norm[rows])
+
+        matched = np.flatnonzero(scores)
+        k = min(top_k, matched.shape[0])
+        if k <= 0:
+            return []
+
+        best = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        best = best[np.argsort(-scores[best])]
+
+        return [
+            LexicalSearchHit(chunkId=self._chunk_ids[row], documentUniqueProcessID=self._document_ids[row], score=float(scores[row])) for row in best
+        ]
+
+    def _row(self, item: DocumentEmbedding) -> tuple[str, str, str]:
+        return str(item.id), item.documentUniqueProcessID, item.contentChunk
+
+    def _raw_row(self, document: Dict[str, Any]) -> tuple[str, str, str]:
+        return str(document["_id"]), document["documentUniqueProcessID"], document["contentChunk"]
+
+    def _deactivate(self, row: int):
+        self._alive[row] = 0
+        self._total_length -= self._lengths[row]
+
+    def _compact_if_needed(self):
+        # Compactamos cuando más de la mitad de las filas están inactivas
+        if self._chunk_ids and len(self._row_by_chunk) < len(self._chunk_ids) // 2:
+            self._compact()
+
+    def _compact(self):
+        """Reconstruye las listas de posiciones descartando las filas eliminadas y renumerando las vigentes"""
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        keep = np.flatnonzero(alive)
+        new_row = np.full(alive.shape[0], -1, dtype=np.int32)
+        new_row[keep] = np.arange(keep.shape[0], dtype=np.int32)
+
+        postings = {}
+        for term, (rows, frequencies) in self._postings.items():
+            rows = np.frombuffer(rows, dtype=np.int32)
+            mask = alive[rows]
+            if not mask.any():
+                continue
+            postings[term] = (
+                array("i", new_row[rows[mask]].tobytes()),
+                array("H", np.frombuffer(frequencies, dtype=np.uint16)[mask].tobytes()),
+            )
+
+        lengths = np.frombuffer(self._lengths, dtype=np.int32)[keep]
+        chunk_ids = [self._chunk_ids[row] for row in keep]
+        document_ids = [self._document_ids[row] for row in keep]
+
+        self.clear()
+        self._postings = postings
+        self._lengths = array("i", lengths.tobytes())
+        self._alive = bytearray(b"\x01" * len(chunk_ids))
+        self._chunk_ids = chunk_ids
+        self._document_ids = document_ids
+        self._total_length = int(lengths.sum())
+
+        for row, (chunk_id, document_id) in enumerate(zip(chunk_ids, document_ids)):
+            self._row_by_chunk[chunk_id] = row
+            self._rows_by_document.setdefault(document_id, []).append(row)
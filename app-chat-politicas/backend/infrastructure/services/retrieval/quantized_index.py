@@ -0,0 +1,163 @@
+import os
+import tempfile
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, RetrievalFilters, VectorSearchHit
+from infrastructure.services.retrieval.vector_index import InMemoryVectorIndex
+
+# Filas que se convierten a float32 por vez durante el recorrido aproximado: bloques chicos quedan en la caché
+# del procesador y el recorrido cuesta lo mismo que el producto float32 completo
+SCAN_BLOCK_ROWS = 128
+
+
+class QuantizedVectorIndex(InMemoryVectorIndex):
+    """
+    Índice vectorial exacto con primera pasada sobre embeddings cuantizados a int8.
+
+    Cada embedding normalizado se guarda como int8 con una escala float32 por fila (cuantización simétrica),
+    lo que reduce ~4x la memoria residente. La búsqueda puntúa todo el corpus con la copia int8 y luego
+    recalcula la similitud exacta en float32 solo para los `rerank_candidates` mejores.
+
+    La matriz float32 se guarda en un archivo mapeado en memoria (`np.memmap`) dentro de `path`: el sistema
+    operativo mantiene en RAM solo las páginas que se leen al re-puntuar. Sin `path` queda en memoria.
+    """
+
+    def __init__(self, path: Optional[str] = None, rerank_candidates: int = 300):
+        super().__init__()
+        self._path = path
+        self._rerank_candidates = rerank_candidates
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+
+    def clear(self):
+        """Elimina todas las filas del índice"""
+        super().clear()
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+
+    def add_many(self, rows: Iterable[tuple[str, str, np.ndarray, ChunkFilterAttributes]]):
+        """
+        Agrega chunks al índice.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, embedding, atributos filtrables)
+        """
+        start = self._size
+        super().add_many(rows)
+        self._quantize(start, self._size)
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        threshold: float,
+        filters: Optional[RetrievalFilters] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[VectorSearchHit]:
+        """
+        Busca los chunks más similares a la consulta: preselecciona con los embeddings int8 y ordena
+        con la similitud exacta en float32.
+
+        Args:
+            query_embedding: Embedding de la consulta
+            top_k: Cantidad máxima de resultados
+            threshold: Similitud coseno mínima
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
+            candidates: Ids de los únicos chunks a considerar (por ejemplo, los preseleccionados por la búsqueda léxica)
+
+        Returns:
+            Resultados ordenados por similitud descendente
+        """
+        if not self._row_by_chunk:
+            return []
+
+        query = self._normalize_query(query_embedding)
+        if query is None:
+            return []
+
+        allowed = self._allowed_positions(filters, candidates, self._row_by_chunk)
+        if allowed is not None:
+            rows = np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+            if rows.shape[0] == 0:
+                return []
+            rows.sort()
+        else:
+            rows = np.flatnonzero(self._alive[: self._size])
+
+        rerank = max(self._rerank_candidates, top_k)
+        if rows.shape[0] > rerank:
+            approximate = self._approximate_scores(rows, query, contiguous=allowed is None and rows.shape[0] == self._size)
+            best = np.argpartition(-approximate, rerank - 1)[:rerank]
+            # Ordenadas para leer la matriz float32 (memmap) en orden
+            rows = np.sort(rows[best])
+
+        return self._top_k(self._matrix[rows] @ query, rows, top_k, threshold)
+
+    def memory_usage(self) -> dict:
+        """
+        Bytes ocupados por las filas del índice.
+
+        Returns:
+            Diccionario con los bytes residentes (int8 + escalas) y los de la copia float32
+        """
+        return {
+            "quantizedBytes": int(self._codes[: self._size].nbytes + self._scales[: self._size].nbytes),
+            "fullPrecisionBytes": int(self._matrix[: self._size].nbytes),
+            "memoryMapped": isinstance(self._matrix, np.memmap),
+        }
+
+    def _approximate_scores(self, rows: np.ndarray, query: np.ndarray, contiguous: bool) -> np.ndarray:
+        """Similitud aproximada de `rows` con la consulta, usando los embeddings int8 por bloques"""
+        scores = np.empty(rows.shape[0], dtype=np.float32)
+        for start in range(0, rows.shape[0], SCAN_BLOCK_ROWS):
+            end = min(start + SCAN_BLOCK_ROWS, rows.shape[0])
+            # Sin filtros y sin filas eliminadas las filas son consecutivas y se evita la indexación avanzada
+            block = self._codes[start:end] if contiguous else self._codes[rows[start:end]]
+            scores[start:end] = block.astype(np.float32) @ query
+
+        scores *= self._scales[: self._size] if contiguous else self._scales[rows]
+        return scores
+
+    def _quantize(self, start: int, end: int):
+        """Cuantiza a int8 las filas [start, end) de la matriz float32"""
+        if end <= start:
+            return
+
+        vectors = self._matrix[start:end]
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        self._codes[start:end] = np.round(vectors / scales[:, None]).astype(np.int8)
+        self._scales[start:end] = scales
+
+    def _ensure_capacity(self, extra: int, dimension: int):
+        super()._ensure_capacity(extra, dimension)
+
+        capacity, dimension = self._matrix.shape
+        if self._codes.shape == (capacity, dimension):
+            return
+
+        codes = np.zeros((capacity, dimension), dtype=np.int8)
+        scales = np.ones(capacity, dtype=np.float32)
+        if self._size:
+            codes[: self._size] = self._codes[: self._size]
+            scales[: self._size] = self._scales[: self._size]
+        self._codes = codes
+        self._scales = scales
+
+    def _allocate(self, capacity: int, dimension: int) -> np.ndarray:
+        if self._path is None:
+            return super()._allocate(capacity, dimension)
+
+        os.makedirs(self._path, exist_ok=True)
+        descriptor, file_path = tempfile.mkstemp(prefix="vectors-", suffix=".f32", dir=self._path)
+        os.close(descriptor)
+        matrix = np.memmap(file_path, dtype=np.float32, mode="w+", shape=(capacity, dimension))
+        # El mapeo mantiene vivo el archivo: al borrarlo ya no queda basura en disco si el proceso termina
+        os.remove(file_path)
+        return matrix
+
+    def _compact(self):
+        super()._compact()
+        self._quantize(0, self._size)
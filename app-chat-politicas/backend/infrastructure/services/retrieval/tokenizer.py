@@ -0,0 +1,62 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+# Palabras vacías del español (sin tildes, porque se comparan después de normalizar)
+SPANISH_STOPWORDS = frozenset(
+    """
+    a al algo algun alguna algunas alguno algunos ante antes como con contra cual cuales cuando de del desde donde dos
+    e el ella ellas ello ellos en entre era eran es esa esas ese eso esos esta estan estas este esto estos fue fueron
+    ha han hasta hay la las le les lo los mas me mi mis muy no nos o otra otras otro otros para pero poco por porque
+    que quien quienes se sea segun ser si sin sobre solo son su sus tambien te tiene tienen todo todos tu tus u un una
+    unas uno unos y ya yo
+    """.split()
+)
+
+# Sufijos flexivos que se recortan (del más largo al más corto) para agrupar singular/plural y variantes comunes
+SPANISH_SUFFIXES = ("aciones", "iciones", "acion", "icion", "mente", "ces", "es", "s")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Largo mínimo que debe conservar una palabra luego de recortar un sufijo
+MIN_STEM_LENGTH = 4
+
+
+def _strip_accents(text: str) -> str:
+    # Se descomponen los caracteres (á -> a + ´) y se descartan las marcas diacríticas; la ñ queda como n
+    return "".join(char for char in unicodedata.normalize("NFKD", text) if not unicodedata.combining(char))
+
+
+@lru_cache(maxsize=50000)
+def stem(word: str) -> str:
+    """
+    Reduce una palabra en español a una raíz aproximada recortando sufijos flexivos.
+    Los números (por ejemplo, artículos o montos) se conservan tal cual.
+    """
+    if word.isdigit():
+        return word
+
+    for suffix in SPANISH_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            word = word[: -len(suffix)]
+            # Plural en -ces de palabras terminadas en z: "capataces" -> "capataz"
+            if suffix == "ces":
+                word += "z"
+            break
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokeniza texto en español para la búsqueda léxica: minúsculas, sin tildes, sin palabras vacías
+    y con sufijos flexivos recortados.
+
+    Args:
+        text: Texto a tokenizar
+
+    Returns:
+        Lista de términos
+    """
+    normalized = _strip_accents(text.lower())
+    return [stem(token) for token in TOKEN_PATTERN.findall(normalized) if token not in SPANISH_STOPWORDS]
@@ -0,0 +1,252 @@
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+
+from domain.embeddings.entities.embeddings import ChunkFilterAttributes, RetrievalFilters, VectorSearchHit
+from infrastructure.services.retrieval.base import BaseVectorIndex
+from infrastructure.services.retrieval.filters import MetadataPostings
+
+# Capacidad mínima de la matriz al crecer, para no copiarla en cada inserción
+MIN_CAPACITY = 1024
+
+
+class InMemoryVectorIndex(BaseVectorIndex):
+    """
+    Índice vectorial residente en memoria (búsqueda exacta).
+
+    Mantiene una matriz float32 con los embeddings normalizados (norma L2 = 1) y arreglos paralelos con el
+    id del chunk y el id del documento de cada fila, de modo que la similitud coseno contra todo el corpus
+    se resuelve con un único producto matriz-vector, sin consultar MongoDB. Los filtros se resuelven con
+    las listas de filas por valor de atributo y solo se puntúan las filas permitidas.
+    """
+
+    def __init__(self):
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._chunk_ids: List[str] = []
+        self._document_ids: List[str] = []
+        self._row_by_chunk: dict[str, int] = {}
+        self._rows_by_document: dict[str, List[int]] = {}
+        self._postings = MetadataPostings()
+
+    def __len__(self) -> int:
+        return len(self._row_by_chunk)
+
+    def chunk_ids(self) -> Set[str]:
+        """Obtiene los ids de los chunks indexados"""
+        return set(self._row_by_chunk)
+
+    def clear(self):
+        """Elimina todas las filas del índice"""
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._chunk_ids = []
+        self._document_ids = []
+        self._row_by_chunk = {}
+        self._rows_by_document = {}
+        self._postings.clear()
+
+    def add_many(self, rows: Iterable[tuple[str, str, np.ndarray, ChunkFilterAttributes]]):
+        """
+        Agrega chunks al índice.
+
+        Args:
+            rows: Tuplas (id del chunk, uniqueProcessID del documento, embedding, atributos filtrables)
+        """
+        rows = [row for row in rows if row[0] not in self._row_by_chunk]
+        if not rows:
+            return
+
+        vectors = np.asarray([embedding for _, _, embedding, _ in rows], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+
+        self._ensure_capacity(len(rows), vectors.shape[1])
+
+        start = self._size
+        self._matrix[start : start + len(rows)] = vectors
+        self._alive[start : start + len(rows)] = True
+
+        for offset, (chunk_id, document_id, _, attributes) in enumerate(rows):
+            row = start + offset
+            self._chunk_ids.append(chunk_id)
+            self._document_ids.append(document_id)
+            self._row_by_chunk[chunk_id] = row
+            self._rows_by_document.setdefault(document_id, []).append(row)
+            self._postings.add(row, document_id, attributes)
+
+        self._size += len(rows)
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Quita chunks del índice.
+
+        Args:
+            chunk_ids: Ids de los chunks a eliminar
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        removed = 0
+        for chunk_id in chunk_ids:
+            row = self._row_by_chunk.pop(chunk_id, None)
+            if row is None:
+                continue
+
+            self._alive[row] = False
+            self._postings.remove(row)
+            document_rows = self._rows_by_document.get(self._document_ids[row], [])
+            document_rows.remove(row)
+            if not document_rows:
+                self._rows_by_document.pop(self._document_ids[row], None)
+            removed += 1
+
+        self._compact_if_needed()
+        return removed
+
+    def remove_document(self, document_unique_process_id: str) -> int:
+        """
+        Quita del índice todos los chunks de un documento.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+
+        Returns:
+            Cantidad de chunks eliminados
+        """
+        rows = self._rows_by_document.pop(document_unique_process_id, [])
+        for row in rows:
+            self._alive[row] = False
+            self._row_by_chunk.pop(self._chunk_ids[row], None)
+            self._postings.remove(row)
+
+        self._compact_if_needed()
+        return len(rows)
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        threshold: float,
+        filters: Optional[RetrievalFilters] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[VectorSearchHit]:
+        """
+        Busca los chunks más similares a la consulta.
+
+        Args:
+            query_embedding: Embedding de la consulta
+            top_k: Cantidad máxima de resultados
+            threshold: Similitud coseno mínima
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
+            candidates: Ids de los únicos chunks a considerar (por ejemplo, los preseleccionados por la búsqueda léxica)
+
+        Returns:
+            Resultados ordenados por similitud descendente
+        """
+        if not self._row_by_chunk:
+            return []
+
+        query = self._normalize_query(query_embedding)
+        if query is None:
+            return []
+
+        allowed = self._allowed_positions(filters, candidates, self._row_by_chunk)
+        if allowed is not None:
+            # Solo se puntúan las filas que cumplen los filtros (las filas eliminadas ya no están en las listas)
+            rows = np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+            if rows.shape[0] == 0:
+                return []
+            rows.sort()
+            return self._top_k(self._matrix[rows] @ query, rows, top_k, threshold)
+
+        scores = self._matrix[: self._size] @ query
+        scores[~self._alive[: self._size]] = -np.inf
+
+        return self._top_k(scores, np.arange(self._size), top_k, threshold)
+
+    def _top_k(self, scores: np.ndarray, rows: np.ndarray, top_k: int, threshold: float) -> List[VectorSearchHit]:
+        """Selecciona el top-k con argpartition y lo ordena; `scores[i]` corresponde a la fila `rows[i]`"""
+        k = min(top_k, scores.shape[0])
+        if k <= 0:
+            return []
+
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.argsort(-scores[candidates])]
+
+        return [
+            VectorSearchHit(
+                chunkId=self._chunk_ids[rows[idx]],
+                documentUniqueProcessID=self._document_ids[rows[idx]],
+                similarity=float(scores[idx]),
+            )
+            for idx in candidates
+            if scores[idx] >= threshold
+        ]
+
+    def _normalize_query(self, query_embedding: list[float]) -> Optional[np.ndarray]:
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape[0] != self._matrix.shape[1]:
+            raise ValueError(f"Dimensión del embedding de la consulta ({query.shape[0]}) distinta a la del índice ({self._matrix.shape[1]})")
+
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+        return query / norm
+
+    def _ensure_capacity(self, extra: int, dimension: int):
+        if self._size == 0 and self._matrix.shape[1] != dimension:
+            self._matrix = np.empty((0, dimension), dtype=np.float32)
+
+        if self._matrix.shape[1] != dimension:
+            raise ValueError(f"Dimensión del embedding ({dimension}) distinta a la del índice ({self._matrix.shape[1]})")
+
+        required = self._size + extra
+        capacity = self._matrix.shape[0]
+        if required <= capacity:
+            return
+
+        new_capacity = max(required, capacity * 2, MIN_CAPACITY)
+        matrix = self._allocate(new_capacity, dimension)
+        matrix[: self._size] = self._matrix[: self._size]
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+
+        self._matrix = matrix
+        self._alive = alive
+
+    def _allocate(self, capacity: int, dimension: int) -> np.ndarray:
+        """Reserva la matriz float32 de los embeddings"""
+        return np.empty((capacity, dimension), dtype=np.float32)
+
+    def _compact_if_needed(self):
+        # Compactamos cuando más de la mitad de las filas son lápidas
+        if self._size and len(self._row_by_chunk) < self._size // 2:
+            self._compact()
+
+    def _compact(self):
+        """Reconstruye la matriz descartando las filas eliminadas"""
+        keep = np.flatnonzero(self._alive[: self._size])
+        dimension = self._matrix.shape[1]
+
+        matrix = self._matrix[keep]
+        chunk_ids = [self._chunk_ids[row] for row in keep]
+        document_ids = [self._document_ids[row] for row in keep]
+        attributes = [self._postings.attributes(row) for row in keep]
+
+        self.clear()
+        self._matrix = np.empty((0, dimension), dtype=np.float32)
+        self._ensure_capacity(len(keep), dimension)
+        self._matrix[: len(keep)] = matrix
+        self._alive[: len(keep)] = True
+        self._size = len(keep)
+        self._chunk_ids = chunk_ids
+        self._document_ids = document_ids
+
+        for row, (chunk_id, document_id, row_attributes) in enumerate(zip(chunk_ids, document_ids, attributes)):
+            self._row_by_chunk[chunk_id] = row
+            self._rows_by_document.setdefault(document_id, []).append(row)
+            self._postings.add(row, document_id, row_attributes)
@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from constants import settings
+from domain.storage.interfaces.storage_backend import StorageBackendInterface
+from infrastructure.services.storage.azure import AzureBlobStorage
+from infrastructure.services.storage.local import LocalStorage
+from infrastructure.services.storage.streams import FileTooLarge, iter_file_blocks, spool_upload
+
+
+def create_storage_backend() -> StorageBackendInterface:
+    """
+    Crea el almacenamiento de archivos configurado en STORAGE_BACKEND.
+    """
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorage(settings.LOCAL_STORAGE_PATH, block_size=settings.BLOB_UPLOAD_BLOCK_SIZE)
+
+    return AzureBlobStorage(
+        settings.AZ_BLOB_CONTAINER_NAME,
+        upload_concurrency=settings.BLOB_UPLOAD_CONCURRENCY,
+        delete_concurrency=settings.BLOB_DELETE_CONCURRENCY,
+        max_connections=settings.BLOB_MAX_CONNECTIONS,
+    )
+
+
+def unique_file_name(file_name: str) -> str:
+    """
+    Genera el nombre único con que se almacena un archivo.
+
+    Args:
+        file_name: Nombre original del archivo
+
+    Returns:
+        Nombre único del archivo
+    """
+    return str(uuid4()).split("-")[-1].upper() + "-" + file_name.upper().strip()
+
+
+# Instancia única del almacenamiento de archivos, compartida por todo el proceso; sus conexiones se abren y cierran con la API
+storage_backend = create_storage_backend()
+
+__all__ = [
+    'AzureBlobStorage',
+    'FileTooLarge',
+    'LocalStorage',
+    'create_storage_backend',
+    'iter_file_blocks',
+    'spool_upload',
+    'storage_backend',
+    'unique_file_name',
+]
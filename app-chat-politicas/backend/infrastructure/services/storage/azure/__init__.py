@@ -1,57 +1,172 @@
+import asyncio
+import base64
 from datetime import datetime, timedelta
-from uuid import uuid4
+from typing import AsyncIterator, List, Optional
 
+import aiohttp
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.storage.blob import BlobSasPermissions, generate_blob_sas
-from azure.storage.blob.aio import BlobServiceClient
+from azure.storage.blob.aio import BlobClient, BlobServiceClient, ContainerClient
+
 from constants import settings
+from domain.storage.interfaces.storage_backend import StorageBackendInterface
 
 
-async def upload_to_azure(content: bytes, file_name: str) -> dict:
+class AzureBlobStorage(StorageBackendInterface):
     """
-    Sube un archivo a Azure Blob Storage.
+    Almacenamiento de archivos en un contenedor de Azure Blob Storage.
 
-    Args:
-        content: Contenido del archivo en bytes
-        file_name: Nombre del archivo
+    Mantiene un único BlobServiceClient durante toda la vida del proceso: las conexiones TLS del pool de aiohttp
+    (hasta `max_connections`) se reutilizan entre solicitudes en vez de abrirse y cerrarse en cada operación.
 
-    Returns:
-        Diccionario con la URL del archivo y el nombre único
+    Los archivos se suben por bloques (stage block / commit block list) con hasta `upload_concurrency`
+    bloques en vuelo, de modo que la memoria usada por una subida queda acotada a esos bloques.
     """
-    blob_service_client = BlobServiceClient.from_connection_string(settings.AZURE_BLOB_CONNECTION_STRING, connection_verify=False)
 
-    unique_name = str(uuid4()).split("-")[-1].upper() + "-" + file_name.upper().strip()
+    def __init__(self, container_name: str, upload_concurrency: int, delete_concurrency: int, max_connections: int):
+        self._container_name = container_name
+        self._upload_concurrency = upload_concurrency
+        self._delete_concurrency = delete_concurrency
+        self._max_connections = max_connections
+        self._client: Optional[BlobServiceClient] = None
 
-    async with blob_service_client:
-        container_client = blob_service_client.get_container_client(settings.AZ_BLOB_CONTAINER_NAME)
-        blob_client = container_client.get_blob_client(unique_name)
-        await blob_client.upload_blob(content)
+    async def start(self):
+        """Crea el cliente de Blob Storage y su pool de conexiones"""
+        if self._client is not None:
+            return
 
-        pdf_url = await generate_new_url_document(uniqueName=unique_name)
+        # Todas las solicitudes van a la misma cuenta: el límite por host es el límite total del pool
+        connector = aiohttp.TCPConnector(limit=self._max_connections, limit_per_host=self._max_connections, ttl_dns_cache=300)
+        transport = AioHttpTransport(session=aiohttp.ClientSession(connector=connector), session_owner=True, connection_verify=False)
+        self._client = BlobServiceClient.from_connection_string(settings.AZURE_BLOB_CONNECTION_STRING, transport=transport)
 
-        return {"pdf_url": pdf_url, "unique_name": unique_name}
+    async def close(self):
+        """Cierra el cliente de Blob Storage y sus conexiones"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
 
+    async def upload(self, unique_name: str, blocks: AsyncIterator[bytes]) -> int:
+        """
+        Sube un archivo por bloques. Los bloques no confirmados de una subida fallida los descarta Azure.
 
-async def generate_new_url_document(uniqueName: str) -> str:
-    """
-    Genera una URL con SAS para acceder al documento.
+        Args:
+            unique_name: Nombre único del archivo
+            blocks: Bloques del contenido, en orden
 
-    Args:
-        uniqueName: Nombre único del documento
+        Returns:
+            Cantidad de bytes subidos
+        """
+        blob_client = (await self._container()).get_blob_client(unique_name)
+        semaphore = asyncio.Semaphore(self._upload_concurrency)
+        block_ids: List[str] = []
+        size = 0
 
-    Returns:
-        URL con SAS para acceder al documento
-    """
-    # Generar SAS para acceso al blob
-    sas_token = generate_blob_sas(
-        account_name=settings.AZ_BLOB_ACCOUNT_NAME,
-        container_name=settings.AZ_BLOB_CONTAINER_NAME,
-        blob_name=uniqueName,
-        account_key=settings.AZ_BLOB_ACCOUNT_KEY,
-        permission=BlobSasPermissions(read=True),
-        expiry=datetime.utcnow() + timedelta(hours=24),
-    )
-
-    # Construir URL completa
-    blob_url = f"{settings.AZ_BLOB_ACCOUNT_URL}/{settings.AZ_BLOB_CONTAINER_NAME}/{uniqueName}?{sas_token}"
-
-    return blob_url
+        try:
+            async with asyncio.TaskGroup() as group:
+                async for block in blocks:
+                    # No se lee el siguiente bloque hasta que haya lugar para subirlo
+                    await semaphore.acquire()
+                    block_id = base64.b64encode(f"{len(block_ids):08d}".encode()).decode()
+                    block_ids.append(block_id)
+                    size += len(block)
+                    group.create_task(self._stage_block(blob_client, block_id, block, semaphore))
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        await blob_client.commit_block_list(block_ids)
+        return size
+
+    async def download(self, unique_name: str) -> AsyncIterator[bytes]:
+        """
+        Descarga un archivo por bloques.
+
+        Args:
+            unique_name: Nombre único del archivo
+
+        Returns:
+            Iterador asíncrono sobre los bloques del contenido
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        blob_client = (await self._container()).get_blob_client(unique_name)
+        try:
+            stream = await blob_client.download_blob(max_concurrency=self._upload_concurrency)
+        except ResourceNotFoundError:
+            raise FileNotFoundError(unique_name)
+
+        async for chunk in stream.chunks():
+            yield chunk
+
+    async def delete(self, unique_names: List[str]) -> int:
+        """
+        Elimina varios archivos en paralelo, con como máximo BLOB_DELETE_CONCURRENCY solicitudes simultáneas.
+        Los archivos que ya no existen se ignoran.
+
+        Args:
+            unique_names: Nombres únicos de los archivos
+
+        Returns:
+            Cantidad de archivos eliminados
+        """
+        if not unique_names:
+            return 0
+
+        container_client = await self._container()
+        semaphore = asyncio.Semaphore(self._delete_concurrency)
+
+        async def delete(unique_name: str) -> bool:
+            async with semaphore:
+                try:
+                    await container_client.delete_blob(unique_name)
+                    return True
+                except ResourceNotFoundError:
+                    return False
+
+        results = await asyncio.gather(*(delete(unique_name) for unique_name in unique_names), return_exceptions=True)
+
+        for unique_name, result in zip(unique_names, results):
+            if isinstance(result, Exception):
+                print(f"Error al eliminar el archivo {unique_name}: {str(result)}")
+        return sum(result is True for result in results)
+
+    async def get_url(self, unique_name: str, expires_in: int) -> str:
+        """
+        Genera una URL con SAS de lectura. La firma se calcula localmente, sin llamar a Azure.
+
+        Args:
+            unique_name: Nombre único del archivo
+            expires_in: Segundos de validez de la URL
+
+        Returns:
+            URL con SAS para acceder al archivo
+        """
+        sas_token = generate_blob_sas(
+            account_name=settings.AZ_BLOB_ACCOUNT_NAME,
+            container_name=self._container_name,
+            blob_name=unique_name,
+            account_key=settings.AZ_BLOB_ACCOUNT_KEY,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.utcnow() + timedelta(seconds=expires_in),
+        )
+
+        return f"{settings.AZ_BLOB_ACCOUNT_URL}/{self._container_name}/{unique_name}?{sas_token}"
+
+    async def _container(self) -> ContainerClient:
+        # Fuera de la API (scripts, tareas sueltas) el cliente se crea en el primer uso
+        await self.start()
+        return self._client.get_container_client(self._container_name)
+
+    @staticmethod
+    async def _stage_block(blob_client: BlobClient, block_id: str, block: bytes, semaphore: asyncio.Semaphore):
+        try:
+            await blob_client.stage_block(block_id, block)
+        finally:
+            semaphore.release()
+
+
+__all__ = [
+    'AzureBlobStorage',
+]
@@ -0,0 +1,108 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, List
+
+from domain.storage.interfaces.storage_backend import StorageBackendInterface
+from infrastructure.services.storage.streams import iter_file_blocks
+
+
+class LocalStorage(StorageBackendInterface):
+    """
+    Almacenamiento de archivos en una carpeta local, para desarrollo, pruebas y mediciones sin Azure.
+    Los archivos se escriben con un nombre temporal y se renombran al terminar, de modo que
+    una subida interrumpida no deja un archivo incompleto con el nombre final.
+    """
+
+    def __init__(self, root: str, block_size: int):
+        self._root = Path(root).resolve()
+        self._block_size = block_size
+
+    async def upload(self, unique_name: str, blocks: AsyncIterator[bytes]) -> int:
+        """
+        Escribe un archivo bloque a bloque.
+
+        Args:
+            unique_name: Nombre único del archivo
+            blocks: Bloques del contenido, en orden
+
+        Returns:
+            Cantidad de bytes escritos
+        """
+        path = self._path(unique_name)
+        partial_path = path.with_name(path.name + ".part")
+        await asyncio.to_thread(self._root.mkdir, parents=True, exist_ok=True)
+
+        size = 0
+        handle = await asyncio.to_thread(open, partial_path, "wb")
+        try:
+            async for block in blocks:
+                await asyncio.to_thread(handle.write, block)
+                size += len(block)
+        except BaseException:
+            handle.close()
+            await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+            raise
+
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(os.replace, partial_path, path)
+        return size
+
+    async def download(self, unique_name: str) -> AsyncIterator[bytes]:
+        """
+        Lee un archivo por bloques.
+
+        Args:
+            unique_name: Nombre único del archivo
+
+        Returns:
+            Iterador asíncrono sobre los bloques del contenido
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        async for block in iter_file_blocks(str(self._path(unique_name)), self._block_size):
+            yield block
+
+    async def delete(self, unique_names: List[str]) -> int:
+        """
+        Elimina varios archivos. Los archivos que ya no existen se ignoran.
+
+        Args:
+            unique_names: Nombres únicos de los archivos
+
+        Returns:
+            Cantidad de archivos eliminados
+        """
+
+        def delete() -> int:
+            deleted = 0
+            for unique_name in unique_names:
+                try:
+                    self._path(unique_name).unlink()
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+            return deleted
+
+        return await asyncio.to_thread(delete)
+
+    async def get_url(self, unique_name: str, expires_in: int) -> str:
+        """
+        Genera la URL file:// del archivo. Las URL locales no expiran.
+
+        Args:
+            unique_name: Nombre único del archivo
+            expires_in: Segundos de validez de la URL (no se usa)
+
+        Returns:
+            URL del archivo
+        """
+        return self._path(unique_name).as_uri()
+
+    def _path(self, unique_name: str) -> Path:
+        path = (self._root / unique_name).resolve()
+        # El nombre viene del usuario: no se permite salir de la carpeta raíz
+        if path.parent != self._root:
+            raise ValueError(f"Nombre de archivo no válido: {unique_name}")
+        return path
@@ -0,0 +1,62 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import UploadFile
+
+
+class FileTooLarge(ValueError):
+    """El archivo supera el tamaño máximo permitido"""
+
+
+async def spool_upload(file: UploadFile, path: str, block_size: int, max_size: int) -> int:
+    """
+    Copia un archivo recibido a disco por bloques, verificando el tamaño a medida que se lee:
+    nunca hay más de un bloque del archivo en memoria.
+
+    Args:
+        file: Archivo recibido
+        path: Ruta donde se escribe la copia
+        block_size: Bytes que se leen por vez
+        max_size: Tamaño máximo permitido en bytes
+
+    Returns:
+        Tamaño del archivo en bytes
+
+    Raises:
+        FileTooLarge: Si el archivo supera `max_size` bytes
+    """
+    # Si el tamaño ya es conocido se rechaza sin leer nada
+    if file.size is not None and file.size > max_size:
+        raise FileTooLarge(f"El archivo supera el tamaño máximo de {max_size} bytes.")
+
+    size = 0
+    handle = await asyncio.to_thread(open, path, "wb")
+    try:
+        while block := await file.read(block_size):
+            size += len(block)
+            if size > max_size:
+                raise FileTooLarge(f"El archivo supera el tamaño máximo de {max_size} bytes.")
+            await asyncio.to_thread(handle.write, block)
+    finally:
+        await asyncio.to_thread(handle.close)
+
+    return size
+
+
+async def iter_file_blocks(path: str, block_size: int) -> AsyncIterator[bytes]:
+    """
+    Lee un archivo de disco por bloques sin bloquear el event loop.
+
+    Args:
+        path: Ruta del archivo
+        block_size: Bytes por bloque
+
+    Returns:
+        Iterador asíncrono sobre los bloques del archivo
+    """
+    handle = await asyncio.to_thread(open, path, "rb")
+    try:
+        while block := await asyncio.to_thread(handle.read, block_size):
+            yield block
+    finally:
+        await asyncio.to_thread(handle.close)
@@ -1,7 +1,19 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
 from constants import openai_client, settings
-from utils.embeddings import split_text
+from utils.embeddings import count_tokens, iter_chunks
 from domain.documents.entities.documents import DocumentKnowledge
-from domain.embeddings.entities.embeddings import DocumentEmbedding
+from domain.embeddings.entities.embeddings import ChunkTombstone, DocumentEmbedding
+from infrastructure.database.mongodb.embedding_codec import encode_embedding
+from infrastructure.services.retrieval import lexical_index, vector_index
+
+# Recibe la cantidad de chunks procesados y los tokens consumidos por los embeddings generados
+ProgressCallback = Callable[[int, int], Awaitable[None]]
 
 
 async def generate_embedding_from_text(content: str) -> list[float]:
@@ -25,46 +37,226 @@ async def generate_embedding_from_text(content: str) -> list[float]:
     return response.data[0].embedding
 
 
-async def generate_embeddings_with_metadata(document: DocumentKnowledge, original_content: str):
-    documents_content_chunks = split_text(text=original_content)
+def batch_by_tokens(texts: List[str], max_items: int, max_tokens: int) -> List[List[int]]:
+    """
+    Agrupa textos en lotes que respetan el máximo de elementos y de tokens por solicitud.
+
+    Args:
+        texts: Textos a agrupar
+        max_items: Máximo de textos por lote
+        max_tokens: Máximo de tokens por lote (un texto que lo supera por sí solo va en su propio lote)
+
+    Returns:
+        Lista de lotes, cada uno con los índices de sus textos
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        tokens = count_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+async def generate_embeddings_from_texts(contents: List[str]) -> tuple[List[list[float]], int]:
+    """
+    Genera los embeddings de varios textos con solicitudes por lotes, manteniendo como máximo
+    EMBEDDING_MAX_CONCURRENCY solicitudes en paralelo.
+
+    Args:
+        contents: Textos a convertir
+
+    Returns:
+        Tupla con los embeddings en el mismo orden que los textos y los tokens consumidos
+    """
+    contents = [content.replace("\n", " ") for content in contents]
+    batches = batch_by_tokens(contents, settings.EMBEDDING_BATCH_SIZE, settings.EMBEDDING_BATCH_MAX_TOKENS)
+    semaphore = asyncio.Semaphore(settings.EMBEDDING_MAX_CONCURRENCY)
+    embeddings: List[Optional[list[float]]] = [None] * len(contents)
+    tokens = 0
+
+    async def embed_batch(indexes: List[int]):
+        nonlocal tokens
+        async with semaphore:
+            response = await openai_client.embeddings.create(
+                input=[contents[index] for index in indexes], model=settings.AZURE_TEXT_EMBEDDING_MODEL_NAME
+            )
 
-    # Creación del objeto document embedding para cada chunk de texto
-    for chunk in documents_content_chunks:
+        # `index` de cada resultado es la posición del texto dentro del lote
+        for item in response.data:
+            embeddings[indexes[item.index]] = item.embedding
+        if response.usage is not None:
+            tokens += response.usage.total_tokens
 
-        chunk_modified = f"""
-        # Accesos del documento
-        1. Línea de servicios: {", ".join(document.los)}
+    await asyncio.gather(*(embed_batch(batch) for batch in batches))
+    return embeddings, tokens
 
-        # Cargos o categorías  que aplica el documento
-        2. Cargos o categorías: {", ".join(document.profiles)}
-        2.1 Tipo de jornada: {document.typeOfWorkday}
-        2.2 Tipo de contrato: {document.contractType}
 
-        # Dueño o owner del documento
-        3. Línea de servicio del owner (los): {document.losOwner}
-        3.1 Sub Línea de servicio del owner (sublos): {document.subLoS}
+def chunk_content_hash(content: str) -> str:
+    """Hash del texto del chunk junto al modelo: si ambos coinciden, el embedding se puede reutilizar"""
+    return hashlib.sha256(f"{settings.AZURE_TEXT_EMBEDDING_MODEL_NAME}\n{content}".encode("utf-8")).hexdigest()
 
-        # Soporte del documento
-        4. Soporte:  {", ".join(map(lambda person: person.name, document.support))}
 
-        # Etiquetas personalizadas
-        5. Etiquetas: {", ".join(map(lambda tag: tag.label, document.tagsByAuthor))}
+async def update_embeddings_with_metadata(
+    document: DocumentKnowledge, original_content: str, on_progress: Optional[ProgressCallback] = None, update_indexes: bool = True
+) -> Dict[str, float]:
+    """
+    Actualiza los embeddings de un documento existente: solo se generan los de los chunks cuyo hash cambió,
+    se reutilizan los demás y se eliminan los que ya no existen.
+
+    Args:
+        document: Documento actualizado
+        original_content: Texto extraído del documento
+        on_progress: Función que recibe la cantidad de chunks procesados (reutilizados y generados) y los tokens consumidos después de cada grupo
+        update_indexes: Si es False solo se escribe en Mongo, sin modificar los índices en memoria de este proceso
+            (por ejemplo, desde una migración); las réplicas toman los cambios en su próxima sincronización
+
+    Returns:
+        Duración en segundos de cada etapa, tokens consumidos y cantidad de chunks reutilizados, generados y eliminados
+    """
+    timings: Dict[str, float] = {}
 
-        ===
-        Contenido del documento:
-        {chunk}
+    # Ids de los chunks guardados agrupados por hash (un mismo texto puede repetirse en el documento)
+    collection = DocumentEmbedding.get_motor_collection()
+    stored: Dict[str, List] = {}
+    attributes_changed = False
+    async for item in collection.find({"documentUniqueProcessID": document.uniqueProcessID}, {"contentHash": 1, "los": 1, "profiles": 1}):
+        stored.setdefault(item.get("contentHash"), []).append(item["_id"])
+        attributes_changed = attributes_changed or set(item["los"]) != set(document.los) or set(item["profiles"]) != set(document.profiles)
 
-        """
+    kept = []
+    embedded = 0
+    for contents in _iter_content_groups(original_content, timings):
+        new_contents = []
+        for content in contents:
+            matches = stored.get(chunk_content_hash(content))
+            if matches:
+                kept.append(matches.pop())
+            else:
+                new_contents.append(content)
 
-        chunk_embedding = await generate_embedding_from_text(content=chunk_modified)
+        await _embed_and_insert(document, new_contents, timings, update_indexes)
+        embedded += len(new_contents)
+        if on_progress:
+            await on_progress(len(kept) + embedded, int(timings.get("tokens", 0)))
 
-        new_document_embedding = DocumentEmbedding(
+    removed = [chunk_id for chunk_ids in stored.values() for chunk_id in chunk_ids]
+    if removed:
+        await collection.delete_many({"_id": {"$in": removed}})
+        removed_ids = [str(chunk_id) for chunk_id in removed]
+        # Las demás réplicas quitan los chunks de sus índices en la próxima sincronización
+        await ChunkTombstone(chunkIds=removed_ids).insert()
+        if update_indexes:
+            vector_index.remove_chunks(removed_ids)
+            lexical_index.remove_chunks(removed_ids)
+    if kept:
+        # Los campos que no forman parte del texto embebido pueden haber cambiado
+        await _set_chunk_attributes(document, kept, attributes_changed and update_indexes)
+
+    timings.update(reused=len(kept), embedded=embedded, removed=len(removed))
+    print(f"Embeddings de {document.documentName} actualizados: {len(kept)} reutilizados, {embedded} generados, {len(removed)} eliminados")
+    return timings
+
+
+async def update_chunk_attributes(document: DocumentKnowledge) -> int:
+    """
+    Copia a los chunks existentes del documento los campos que guardan, sin volver a generar sus embeddings:
+    nombre del documento y atributos filtrables (líneas de servicio y perfiles).
+
+    Args:
+        document: Documento actualizado
+
+    Returns:
+        Cantidad de chunks actualizados
+    """
+    chunk_ids = []
+    attributes_changed = False
+    async for item in DocumentEmbedding.get_motor_collection().find({"documentUniqueProcessID": document.uniqueProcessID}, {"los": 1, "profiles": 1}):
+        chunk_ids.append(item["_id"])
+        attributes_changed = attributes_changed or set(item["los"]) != set(document.los) or set(item["profiles"]) != set(document.profiles)
+
+    if chunk_ids:
+        await _set_chunk_attributes(document, chunk_ids, attributes_changed)
+    return len(chunk_ids)
+
+
+async def _set_chunk_attributes(document: DocumentKnowledge, chunk_ids: List, reload_index: bool):
+    """Actualiza con un único update_many los campos del documento copiados en los chunks indicados"""
+    await DocumentEmbedding.get_motor_collection().update_many(
+        {"_id": {"$in": chunk_ids}},
+        {"$set": {"documentName": document.documentName, "los": document.los, "profiles": document.profiles, "lastUpdate": datetime.now()}},
+    )
+    if reload_index:
+        # El índice vectorial guarda los atributos filtrables de cada chunk
+        await vector_index.reload_chunks([str(chunk_id) for chunk_id in chunk_ids])
+
+
+def _iter_content_groups(original_content: str, timings: Dict[str, float]) -> Iterator[List[str]]:
+    """
+    Agrupa los chunks a medida que el chunker los produce, en grupos que alcanzan para ocupar todas las
+    solicitudes de embeddings en paralelo. El documento nunca se divide completo en memoria.
+    """
+    group_size = settings.EMBEDDING_BATCH_SIZE * settings.EMBEDDING_MAX_CONCURRENCY
+    chunks = iter_chunks(original_content)
+
+    while True:
+        start = time.perf_counter()
+        contents = list(islice(chunks, group_size))
+        _add_timing(timings, "split", start)
+        if not contents:
+            return
+        yield contents
+
+
+async def _embed_and_insert(document: DocumentKnowledge, contents: List[str], timings: Dict[str, float], update_indexes: bool = True):
+    """Genera los embeddings de los chunks, los guarda con un único insert_many y, si corresponde, los agrega a los índices en memoria"""
+    if not contents:
+        return
+
+    start = time.perf_counter()
+    embeddings, tokens = await generate_embeddings_from_texts(contents)
+    _add_timing(timings, "embedding", start)
+    timings["tokens"] = timings.get("tokens", 0) + tokens
+
+    document_embeddings = [
+        DocumentEmbedding(
             documentName=document.documentName,
             documentUniqueProcessID=document.uniqueProcessID,
-            embedding=chunk_embedding,
-            contentChunk=chunk_modified,
+            embedding=encode_embedding(embedding, settings.EMBEDDING_STORAGE_FORMAT),
+            contentChunk=content,
+            contentHash=chunk_content_hash(content),
             knowledgeBaseId=document.knowledgeBase.id,
             profiles=document.profiles,
             los=document.los,
         )
-        await new_document_embedding.insert()
+        for content, embedding in zip(contents, embeddings)
+    ]
+
+    start = time.perf_counter()
+    result = await DocumentEmbedding.insert_many(document_embeddings)
+    # insert_many no asigna el id a los objetos, y los índices en memoria lo necesitan
+    for document_embedding, inserted_id in zip(document_embeddings, result.inserted_ids):
+        document_embedding.id = inserted_id
+    _add_timing(timings, "insert", start)
+    if not update_indexes:
+        return
+
+    # Se agregan los chunks a los índices de búsqueda en memoria
+    start = time.perf_counter()
+    vector_index.add_embeddings(document_embeddings)
+    lexical_index.add_embeddings(document_embeddings)
+    _add_timing(timings, "index", start)
+
+
+def _add_timing(timings: Dict[str, float], stage: str, start: float):
+    timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
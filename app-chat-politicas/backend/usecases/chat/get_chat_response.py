@@ -4,26 +4,34 @@ import uuid
 import json
 
 from domain.chat.entities.chat import ChatMessage, ChatSession
+from domain.chat.interfaces.answer_cache import AnswerCacheInterface
+from domain.embeddings.entities.embeddings import RetrievalFilters
 from constants import settings
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 
+from infrastructure.services.genai.embeddings import generate_query_embedding
 from usecases.chat.get_relevant_documents import GetRelevantDocumentsUseCase
 
+# Largo de los fragmentos en que se transmite una respuesta recuperada desde la caché
+CACHED_ANSWER_CHUNK_SIZE = 200
+
 
 class GetChatResponseUseCase:
     """Caso de uso para obtener respuestas de chat"""
 
-    def __init__(self, relevant_docs_usecase: GetRelevantDocumentsUseCase):
+    def __init__(self, relevant_docs_usecase: GetRelevantDocumentsUseCase, answer_cache: Optional[AnswerCacheInterface] = None):
         self.relevant_docs_usecase = relevant_docs_usecase
+        self.answer_cache = answer_cache
 
-    async def execute(self, chat_id: str, messages: List[ChatMessage]) -> AsyncGenerator[str, None]:
+    async def execute(self, chat_id: str, messages: List[ChatMessage], filters: Optional[RetrievalFilters] = None) -> AsyncGenerator[str, None]:
         """
         Ejecuta el caso de uso para obtener una respuesta de chat
 
         Args:
             chat_id: ID del chat
             messages: Lista de mensajes de chat
+            filters: Filtros para la búsqueda de documentos relevantes
 
         Returns:
             Un generador asíncrono que produce fragmentos de la respuesta
@@ -61,18 +69,41 @@ class GetChatResponseUseCase:
         }
         yield f"data: b: [{json.dumps(internal_document_event_tool)}] [END_MESSAGE]\n"
 
+        # Las preguntas de un solo turno se pueden responder desde la caché semántica
+        cacheable = self.answer_cache is not None and len([msg for msg in messages if msg.role == "user"]) == 1
+        query_embedding = None
+        cached_answer = None
+        if cacheable:
+            try:
+                query_embedding = await generate_query_embedding(last_message.content)
+                cached_answer = await self.answer_cache.lookup(query_embedding, filters)
+            except Exception as e:
+                print(f"Error al consultar la caché semántica de respuestas: {str(e)}")
+                cacheable = False
+
+        if cached_answer is not None:
+            async for event in self._replay_cached_answer(cached_answer.answer, cached_answer.references, tool_id_internal_document_event):
+                yield event
+            return
+
         # Obtener documentos relevantes
-        relevant_docs = await self.relevant_docs_usecase.execute(last_message.content)
+        relevant_docs = await self.relevant_docs_usecase.execute(last_message.content, filters)
 
         # Construir contexto con documentos relevantes
         context = ""
         if relevant_docs and len(relevant_docs) > 0:
             context = "# Información relevante:\n\n ===\n\n"
-            for i, doc in enumerate(relevant_docs[:3]):  # Limitamos a los 3 más relevantes
-                document_title = doc.get("title", "N/A")
-                document_url = doc.get("document_url", "N/A")
-                document_content = doc.get("content", "N/A")
-                context += f"Fuente {i+1}: \n url: {document_url}\n título del documento: {document_title}\n\nContenido de la fuente N {i+1}: ```{document_content}```\n\n "
+            # Limitamos a los 3 chunks más relevantes, agrupados por documento para incluir sus metadatos una sola vez
+            sources: Dict[str, List[dict]] = {}
+            for doc in relevant_docs[:3]:
+                sources.setdefault(doc.get("document_id"), []).append(doc)
+
+            for i, chunks in enumerate(sources.values()):
+                document_title = chunks[0].get("title", "N/A")
+                document_url = chunks[0].get("document_url", "N/A")
+                document_metadata = chunks[0].get("metadata", "")
+                document_content = "\n...\n".join(chunk.get("content", "N/A") for chunk in chunks)
+                context += f"Fuente {i+1}: \n url: {document_url}\n título del documento: {document_title}\n{document_metadata}\n\nContenido de la fuente N {i+1}: ```{document_content}```\n\n "
 
         # Evento para indicar que se está generando la respuesta
         call_gpt_event = {
@@ -126,7 +157,9 @@ class GetChatResponseUseCase:
         # Ejecutar el agente y transmitir la respuesta
         response = agent.run(last_message.content, stream=True, show_full_reasoning=True)
 
+        answer_parts = []
         for message in response:
+            answer_parts.append(message.content or "")
             yield f"data: 0: {message.content}[END_MESSAGE]\n"
 
         # Evento para mostrar las fuentes de los documentos
@@ -146,6 +179,59 @@ class GetChatResponseUseCase:
         }
         yield f"data: b: {json.dumps(tool_internal_document_result)} [END_MESSAGE]\n"
 
+        # Se guarda la respuesta solo si se basa en documentos, para poder invalidarla cuando cambien
+        if cacheable and relevant_docs:
+            try:
+                await self.answer_cache.store(last_message.content, query_embedding, filters, relevant_docs, "".join(answer_parts))
+            except Exception as e:
+                print(f"Error al guardar en la caché semántica de respuestas: {str(e)}")
+
+        async for event in self._end_events():
+            yield event
+
+    async def _replay_cached_answer(self, answer: str, references: List[Dict[str, Any]], tool_call_id: str) -> AsyncGenerator[str, None]:
+        """
+        Transmite una respuesta recuperada desde la caché con los mismos eventos que una respuesta generada
+
+        Args:
+            answer: Texto de la respuesta en caché
+            references: Documentos citados por la respuesta
+            tool_call_id: ID del evento de herramienta de documentos ya iniciado
+
+        Returns:
+            Un generador asíncrono que produce los eventos restantes del stream
+        """
+        call_gpt_event = {
+            "id": f"event_{uuid.uuid4()}",
+            "timestamp": str(datetime.now()),
+            "type": "message",
+            "message": "Generando respuesta",
+        }
+        yield f"data: e: {json.dumps(call_gpt_event)} [END_MESSAGE]\n"
+
+        for start in range(0, len(answer), CACHED_ANSWER_CHUNK_SIZE):
+            yield f"data: 0: {answer[start : start + CACHED_ANSWER_CHUNK_SIZE]}[END_MESSAGE]\n"
+
+        tool_internal_document_result = {
+            "toolCallId": tool_call_id,
+            "toolName": "internal_document_event",
+            "toolArgs": {},
+            "state": "result",
+            "createdAt": str(datetime.now()),
+            "result": references,
+        }
+        yield f"data: b: {json.dumps(tool_internal_document_result)} [END_MESSAGE]\n"
+
+        async for event in self._end_events():
+            yield event
+
+    async def _end_events(self) -> AsyncGenerator[str, None]:
+        """
+        Eventos de cierre del stream
+
+        Returns:
+            Un generador asíncrono con el evento de finalización y la señal de fin
+        """
         # Evento de finalización
         end_event = {
             "id": f"event_{uuid.uuid4()}",
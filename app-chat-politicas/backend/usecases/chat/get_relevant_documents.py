@@ -1,4 +1,7 @@
+from typing import Optional
+
 from domain.chat.interfaces.chat_repository import ChatRepositoryInterface
+from domain.embeddings.entities.embeddings import RetrievalFilters
 
 
 class GetRelevantDocumentsUseCase:
@@ -7,14 +10,15 @@ class GetRelevantDocumentsUseCase:
     def __init__(self, repository: ChatRepositoryInterface):
         self.repository = repository
 
-    async def execute(self, query: str) -> list:
+    async def execute(self, query: str, filters: Optional[RetrievalFilters] = None) -> list:
         """
         Ejecuta el caso de uso para obtener documentos relevantes.
 
         Args:
             query: La consulta del usuario
+            filters: Filtros por línea de servicio, cargo, base de conocimiento y publicación
 
         Returns:
             Lista de documentos relevantes
         """
-        return await self.repository.get_relevant_documents(query)
+        return await self.repository.get_relevant_documents(query, filters)
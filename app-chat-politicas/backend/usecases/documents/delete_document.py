@@ -1,7 +1,9 @@
 from domain.documents.interfaces.documents_repository import DocumentsRepositoryInterface
 from domain.documents.entities.documents import DocumentKnowledge, KnowledgeBase
-from domain.embeddings.entities.embeddings import DocumentEmbedding
+from domain.embeddings.entities.embeddings import ChunkTombstone, DocumentEmbedding
 from domain.documents.entities.responses import DeleteDocumentResponse
+from infrastructure.services.retrieval import lexical_index, vector_index
+from infrastructure.services.genai import semantic_answer_cache
 from fastapi import HTTPException
 
 
@@ -28,9 +30,7 @@ class DeleteDocumentUseCase:
         # Buscamos el documento
         document = await DocumentKnowledge.find_one(DocumentKnowledge.uniqueProcessID == document_id)
 
-        kb = await KnowledgeBase.find_one(
-            KnowledgeBase.knowledgeId == document.knowledgeBase.knowledgeId and KnowledgeBase.author == current_user_email
-        )
+        kb = await KnowledgeBase.find_one(KnowledgeBase.knowledgeId == document.knowledgeBase.knowledgeId, KnowledgeBase.author == current_user_email)
 
         if document is None:
             raise HTTPException(status_code=404, detail="Documento no encontrado.")
@@ -40,6 +40,13 @@ class DeleteDocumentUseCase:
 
         # Eliminamos las incrustaciones del documento
         await DocumentEmbedding.find(DocumentEmbedding.documentUniqueProcessID == document_id).delete()
+        # Las demás réplicas quitan los chunks de sus índices en la próxima sincronización
+        await ChunkTombstone(documentUniqueProcessIDs=[document_id]).insert()
+        vector_index.remove_document(document_id)
+        lexical_index.remove_document(document_id)
+
+        # Invalidamos las respuestas en caché que citan el documento
+        await semantic_answer_cache.invalidate_documents([str(document.id)])
 
         # Eliminamos el documento
         await document.delete()
@@ -1,6 +1,5 @@
-from typing import List, Dict, Any
+import asyncio
 from domain.documents.interfaces.documents_repository import DocumentsRepositoryInterface
-from domain.documents.entities.documents import DocumentKnowledge
 from domain.documents.entities.responses import DocumentsByUserResponse
 
 
@@ -20,12 +19,14 @@ class GetDocumentsByUserUseCase:
         Returns:
             Respuesta con los documentos y estadísticas
         """
-        # Obtener los documentos del usuario
-        documents = await self.repository.get_documents_by_user(user_email)
+        # Las bases de conocimiento del usuario se consultan una sola vez para el listado y las estadísticas
+        knowledge_ids = await self.repository.get_knowledge_ids_by_user(user_email)
 
-        # Calcular estadísticas
-        all_published = len([doc for doc in documents if doc.isPublished])
-        all_pending = len([doc for doc in documents if doc.isPublished is False])
+        # Obtener los documentos del usuario y las estadísticas, calculadas en Mongo
+        documents, totals = await asyncio.gather(
+            self.repository.get_documents_by_knowledge_ids(knowledge_ids),
+            self.repository.count_documents_by_knowledge_ids(knowledge_ids),
+        )
 
         # Crear respuesta
-        return DocumentsByUserResponse(documents=documents, totalDocuments=len(documents), totalPublished=all_published, totalPending=all_pending)
+        return DocumentsByUserResponse(documents=documents, **totals)
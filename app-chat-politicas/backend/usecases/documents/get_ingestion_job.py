@@ -0,0 +1,25 @@
+from domain.ingestion.entities.ingestion_job import IngestionJob, IngestionJobView
+from fastapi import HTTPException
+
+
+class GetIngestionJobUseCase:
+    """Caso de uso para consultar el estado de un trabajo de ingesta"""
+
+    async def execute(self, job_id: str, current_user_email: str) -> IngestionJobView:
+        """
+        Ejecuta el caso de uso para consultar un trabajo de ingesta
+
+        Args:
+            job_id: Id del trabajo
+            current_user_email: Email del usuario actual
+
+        Returns:
+            Estado del trabajo y cantidad de chunks procesados
+
+        Raises:
+            HTTPException: Si el trabajo no existe o no pertenece al usuario
+        """
+        job = await IngestionJob.find_one(IngestionJob.jobId == job_id, IngestionJob.author == current_user_email).project(IngestionJobView)
+        if not job:
+            raise HTTPException(status_code=404, detail="El trabajo de ingesta no existe")
+        return job
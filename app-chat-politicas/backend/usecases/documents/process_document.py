@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+from domain.documents.interfaces.documents_repository import DocumentsRepositoryInterface
+from domain.documents.entities.documents import DocumentKnowledge
+from domain.ingestion.entities.ingestion_job import IngestionEvent, IngestionEventType
+from service.genai_shared.embeddings import update_embeddings_with_metadata
+from infrastructure.services.genai import generate_summary_and_metadata
+
+
+class ProcessDocumentUseCase:
+    """
+    Caso de uso que procesa en segundo plano un documento subido: resumen, metadatos y embeddings.
+    El resumen no influye en los embeddings, por lo que ambas etapas se ejecutan en paralelo.
+    """
+
+    def __init__(self, repository: DocumentsRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, document_unique_process_id: str, on_event: Optional[Callable[[IngestionEvent], Awaitable[None]]] = None):
+        """
+        Ejecuta el caso de uso para procesar un documento. Es seguro reintentarlo: el resumen solo se genera
+        si falta y los chunks que ya tienen embedding se reutilizan. El documento se guarda con el resumen
+        cuando ambas etapas terminan; si una falla se cancela la otra.
+
+        Args:
+            document_unique_process_id: uniqueProcessID del documento
+            on_event: Función que recibe los eventos de avance: inicio de cada etapa y chunks procesados
+
+        Raises:
+            ValueError: Si el documento no existe
+        """
+        document = await DocumentKnowledge.find_one(DocumentKnowledge.uniqueProcessID == document_unique_process_id)
+        if not document:
+            raise ValueError(f"El documento {document_unique_process_id} no existe")
+
+        async def emit(event: IngestionEvent):
+            if on_event:
+                await on_event(event)
+
+        async def report_progress(chunks: int, tokens: int):
+            await emit(IngestionEvent(type=IngestionEventType.PROGRESS, stage="embedding", chunksProcessed=chunks, tokensUsed=tokens))
+
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        async def summarize():
+            stage_start = time.perf_counter()
+            await emit(IngestionEvent(type=IngestionEventType.STAGE, stage="summary"))
+            result = await generate_summary_and_metadata(document)
+            timings["summary"] = time.perf_counter() - stage_start
+            return result
+
+        async def embed():
+            stage_start = time.perf_counter()
+            await emit(IngestionEvent(type=IngestionEventType.STAGE, stage="embedding"))
+            await update_embeddings_with_metadata(document, document.content, report_progress)
+            timings["embedding"] = time.perf_counter() - stage_start
+
+        # Generamos el resumen y los metadatos (si faltan) en paralelo con los embeddings
+        summary_task = None
+        try:
+            async with asyncio.TaskGroup() as group:
+                if document.summary is None:
+                    summary_task = group.create_task(summarize())
+                group.create_task(embed())
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        if summary_task is not None:
+            document.summary, document.metaData = summary_task.result()
+            await document.save_changes()
+
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        print(f"Documento {document.documentName} procesado en {time.perf_counter() - start:.2f}s ({stages})")
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import AsyncGenerator
+from domain.ingestion.entities.ingestion_job import IngestionEvent, IngestionEventType, IngestionJob, IngestionJobStatus, IngestionJobView
+from domain.ingestion.interfaces.event_bus import IngestionEventBusInterface, IngestionSubscriptionInterface
+from constants import settings
+from fastapi import HTTPException
+
+
+class StreamIngestionEventsUseCase:
+    """Caso de uso que transmite por SSE el avance del último trabajo de ingesta de un documento"""
+
+    def __init__(self, events: IngestionEventBusInterface):
+        self.events = events
+
+    async def execute(self, document_id: str, current_user_email: str) -> AsyncGenerator[str, None]:
+        """
+        Ejecuta el caso de uso para seguir la ingesta de un documento. La validación se hace antes de
+        iniciar la transmisión, para poder responder 404 en lugar de un stream vacío.
+
+        Args:
+            document_id: uniqueProcessID del documento
+            current_user_email: Email del usuario actual
+
+        Returns:
+            Generador con los eventos en el formato SSE del chat, terminado en `data: [DONE]`
+
+        Raises:
+            HTTPException: Si el documento no tiene trabajos de ingesta del usuario
+        """
+        if await self._latest_job(document_id, current_user_email) is None:
+            raise HTTPException(status_code=404, detail="El documento no tiene trabajos de ingesta")
+
+        # Nos suscribimos antes de leer el estado para no perder eventos publicados entre ambas operaciones
+        subscription = await self.events.subscribe(document_id)
+        return self._stream(document_id, current_user_email, subscription)
+
+    async def _stream(self, document_id: str, current_user_email: str, subscription: IngestionSubscriptionInterface) -> AsyncGenerator[str, None]:
+        try:
+            job = await self._latest_job(document_id, current_user_email)
+            yield self._format(self._status_event(job))
+
+            while job.status not in (IngestionJobStatus.DONE, IngestionJobStatus.FAILED):
+                event = await subscription.get(settings.INGESTION_EVENTS_HEARTBEAT)
+                if event is not None:
+                    if event.jobId != job.jobId:
+                        # Un trabajo más nuevo del mismo documento reemplaza al que seguíamos
+                        job = await self._latest_job(document_id, current_user_email)
+                    yield self._format(event)
+                    if event.is_final() and event.jobId == job.jobId:
+                        break
+                    continue
+
+                # Sin eventos en el intervalo: el estado en Mongo sirve de latido y cubre eventos perdidos
+                # (pub/sub no los guarda) o un trabajo procesado por una réplica que se reinició
+                job = await self._latest_job(document_id, current_user_email)
+                yield self._format(self._status_event(job))
+        except Exception as e:
+            print(f"Error al transmitir los eventos de ingesta de {document_id}: {str(e)}")
+        finally:
+            await subscription.close()
+
+        yield "data: [DONE]\n"
+
+    @staticmethod
+    async def _latest_job(document_id: str, current_user_email: str) -> IngestionJobView | None:
+        return (
+            await IngestionJob.find(IngestionJob.documentUniqueProcessID == document_id, IngestionJob.author == current_user_email)
+            .sort(-IngestionJob.createdAt)
+            .project(IngestionJobView)
+            .first_or_none()
+        )
+
+    @staticmethod
+    def _status_event(job: IngestionJobView) -> IngestionEvent:
+        """Evento con el estado guardado del trabajo"""
+        event_type = {IngestionJobStatus.DONE: IngestionEventType.DONE, IngestionJobStatus.FAILED: IngestionEventType.FAILED}
+        end = job.finishedAt if job.status in event_type else None
+        elapsed = ((end or datetime.now()) - job.startedAt).total_seconds() if job.startedAt else 0.0
+        return IngestionEvent(
+            type=event_type.get(job.status, IngestionEventType.STATUS),
+            jobId=job.jobId,
+            status=job.status,
+            stage=job.stage,
+            chunksProcessed=job.chunksProcessed,
+            tokensUsed=job.tokensUsed,
+            elapsedSeconds=round(elapsed, 2),
+            message=job.error,
+        )
+
+    @staticmethod
+    def _format(event: IngestionEvent) -> str:
+        return f"data: e: {event.model_dump_json()} [END_MESSAGE]\n"
@@ -1,16 +1,67 @@
-import json
+import asyncio
+import time
 from datetime import datetime
+from enum import Flag, auto
+from typing import Any, Dict
+from fastapi.encoders import jsonable_encoder
 from domain.documents.interfaces.documents_repository import DocumentsRepositoryInterface
 from domain.documents.entities.body import DocumentUpdate
 from domain.documents.entities.documents import DocumentKnowledge, DocumentStatus, DocumentStatusItem, KnowledgeBase
-from domain.embeddings.entities.embeddings import DocumentEmbedding
-from constants import settings, openai_client
-from service.genai_shared.embeddings import generate_embeddings_with_metadata
+from service.genai_shared.embeddings import update_chunk_attributes
+from infrastructure.services.retrieval import vector_index
+from infrastructure.services.genai import generate_summary_and_metadata, semantic_answer_cache
 from fastapi import HTTPException
 
 
+# Campos copiados en cada chunk del documento
+CHUNK_FIELDS = {"documentName", "los", "profiles"}
+# Campos que forman parte de las entradas del resumen y los metadatos generados por el modelo
+SUMMARY_FIELDS = {"labels"}
+
+
+class UpdateScope(Flag):
+    """Etapas del procesamiento afectadas por una actualización de documento"""
+
+    NONE = 0
+    # Campos que solo viven en el documento: responsables, jornada, contrato, publicación, etc.
+    METADATA = auto()
+    # Campos copiados en los chunks: nombre del documento y atributos filtrables (líneas de servicio y perfiles)
+    FILTERS = auto()
+    # Entradas del resumen generado por el modelo
+    CONTENT = auto()
+
+
+def classify_update(document: DocumentKnowledge, update_fields: Dict[str, Any]) -> UpdateScope:
+    """
+    Compara los valores nuevos con los guardados y clasifica la actualización. El contenido del documento
+    no se puede modificar al actualizar, por lo que sus embeddings nunca necesitan regenerarse.
+
+    Args:
+        document: Documento guardado, antes de aplicar los cambios
+        update_fields: Valores nuevos por campo
+
+    Returns:
+        Combinación de las etapas afectadas (NONE si nada cambió)
+    """
+    scope = UpdateScope.NONE
+    for field, value in update_fields.items():
+        if jsonable_encoder(getattr(document, field)) == jsonable_encoder(value):
+            continue
+        if field in SUMMARY_FIELDS:
+            scope |= UpdateScope.CONTENT
+        elif field in CHUNK_FIELDS:
+            scope |= UpdateScope.FILTERS
+        else:
+            scope |= UpdateScope.METADATA
+    return scope
+
+
 class UpdateDocumentUseCase:
-    """Caso de uso para actualizar un documento"""
+    """
+    Caso de uso para actualizar un documento. Solo se ejecutan las etapas que la actualización afecta:
+    el resumen se regenera si cambian las etiquetas y los chunks se actualizan en el lugar si cambian
+    los campos que guardan.
+    """
 
     def __init__(self, repository: DocumentsRepositoryInterface):
         self.repository = repository
@@ -29,8 +80,6 @@ class UpdateDocumentUseCase:
         Raises:
             HTTPException: Si el documento no existe o el usuario no tiene permisos
         """
-        TODAY = datetime.now()
-
         # Intentamos encontrar el documento utilizando el uniqueProcessID proporcionado
         document = await DocumentKnowledge.find_one(DocumentKnowledge.uniqueProcessID == document_update.uniqueProcessID)
 
@@ -40,12 +89,27 @@ class UpdateDocumentUseCase:
 
         # Verificamos que el usuario sea el autor del documento o esté en la lista de usuarios permitidos de la base de conocimientos
         knowledge_base = await KnowledgeBase.find_one(
-            KnowledgeBase.knowledgeId == document.knowledgeBase.knowledgeId and KnowledgeBase.author == current_user_email
+            KnowledgeBase.knowledgeId == document.knowledgeBase.knowledgeId, KnowledgeBase.author == current_user_email
         )
 
         if not knowledge_base:
             raise HTTPException(status_code=404, detail="Base de conocimiento no encontrada")
 
+        return await self.apply(document, document_update)
+
+    async def apply(self, document: DocumentKnowledge, document_update: DocumentUpdate) -> DocumentKnowledge:
+        """
+        Aplica la actualización a un documento ya cargado y validado
+
+        Args:
+            document: Documento guardado
+            document_update: Datos de actualización del documento
+
+        Returns:
+            Documento actualizado
+        """
+        TODAY = datetime.now()
+
         # Actualizamos los campos del documento con los nuevos valores
         update_fields = {
             "documentName": document_update.documentName,
@@ -59,9 +123,16 @@ class UpdateDocumentUseCase:
             "tagsByAuthor": document_update.tagsByAuthor,
             "typeOfWorkday": document_update.typeOfWorkday,
             "contractType": document_update.contractType,
-            "lastUpdate": TODAY,
         }
 
+        scope = classify_update(document, update_fields)
+        if document_update.publish:
+            scope |= UpdateScope.METADATA
+        if scope == UpdateScope.NONE:
+            return document
+
+        update_fields["lastUpdate"] = TODAY
+
         # Aplicamos las actualizaciones a los campos del documento
         for field, value in update_fields.items():
             setattr(document, field, value)
@@ -80,66 +151,41 @@ class UpdateDocumentUseCase:
 
         # Guardamos los cambios en el documento
         await document.save_changes()
-
-        # Generamos nuevos resumen y metadatos
-        summary, meta_data = await self._get_summary_and_metadata(document)
-
-        document.metaData = meta_data
-        document.summary = summary
-        await document.save_changes()
-
-        # Eliminamos los embeddings anteriores del documento
-        await DocumentEmbedding.find(DocumentEmbedding.documentUniqueProcessID == document.uniqueProcessID).delete()
-
-        # Generamos nuevos embeddings para el documento
-        await generate_embeddings_with_metadata(document, document.content)
+        vector_index.set_document_published(document.uniqueProcessID, document.isPublished)
+
+        # Las etapas afectadas se ejecutan en paralelo
+        start = time.perf_counter()
+        summary_task = chunks_task = None
+        try:
+            async with asyncio.TaskGroup() as group:
+                if UpdateScope.CONTENT in scope:
+                    summary_task = group.create_task(self._timed(generate_summary_and_metadata(document)))
+                if UpdateScope.FILTERS in scope:
+                    # Los embeddings no dependen de estos campos: se actualizan en el lugar
+                    chunks_task = group.create_task(self._timed(update_chunk_attributes(document)))
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        stages = []
+        if summary_task is not None:
+            (summary, meta_data), seconds = summary_task.result()
+            stages.append(f"summary {seconds:.2f}s")
+            document.metaData = meta_data
+            document.summary = summary
+            await document.save_changes()
+        if chunks_task is not None:
+            chunks, seconds = chunks_task.result()
+            stages.append(f"{chunks} chunks {seconds:.2f}s")
+        print(f"Documento {document.documentName} actualizado ({scope}) en {time.perf_counter() - start:.2f}s ({', '.join(stages)})")
+
+        # Invalidamos las respuestas en caché que citan el documento
+        await semantic_answer_cache.invalidate_documents([str(document.id)])
 
         return document
 
-    async def _get_summary_and_metadata(self, document: DocumentKnowledge):
-        """
-        Genera un resumen y metadatos para el documento
-
-        Args:
-            document: Documento para el cual generar el resumen y metadatos
-
-        Returns:
-            Tupla con el resumen y los metadatos
-        """
-        response = await openai_client.chat.completions.create(
-            model="azure.gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """
-                    ### Instrucciones
-                    Eres un asistente IA, tu único objetivo es siempre resumir el contenido en español de manera profesional, de manera breve en menos de 200 palabras. Además deberás por cada atributo en el listado de 'labels' buscar dentro del contenido lo solicitado en modo de búsqueda, por ejemplo: Si existe un tag con el valor 'Persona', deberás buscar todas las personas mencionadas en el documento. 
-                    
-                    ### Formato de respuesta
-                    1. Devolver un JSON con dos atributos
-                        1.1 atributo 'summary' todo en español con un máximo de 200 palabras
-                        1.2 atributo 'meta_data' que sera un Array de objetos que tengan la siguiente estructura:
-                            1.2.1 la key del diccionario debe ser el nombre del label según corresponda, por ejemplo si el label se llama "personas" el key se debe llamar igual.
-                            1.2.2 el value debe ser todas las coincidencias encontradas según la instrucción, en el caso de NO encontrar coincidencias dejar el valor 'Sin Información'
-                            1.2.3 la key del diccionario debe estar en lowercase y los espacios en blanco se reemplazan por _
-                        1.3 Devulve el string JSON válido para puedo realizar un parse, por lo cual no añadas triple comillas.
-                    """,
-                },
-                {
-                    "role": "user",
-                    "content": f"""
-                    ### Contenido a resumir: 
-                    {document.content[0:600]}
-
-                    ### Labels
-                    {", ".join(map(lambda label: label.label, document.labels))}
-                    """,
-                },
-            ],
-            **settings.DEFAULT_MODEL_ARGS,
-        )
-        response_parsed = json.loads(response.choices[0].message.content)
-        summary = response_parsed["summary"]
-        meta_data = response_parsed["meta_data"]
-
-        return summary, meta_data
+    @staticmethod
+    async def _timed(awaitable):
+        """Espera el resultado y retorna una tupla con el resultado y los segundos que tardó"""
+        start = time.perf_counter()
+        result = await awaitable
+        return result, time.perf_counter() - start
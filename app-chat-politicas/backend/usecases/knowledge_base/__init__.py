@@ -6,3 +6,4 @@ from .get_all_knowledge_base import GetAllKnowledgeBaseUseCase
 from .create_knowledge_base import CreateKnowledgeBaseUseCase
 from .delete_knowledge_base import DeleteKnowledgeBaseUseCase
 from .massive_knowledge_configuration import MassiveKnowledgeConfigurationUseCase
+from .get_configuration_job import GetConfigurationJobUseCase
@@ -1,11 +1,25 @@
+import asyncio
+import time
+from typing import List, Set
 from domain.knowledge_base.interfaces.knowledge_base_repository import KnowledgeBaseRepositoryInterface
-from domain.documents.entities.documents import KnowledgeBase, DocumentKnowledge
-from domain.embeddings.entities.embeddings import DocumentEmbedding
+from domain.documents.entities.documents import KnowledgeBase, DocumentKnowledge, DocumentStorageView
+from domain.embeddings.entities.embeddings import ChunkTombstone, DocumentEmbedding
+from infrastructure.services.retrieval import lexical_index, vector_index
+from infrastructure.services.genai import semantic_answer_cache
+from infrastructure.services.storage import storage_backend
+from constants import settings
 from fastapi import HTTPException
 
+# Eliminaciones que se están ejecutando en segundo plano en este proceso
+_running_deletes: Set[asyncio.Task] = set()
+
 
 class DeleteKnowledgeBaseUseCase:
-    """Caso de uso para eliminar una base de conocimiento"""
+    """
+    Caso de uso para eliminar una base de conocimiento junto a sus documentos, chunks y archivos.
+    Los chunks y los documentos se eliminan con un delete_many cada uno y los archivos en paralelo;
+    las bases grandes se eliminan en segundo plano.
+    """
 
     def __init__(self, repository: KnowledgeBaseRepositoryInterface):
         self.repository = repository
@@ -19,7 +33,8 @@ class DeleteKnowledgeBaseUseCase:
             current_user_email: Email del usuario actual
 
         Returns:
-            Base de conocimiento eliminada
+            Base de conocimiento eliminada. Si tiene más de KNOWLEDGE_BASE_DELETE_BACKGROUND_THRESHOLD documentos,
+            se retorna de inmediato y la eliminación termina en segundo plano
 
         Raises:
             HTTPException: Si la base de conocimiento no existe o el usuario no tiene permisos
@@ -33,17 +48,64 @@ class DeleteKnowledgeBaseUseCase:
         if kb.author != current_user_email:
             raise HTTPException(status_code=403, detail="No tienes permisos para eliminar esta base de conocimiento")
 
-        # Buscar todos los documentos asociados a esta base de conocimientos
-        docs = await DocumentKnowledge.find(DocumentKnowledge.knowledgeBase.knowledgeId == knowledge_id).to_list()
+        # Solo se leen los campos necesarios para eliminar en cascada, sin el contenido de los documentos
+        documents = await DocumentKnowledge.find(DocumentKnowledge.knowledgeBase.knowledgeId == knowledge_id).project(DocumentStorageView).to_list()
+
+        if len(documents) > settings.KNOWLEDGE_BASE_DELETE_BACKGROUND_THRESHOLD:
+            task = asyncio.create_task(self._delete_in_background(kb, documents))
+            _running_deletes.add(task)
+            task.add_done_callback(_running_deletes.discard)
+            return kb
+
+        await self._cascade(kb, documents)
+        return kb
+
+    async def _delete_in_background(self, kb: KnowledgeBase, documents: List[DocumentStorageView]):
+        try:
+            await self._cascade(kb, documents)
+        except Exception as e:
+            # La base de conocimiento se elimina al final: si algo falla sigue existiendo y se puede volver a eliminar
+            print(f"Error al eliminar la base de conocimiento {kb.knowledgeId}: {str(e)}")
+
+    async def _cascade(self, kb: KnowledgeBase, documents: List[DocumentStorageView]):
+        """
+        Elimina chunks, documentos y archivos de la base de conocimiento, y por último la base.
+        Cada paso se puede repetir sin efectos, por lo que una eliminación interrumpida se puede reintentar.
+        """
+        start = time.perf_counter()
+        document_ids = [document.uniqueProcessID for document in documents]
+        blob_names = [document.documentUniqueName for document in documents if document.documentUniqueName]
+
+        # Los archivos se eliminan en paralelo con los registros de Mongo
+        blobs_task = asyncio.create_task(storage_backend.delete(blob_names))
 
-        # Eliminar todos los documentos asociados
-        for doc in docs:
-            # Eliminar los embeddings de cada documento
-            await DocumentEmbedding.find(DocumentEmbedding.document_id == doc.uniqueProcessID).delete()
-            # Eliminar el documento
-            await doc.delete()
+        try:
+            # Chunks de la base; se incluyen también por documento los que pudieran tener otra base registrada
+            chunks = await DocumentEmbedding.get_motor_collection().delete_many(
+                {"$or": [{"knowledgeBaseId": kb.id}, {"documentUniqueProcessID": {"$in": document_ids}}]}
+            )
+            # Las demás réplicas quitan los chunks de sus índices en la próxima sincronización
+            await ChunkTombstone(documentUniqueProcessIDs=document_ids).insert()
+            for document_id in document_ids:
+                vector_index.remove_document(document_id)
+                lexical_index.remove_document(document_id)
+
+            # Invalidar las respuestas en caché que citan los documentos eliminados
+            await semantic_answer_cache.invalidate_documents([str(document.id) for document in documents])
+
+            await DocumentKnowledge.get_motor_collection().delete_many({"knowledgeBase.knowledgeId": kb.knowledgeId})
+        finally:
+            try:
+                blobs = await blobs_task
+            except Exception as e:
+                # Un archivo huérfano no debe impedir eliminar la base de conocimiento
+                print(f"Error al eliminar los archivos de la base de conocimiento {kb.knowledgeId}: {str(e)}")
+                blobs = 0
 
         # Eliminar la base de conocimientos
         await kb.delete()
 
-        return kb
+        print(
+            f"Base de conocimiento {kb.knowledgeId} eliminada en {time.perf_counter() - start:.2f}s: "
+            f"{len(document_ids)} documentos, {chunks.deleted_count} chunks, {blobs} archivos"
+        )
@@ -0,0 +1,27 @@
+from domain.knowledge_base.entities.configuration_job import ConfigurationJob, ConfigurationJobView
+from fastapi import HTTPException
+
+
+class GetConfigurationJobUseCase:
+    """Caso de uso para consultar el avance de una configuración masiva"""
+
+    async def execute(self, job_id: str, current_user_email: str) -> ConfigurationJobView:
+        """
+        Ejecuta el caso de uso para consultar una configuración masiva
+
+        Args:
+            job_id: Id del trabajo
+            current_user_email: Email del usuario actual
+
+        Returns:
+            Estado del trabajo y resultado de cada documento
+
+        Raises:
+            HTTPException: Si el trabajo no existe o no pertenece al usuario
+        """
+        job = await ConfigurationJob.find_one(ConfigurationJob.jobId == job_id, ConfigurationJob.author == current_user_email).project(
+            ConfigurationJobView
+        )
+        if not job:
+            raise HTTPException(status_code=404, detail="La configuración masiva no existe")
+        return job
@@ -1,20 +1,39 @@
-import json
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Set
+from beanie import UpdateResponse
+from beanie.operators import And, In, Or, Set as SetFields
 from domain.knowledge_base.interfaces.knowledge_base_repository import KnowledgeBaseRepositoryInterface
+from domain.knowledge_base.entities.configuration_job import (
+    ConfigurationJob,
+    DocumentConfigurationResult,
+    DocumentConfigurationStatus,
+)
 from domain.documents.entities.documents import KnowledgeBase, DocumentKnowledge
 from domain.documents.entities.body import KnowledgeMassiveConfiguration, DocumentUpdate
-from domain.documents.entities.responses import MassiveConfResponse
-from fastapi import HTTPException, Depends
+from domain.documents.entities.responses import MassiveConfigurationJobResponse
+from domain.ingestion.entities.ingestion_job import IngestionJobStatus
+from constants import settings
+from fastapi import HTTPException
 from usecases.documents.update_document import UpdateDocumentUseCase
 
+# Trabajos que se están ejecutando en este proceso
+_running_jobs: Set[asyncio.Task] = set()
+
 
 class MassiveKnowledgeConfigurationUseCase:
-    """Caso de uso para configuración masiva de conocimiento"""
+    """
+    Caso de uso para configuración masiva de conocimiento. La configuración se aplica en segundo plano
+    como un trabajo guardado en Mongo: los documentos se leen con una sola consulta, se actualizan con
+    concurrencia acotada y el resultado de cada uno se guarda apenas termina, para retomar el trabajo
+    si la réplica se reinicia. Un trabajo interrumpido al detener la API vuelve a quedar pendiente.
+    """
 
     def __init__(self, repository: KnowledgeBaseRepositoryInterface, update_document_usecase: UpdateDocumentUseCase):
         self.repository = repository
         self.update_document_usecase = update_document_usecase
 
-    async def execute(self, knowledge_conf: KnowledgeMassiveConfiguration, current_user_email: str) -> MassiveConfResponse:
+    async def execute(self, knowledge_conf: KnowledgeMassiveConfiguration, current_user_email: str) -> MassiveConfigurationJobResponse:
         """
         Ejecuta el caso de uso para configuración masiva de conocimiento
 
@@ -23,38 +42,207 @@ class MassiveKnowledgeConfigurationUseCase:
             current_user_email: Email del usuario actual
 
         Returns:
-            Respuesta de la configuración masiva
+            Id y estado del trabajo que aplica la configuración
 
         Raises:
             HTTPException: Si la base de conocimiento no existe o el usuario no tiene permisos
         """
         # Verificar que el usuario sea el autor de la base de conocimientos
-        kb = await KnowledgeBase.find_one(KnowledgeBase.knowledgeId == knowledge_conf.knowledgeId and KnowledgeBase.author == current_user_email)
+        kb = await KnowledgeBase.find_one(KnowledgeBase.knowledgeId == knowledge_conf.knowledgeId, KnowledgeBase.author == current_user_email)
         if not kb:
             raise HTTPException(status_code=404, detail="Base de conocimiento no encontrada")
 
-        # Actualizar cada documento en la configuración masiva
-        for document_id_selected_from_app in knowledge_conf.allDocumentsIds:
-            document = await DocumentKnowledge.find_one(DocumentKnowledge.uniqueProcessID == document_id_selected_from_app)
+        document_ids = list(dict.fromkeys(knowledge_conf.allDocumentsIds))
+        job = ConfigurationJob(
+            knowledgeId=knowledge_conf.knowledgeId,
+            author=current_user_email,
+            configuration=knowledge_conf,
+            results={document_id: DocumentConfigurationResult(uniqueProcessID=document_id) for document_id in document_ids},
+        )
+        await job.insert()
+        self.start(job.jobId)
+
+        return MassiveConfigurationJobResponse(
+            detail="La configuración se está aplicando en segundo plano",
+            jobId=job.jobId,
+            status=job.status,
+            totalDocuments=len(document_ids),
+        )
+
+    def start(self, job_id: str):
+        """
+        Ejecuta el trabajo en segundo plano en este proceso.
+
+        Args:
+            job_id: Id del trabajo
+        """
+        task = asyncio.create_task(self.run(job_id))
+        _running_jobs.add(task)
+        task.add_done_callback(_running_jobs.discard)
+
+    async def resume(self):
+        """
+        Retoma los trabajos pendientes y los que quedaron en curso sin avances por más de INGESTION_STALE_AFTER
+        (por ejemplo, porque la réplica que los procesaba se reinició).
+        """
+        stale = datetime.now() - timedelta(seconds=settings.INGESTION_STALE_AFTER)
+        collection = ConfigurationJob.get_motor_collection()
+        query = {
+            "$or": [
+                {"status": IngestionJobStatus.QUEUED.value},
+                {"status": IngestionJobStatus.RUNNING.value, "updatedAt": {"$lt": stale}},
+            ]
+        }
+        async for item in collection.find(query, {"jobId": 1}):
+            self.start(item["jobId"])
+
+    def start_recovery(self, interval: int):
+        """
+        Revisa periódicamente los trabajos pendientes o abandonados, para retomar los que interrumpió el
+        reinicio de otra réplica. Se detiene junto con los trabajos en `stop`.
+
+        Args:
+            interval: Segundos entre revisiones
+        """
+
+        async def recover():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.resume()
+                except Exception as e:
+                    print(f"Error al retomar las configuraciones masivas pendientes: {str(e)}")
+
+        task = asyncio.create_task(recover())
+        _running_jobs.add(task)
+        task.add_done_callback(_running_jobs.discard)
+
+    @staticmethod
+    async def stop():
+        """Cancela los trabajos en curso de este proceso, que vuelven a quedar pendientes para retomarlos."""
+        tasks = list(_running_jobs)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, job_id: str):
+        """
+        Toma el trabajo y aplica la configuración a sus documentos pendientes.
+
+        Args:
+            job_id: Id del trabajo
+        """
+        now = datetime.now()
+        stale = now - timedelta(seconds=settings.INGESTION_STALE_AFTER)
+        job = await ConfigurationJob.find_one(
+            ConfigurationJob.jobId == job_id,
+            Or(
+                ConfigurationJob.status == IngestionJobStatus.QUEUED,
+                And(ConfigurationJob.status == IngestionJobStatus.RUNNING, ConfigurationJob.updatedAt < stale),
+            ),
+        ).update(
+            SetFields({ConfigurationJob.status: IngestionJobStatus.RUNNING, ConfigurationJob.updatedAt: now}),
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+        if job is None:
+            # Ya lo tomó otra réplica o ya terminó
+            return
+
+        try:
+            if job.startedAt is None:
+                await ConfigurationJob.find_one(ConfigurationJob.jobId == job_id).update(SetFields({ConfigurationJob.startedAt: now}))
+            await self._process(job)
+        except asyncio.CancelledError:
+            # La API se está deteniendo: el trabajo queda pendiente aunque la cancelación se repita
+            await asyncio.shield(self._release(job_id))
+            raise
+        except Exception as e:
+            print(f"Error en la configuración masiva {job_id}: {str(e)}")
+            await ConfigurationJob.find_one(ConfigurationJob.jobId == job_id).update(
+                SetFields(
+                    {ConfigurationJob.status: IngestionJobStatus.FAILED, ConfigurationJob.error: str(e), ConfigurationJob.finishedAt: datetime.now()}
+                )
+            )
+            return
+
+        await ConfigurationJob.find_one(ConfigurationJob.jobId == job_id).update(
+            SetFields({ConfigurationJob.status: IngestionJobStatus.DONE, ConfigurationJob.finishedAt: datetime.now()})
+        )
+
+    async def _process(self, job: ConfigurationJob):
+        """Actualiza los documentos pendientes con concurrencia acotada, guardando el resultado de cada uno"""
+        pending: List[str] = [document_id for document_id, result in job.results.items() if result.status == DocumentConfigurationStatus.PENDING]
+        if not pending:
+            return
+
+        documents = await DocumentKnowledge.find(
+            In(DocumentKnowledge.uniqueProcessID, pending), DocumentKnowledge.knowledgeBase.knowledgeId == job.knowledgeId
+        ).to_list()
+        documents_by_id = {document.uniqueProcessID: document for document in documents}
+        semaphore = asyncio.Semaphore(settings.MASSIVE_CONFIGURATION_CONCURRENCY)
+
+        async def configure(document_id: str):
+            async with semaphore:
+                document = documents_by_id.get(document_id)
+                if document is None:
+                    await self._checkpoint(job.jobId, document_id, "El documento no existe en la base de conocimiento")
+                    return
+
+                try:
+                    await self.update_document_usecase.apply(document, self._document_update(document, job.configuration))
+                except Exception as e:
+                    print(f"Error al configurar el documento {document_id} en la configuración masiva {job.jobId}: {str(e)}")
+                    await self._checkpoint(job.jobId, document_id, str(e))
+                    return
 
-            data_json = document.model_dump_json()
-            data = json.loads(data_json)
+                await self._checkpoint(job.jobId, document_id)
 
-            data_modified_from_massive_conf = {
-                **data,
-                "los": knowledge_conf.los,
-                "subLoS": knowledge_conf.subLoS,
-                "profile": knowledge_conf.profiles,
-                "losOwner": knowledge_conf.losOwner,
-                "supportPersons": knowledge_conf.support,
-                "modifiedBy": knowledge_conf.modifiedBy,
-                "typeOfWorkday": knowledge_conf.typeOfWorkday,
-                "contractType": knowledge_conf.contractType,
-                "publish": True,
-            }
+        await asyncio.gather(*(configure(document_id) for document_id in pending))
 
-            document_update_instance = DocumentUpdate(**data_modified_from_massive_conf)
+    @staticmethod
+    async def _release(job_id: str):
+        """Devuelve a pendiente un trabajo interrumpido; conserva los resultados ya guardados"""
+        try:
+            await ConfigurationJob.find_one(ConfigurationJob.jobId == job_id, ConfigurationJob.status == IngestionJobStatus.RUNNING).update(
+                SetFields({ConfigurationJob.status: IngestionJobStatus.QUEUED, ConfigurationJob.updatedAt: datetime.now()})
+            )
+        except Exception as e:
+            print(f"Error al devolver a pendiente la configuración masiva {job_id}: {str(e)}")
 
-            await self.update_document_usecase.execute(document_update_instance, current_user_email)
+    @staticmethod
+    def _document_update(document: DocumentKnowledge, knowledge_conf: KnowledgeMassiveConfiguration) -> DocumentUpdate:
+        """Combina los campos propios del documento con los de la configuración masiva"""
+        return DocumentUpdate(
+            uniqueProcessID=document.uniqueProcessID,
+            documentName=document.documentName,
+            summary=document.summary,
+            labels=document.labels,
+            tagsByAuthor=document.tagsByAuthor,
+            los=knowledge_conf.los,
+            subLoS=knowledge_conf.subLoS,
+            profile=knowledge_conf.profiles,
+            losOwner=knowledge_conf.losOwner,
+            supportPersons=knowledge_conf.support,
+            modifiedBy=knowledge_conf.modifiedBy,
+            typeOfWorkday=knowledge_conf.typeOfWorkday,
+            contractType=knowledge_conf.contractType,
+            publish=True,
+        )
 
-        return {"detail": {"success": True, "message": "Se ha configurado correctamente "}}
+    @staticmethod
+    async def _checkpoint(job_id: str, document_id: str, error: str | None = None):
+        """Guarda el resultado de un documento; con esto el trabajo se puede retomar desde el siguiente pendiente"""
+        now = datetime.now()
+        status = DocumentConfigurationStatus.FAILED if error else DocumentConfigurationStatus.DONE
+        await ConfigurationJob.get_motor_collection().update_one(
+            {"jobId": job_id},
+            {
+                "$set": {
+                    f"results.{document_id}.status": status.value,
+                    f"results.{document_id}.error": error,
+                    f"results.{document_id}.finishedAt": now,
+                    "updatedAt": now,
+                },
+                "$inc": {"failed" if error else "succeeded": 1},
+            },
+        )
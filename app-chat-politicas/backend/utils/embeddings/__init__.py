@@ -1,19 +1,8 @@
-def split_text(text, max_tokens=8192) -> list[str]:
-    words = text.split()
-    chunks = []
-    chunk = []
-    chunk_length = 0
+from utils.embeddings.chunker import iter_chunks
+from utils.embeddings.tokens import count_tokens, get_encoding
 
-    for word in words:
-        word_length = len(word) + 1  # Adding 1 for the space
-        if chunk_length + word_length > max_tokens:
-            chunks.append(" ".join(chunk))
-            chunk = []
-            chunk_length = 0
-        chunk.append(word)
-        chunk_length += word_length
-
-    if chunk:
-        chunks.append(" ".join(chunk))
-
-    return chunks
+__all__ = [
+    'count_tokens',
+    'get_encoding',
+    'iter_chunks',
+]
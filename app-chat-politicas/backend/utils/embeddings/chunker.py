@@ -0,0 +1,109 @@
+import re
+import zlib
+from typing import Iterator, List, Optional
+
+from constants import settings
+from utils.embeddings.tokens import count_tokens, tail_tokens, token_windows
+
+# Líneas que parecen títulos: markdown, numeración ("1.", "2.3)"), o palabras como "Capítulo" o "Artículo"
+HEADING_PATTERN = re.compile(r"^(#{1,6}\s|\d+(\.\d+)*[.)]?\s+\S|(cap[ií]tulo|art[ií]culo|secci[oó]n|t[ií]tulo|anexo)\b)", re.IGNORECASE)
+MAX_HEADING_LENGTH = 80
+
+
+def is_heading(line: str) -> bool:
+    """Indica si una línea del texto extraído parece un título"""
+    line = line.strip()
+    if not line or len(line) > MAX_HEADING_LENGTH or line.endswith((".", ",", ";")):
+        return False
+    return bool(HEADING_PATTERN.match(line)) or (line.isupper() and len(line) > 3)
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Recorre las líneas del texto sin crear la lista completa"""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        start = end + 1
+
+
+def iter_chunks(text: str, target_tokens: Optional[int] = None, overlap_tokens: Optional[int] = None) -> Iterator[str]:
+    """
+    Divide el texto en chunks de hasta `target_tokens` tokens a medida que se consumen.
+
+    Los chunks se cortan de preferencia antes de un título o en un salto de párrafo (línea en blanco), una vez
+    que superan la mitad del tamaño objetivo. En los saltos de párrafo solo se corta si el hash de la última
+    línea lo indica: así los cortes dependen del contenido cercano y editar una parte del documento no desplaza
+    los chunks siguientes. Cada chunk comienza con los últimos `overlap_tokens` tokens del anterior.
+
+    Args:
+        text: Texto extraído del documento
+        target_tokens: Tamaño máximo de un chunk (CHUNK_TARGET_TOKENS por defecto)
+        overlap_tokens: Tokens del chunk anterior que se repiten al inicio del siguiente (CHUNK_OVERLAP_TOKENS por defecto)
+
+    Returns:
+        Generador con el texto de cada chunk
+    """
+    target_tokens = target_tokens or settings.CHUNK_TARGET_TOKENS
+    overlap_tokens = min(overlap_tokens if overlap_tokens is not None else settings.CHUNK_OVERLAP_TOKENS, target_tokens // 4)
+    min_tokens = target_tokens // 2
+
+    lines: List[str] = []
+    tokens = 0
+    # Los chunks que solo contienen la superposición del anterior no se emiten
+    overlap = ""
+
+    def flush() -> Optional[str]:
+        nonlocal lines, tokens, overlap
+        chunk = "\n".join(lines).strip()
+        lines, tokens = [], 0
+        if not chunk or chunk == overlap:
+            return None
+
+        overlap = tail_tokens(chunk, overlap_tokens)
+        if overlap:
+            lines, tokens = [overlap], count_tokens(overlap)
+        return chunk
+
+    for line in iter_lines(text):
+        stripped = line.strip()
+
+        if not stripped:
+            # Salto de párrafo
+            if tokens >= min_tokens and lines and zlib.crc32(lines[-1].encode("utf-8")) % 2 == 0:
+                chunk = flush()
+                if chunk:
+                    yield chunk
+            continue
+
+        if tokens >= min_tokens and is_heading(stripped):
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+        line_tokens = count_tokens(stripped)
+        if line_tokens > target_tokens - overlap_tokens:
+            # Línea demasiado larga (por ejemplo, una tabla sin saltos): se divide por tokens
+            chunk = flush()
+            if chunk:
+                yield chunk
+            for window in token_windows(stripped, target_tokens - overlap_tokens):
+                lines.append(window)
+                chunk = flush()
+                if chunk:
+                    yield chunk
+            continue
+
+        if tokens + line_tokens > target_tokens:
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+        lines.append(stripped)
+        tokens += line_tokens
+
+    chunk = flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,125 @@
+import time
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+import tiktoken
+
+from constants import settings
+
+# Segundos entre intentos de cargar el tokenizador cuando falla la descarga del vocabulario
+ENCODING_RETRY_INTERVAL = 60
+
+_encoding: Optional[tiktoken.Encoding] = None
+_encoding_failed_at: Optional[float] = None
+
+
+def get_encoding() -> Optional[tiktoken.Encoding]:
+    """
+    Obtiene el tokenizador del modelo de embeddings. tiktoken descarga el vocabulario la primera vez, por lo
+    que conviene cargarlo al levantar la API en un hilo aparte. Si no está disponible se retorna None y los
+    tokens se estiman por largo del texto; la carga se reintenta cada ENCODING_RETRY_INTERVAL segundos.
+    """
+    global _encoding, _encoding_failed_at
+    if _encoding is not None:
+        return _encoding
+    if _encoding_failed_at is not None and time.monotonic() - _encoding_failed_at < ENCODING_RETRY_INTERVAL:
+        return None
+
+    try:
+        _encoding = tiktoken.get_encoding(settings.EMBEDDING_TOKENIZER_ENCODING)
+    except Exception as e:
+        _encoding_failed_at = time.monotonic()
+        print(f"Error al cargar el tokenizador {settings.EMBEDDING_TOKENIZER_ENCODING}, se estimarán los tokens: {str(e)}")
+        return None
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Cuenta los tokens de un texto para el modelo de embeddings.
+
+    Args:
+        text: Texto a medir
+
+    Returns:
+        Cantidad de tokens (estimada en 1 token cada 3 caracteres si el tokenizador no está disponible)
+    """
+    if get_encoding() is None:
+        return len(text) // 3 + 1
+    return _count_encoded_tokens(text)
+
+
+@lru_cache(maxsize=8192)
+def _count_encoded_tokens(text: str) -> int:
+    """
+    Cuenta los tokens con el tokenizador ya cargado. Se guarda en caché porque los encabezados y pies de página
+    de un PDF se repiten en cada página; las estimaciones no se guardan para no conservarlas tras cargar el tokenizador.
+    """
+    return len(get_encoding().encode(text, disallowed_special=()))
+
+
+def token_offsets(text: str) -> tuple[str, List[int]]:
+    """
+    Tokeniza un texto y obtiene la posición donde comienza cada token. Un token que empieza en medio de un
+    carácter de varios bytes (acentos, emojis) recibe la posición de ese carácter, por lo que cortar el texto
+    en cualquiera de estas posiciones nunca divide un carácter.
+
+    Args:
+        text: Texto a tokenizar
+
+    Returns:
+        Tupla con el texto decodificado y la posición de cada token (una lista vacía si el tokenizador no está disponible)
+    """
+    encoding = get_encoding()
+    if encoding is None:
+        return text, []
+    return encoding.decode_with_offsets(encoding.encode(text, disallowed_special=()))
+
+
+def token_windows(text: str, size: int) -> Iterator[str]:
+    """
+    Divide un texto en ventanas consecutivas de `size` tokens. Los cortes se hacen sobre el texto en posiciones
+    de carácter, así que un carácter dividido entre dos tokens queda completo en la ventana siguiente.
+
+    Args:
+        text: Texto a dividir
+        size: Tokens por ventana
+
+    Returns:
+        Generador con el texto de cada ventana
+    """
+    if get_encoding() is None:
+        for start in range(0, len(text), size * 3):
+            yield text[start : start + size * 3]
+        return
+
+    text, offsets = token_offsets(text)
+    bounds = offsets[::size] + [len(text)]
+    for start, end in zip(bounds, bounds[1:]):
+        if end > start:
+            yield text[start:end]
+
+
+def tail_tokens(text: str, size: int) -> str:
+    """
+    Obtiene los últimos `size` tokens de un texto, sin cortar la primera palabra.
+
+    Args:
+        text: Texto de origen
+        size: Tokens a conservar
+
+    Returns:
+        El final del texto
+    """
+    if size <= 0:
+        return ""
+
+    if get_encoding() is None:
+        tail = text[-size * 3 :]
+    else:
+        text, offsets = token_offsets(text)
+        tail = text[offsets[-size] if len(offsets) > size else 0 :]
+
+    if len(tail) < len(text) and " " in tail:
+        tail = tail.split(" ", 1)[1]
+    return tail.strip()